@@ -0,0 +1,76 @@
+"""
+Startup-time benchmark for the global application context.
+
+Measures, with the default settings:
+- importing metaagent.context in a fresh interpreter (minus interpreter start-up)
+- initialize_context() on the running loop
+- get_current_context() called from a coroutine, which initializes the context on a
+  new event loop in a helper thread because it cannot block the running one
+- aget_current_context(), which initializes it on the running loop
+
+Usage:
+    python examples/benchmarks/bench_context_startup.py [runs]
+"""
+
+import sys
+import os
+import statistics
+import subprocess
+import time
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+# Times one initialization in a fresh interpreter, so every sample is a real first start
+INIT = """
+import asyncio, time
+from metaagent import context
+
+async def main():
+    start = time.perf_counter()
+    result = context.{call}
+    if asyncio.iscoroutine(result):
+        await result
+    print('elapsed', time.perf_counter() - start)
+    await context.cleanup_context()
+
+asyncio.run(main())
+"""
+
+
+def run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True
+    )
+    return result.stdout
+
+
+def wall_time(code: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run(code)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def init_time(call: str, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        lines = run(INIT.format(call=call)).splitlines()
+        times.append(float(next(line for line in lines if line.startswith("elapsed")).split()[1]))
+    return statistics.median(times)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    baseline = wall_time("pass", runs)
+    imported = wall_time("import metaagent.context", runs)
+    print(f"{'import metaagent.context':>28}: {(imported - baseline) * 1e3:8.1f} ms")
+
+    for call in ["initialize_context()", "get_current_context()", "aget_current_context()"]:
+        elapsed = init_time(call, runs)
+        print(f"{call:>28}: {elapsed * 1e3:8.2f} ms (median of {runs})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Micro-benchmark for EventFilter matching with realistic filter sets.
+
+Each event is matched by several components sharing the same filter (the
+transport and the logging/batching listeners), as it is on the event bus.
+The "reference" rows use the previous, uncompiled matching logic.
+
+Usage:
+    python examples/benchmarks/bench_event_filter.py
+"""
+
+import sys
+import os
+import logging
+import random
+import timeit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from metaagent.logging.events import Event, EventFilter  # noqa: E402
+
+COMPONENTS_PER_EVENT = 3
+
+NAMESPACES = [
+    "metaagent.mcp.mcp_aggregator",
+    "metaagent.mcp.mcp_connection_manager",
+    "metaagent.mcp.mcp_agent_client_session",
+    "metaagent.executor.executor",
+    "metaagent.executor.temporal",
+    "metaagent.agents.agent",
+    "metaagent.llms.llmapi",
+    "metaagent.context",
+    "mcp_agent.mcp_application",
+    "httpx",
+]
+
+
+def reference_matches(event_filter: EventFilter, event: Event) -> bool:
+    """The previous EventFilter.matches implementation."""
+    if event_filter.types:
+        if event.type not in event_filter.types:
+            return False
+    if event_filter.names:
+        if not event.name or event.name not in event_filter.names:
+            return False
+    if event_filter.namespaces and not any(
+        event.namespace.startswith(ns) for ns in event_filter.namespaces
+    ):
+        return False
+    if event_filter.min_level:
+        level_map = {
+            "debug": logging.DEBUG,
+            "info": logging.INFO,
+            "warning": logging.WARNING,
+            "error": logging.ERROR,
+        }
+        min_val = level_map.get(event_filter.min_level, logging.DEBUG)
+        event_val = level_map.get(event.type, logging.DEBUG)
+        if event_val < min_val:
+            return False
+    return True
+
+
+def make_events(count: int = 1000):
+    rng = random.Random(0)
+    return [
+        Event(
+            type=rng.choice(["debug", "info", "info", "progress", "warning", "error"]),
+            name=rng.choice([None, "tool_call", "llm_request"]),
+            namespace=rng.choice(NAMESPACES),
+            message="benchmark event",
+        )
+        for _ in range(count)
+    ]
+
+
+def make_filters():
+    return {
+        "min_level only": EventFilter(min_level="info"),
+        "8 namespace prefixes": EventFilter(
+            min_level="debug",
+            namespaces={
+                "metaagent.mcp",
+                "metaagent.executor",
+                "metaagent.agents",
+                "metaagent.llms",
+                "metaagent.workflows",
+                "metaagent.memory",
+                "metaagent.tools",
+                "metaagent.reasoners",
+            },
+        ),
+        "types+names+namespaces": EventFilter(
+            types={"info", "warning", "error"},
+            names={"tool_call", "llm_request"},
+            namespaces={"metaagent.mcp", "metaagent.llms"},
+            min_level="info",
+        ),
+    }
+
+
+def main(number: int = 50):
+    events = make_events()
+    for label, event_filter in make_filters().items():
+        assert all(
+            event_filter.matches(event) == reference_matches(event_filter, event)
+            for event in events
+        )
+
+        def run_reference():
+            for event in events:
+                for _ in range(COMPONENTS_PER_EVENT):
+                    reference_matches(event_filter, event)
+
+        def run_compiled():
+            for event in events:
+                for _ in range(COMPONENTS_PER_EVENT):
+                    event_filter.matches(event)
+
+        per_event = number * len(events)
+        reference = timeit.timeit(run_reference, number=number) / per_event * 1e6
+        compiled = timeit.timeit(run_compiled, number=number) / per_event * 1e6
+        print(f"{label:<25} reference {reference:6.2f} us/event  compiled {compiled:6.2f} us/event")
+
+
+if __name__ == "__main__":
+    main()
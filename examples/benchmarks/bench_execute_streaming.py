@@ -0,0 +1,86 @@
+"""
+Benchmark for AsyncioExecutor.execute_streaming over many short tasks.
+
+Tasks are produced lazily by a generator. The windowed executor keeps at most
+`window` tasks in flight, so peak memory stays flat and time grows linearly
+with the number of tasks. The "reference" rows use the previous implementation
+(a Task per input up front, asyncio.wait over the whole pending set), which is
+quadratic and is only run for the smaller sizes.
+
+Usage:
+    python examples/benchmarks/bench_execute_streaming.py
+"""
+
+import sys
+import os
+import asyncio
+import functools
+import time
+import tracemalloc
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from metaagent.executor.executor import AsyncioExecutor  # noqa: E402
+
+SIZES = [10_000, 25_000, 50_000, 100_000]
+REFERENCE_SIZES = [10_000, 25_000]
+WINDOW = 256
+
+
+async def work(i: int) -> int:
+    await asyncio.sleep(0)
+    return i
+
+
+def make_tasks(count: int):
+    return (functools.partial(work, i) for i in range(count))
+
+
+async def reference_streaming(executor: AsyncioExecutor, tasks):
+    """The previous execute_streaming implementation."""
+    futures = [asyncio.create_task(executor._execute_task(task)) for task in tasks]
+    pending = set(futures)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            yield await future
+
+
+async def consume(stream) -> float:
+    start = time.perf_counter()
+    async for _ in stream:
+        pass
+    return time.perf_counter() - start
+
+
+async def peak_memory(stream) -> float:
+    """Peak traced memory in MiB (tracemalloc slows execution, so timing is a separate pass)."""
+    tracemalloc.start()
+    async for _ in stream:
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+async def main():
+    executor = AsyncioExecutor()
+
+    def windowed(size):
+        return executor.execute_streaming(make_tasks(size), max_concurrency=WINDOW)
+
+    def reference(size):
+        return reference_streaming(executor, make_tasks(size))
+
+    print(f"{'tasks':>8} {'impl':>10} {'total s':>8} {'us/task':>8} {'peak MiB':>9}")
+    for size in SIZES:
+        impls = [("windowed", windowed)]
+        if size in REFERENCE_SIZES:
+            impls.append(("reference", reference))
+        for label, stream in impls:
+            elapsed = await consume(stream(size))
+            peak = await peak_memory(stream(size))
+            print(f"{size:>8} {label:>10} {elapsed:>8.2f} {elapsed / size * 1e6:>8.1f} {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""
+Micro-benchmark for JSONSerializer over typical event payloads.
+
+Usage:
+    python examples/benchmarks/bench_json_serializer.py
+"""
+
+import sys
+import os
+import timeit
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from mcp.types import CallToolResult, TextContent  # noqa: E402
+
+from metaagent.logging.logger import get_logger  # noqa: F401, E402 (resolves logging import order)
+from metaagent.logging.events import Event, EventContext  # noqa: E402
+from metaagent.logging.json_serializer import JSONSerializer  # noqa: E402
+
+
+def make_payloads():
+    tool_result = CallToolResult(
+        content=[TextContent(type="text", text="result line " * 20) for _ in range(5)],
+        isError=False,
+    )
+    event = Event(
+        type="info",
+        name="tool_call",
+        namespace="metaagent.mcp.mcp_aggregator",
+        message="Requesting tool call",
+        context=EventContext(session_id="session-1", workflow_id="workflow-1"),
+        data={"data": {"progress_action": "Calling Tool", "server_name": "fetch"}},
+    )
+    native = {
+        "data": {
+            "progress_action": "Calling Tool",
+            "tool_name": "fetch",
+            "server_name": "fetch",
+            "agent_name": "researcher",
+            "arguments": {"url": "https://example.com", "max_length": 5000},
+            "api_key": "sk-0123456789abcdef",
+            "history": [{"role": "user", "content": "hello"} for _ in range(10)],
+        }
+    }
+    return {
+        "json-native dict": native,
+        "CallToolResult": {"data": {"result": tool_result}},
+        "Event": {"data": {"event": event}},
+    }
+
+
+def main(number: int = 20000):
+    serializer = JSONSerializer()
+    for label, payload in make_payloads().items():
+        seconds = timeit.timeit(lambda: serializer(payload), number=number)
+        print(f"{label:<20} {seconds / number * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
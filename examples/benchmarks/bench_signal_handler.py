@@ -0,0 +1,115 @@
+"""
+Benchmark for AsyncioSignalHandler with many concurrently waiting workflows.
+
+Scenarios, each with N workflows waiting for "human_input" at the same time:
+- targeted: every workflow is signalled individually by workflow_id
+- timeout: every waiter times out together
+The "reference" rows use the previous implementation, which keeps per-name
+lists (rebuilt on every removal) and wakes every waiter of a name on each signal,
+so it is only run for the timeout scenario.
+
+Usage:
+    python examples/benchmarks/bench_signal_handler.py
+"""
+
+import sys
+import os
+import asyncio
+import time
+import uuid
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from metaagent.executor.workflow_signal import (  # noqa: E402
+    AsyncioSignalHandler,
+    BaseSignalHandler,
+    PendingSignal,
+    Signal,
+    SignalRegistration,
+)
+
+WAITERS = [1_000, 10_000]
+
+
+class ReferenceSignalHandler(BaseSignalHandler):
+    """The previous AsyncioSignalHandler.wait_for_signal (timeouts only)."""
+
+    async def wait_for_signal(self, signal, timeout_seconds=None):
+        event = asyncio.Event()
+        unique_name = str(uuid.uuid4())
+        registration = SignalRegistration(
+            signal_name=signal.name, unique_name=unique_name, workflow_id=signal.workflow_id
+        )
+        pending_signal = PendingSignal(registration=registration, event=event)
+        async with self._lock:
+            self._pending_signals.setdefault(signal.name, []).append(pending_signal)
+        try:
+            if timeout_seconds is not None:
+                await asyncio.wait_for(event.wait(), timeout_seconds)
+            else:
+                await event.wait()
+            return pending_signal.value
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(f"Timeout waiting for signal {signal.name}") from e
+        finally:
+            async with self._lock:
+                if signal.name in self._pending_signals:
+                    self._pending_signals[signal.name] = [
+                        ps
+                        for ps in self._pending_signals[signal.name]
+                        if ps.registration.unique_name != unique_name
+                    ]
+                    if not self._pending_signals[signal.name]:
+                        del self._pending_signals[signal.name]
+
+    async def signal(self, signal):
+        raise NotImplementedError
+
+
+async def start_waiters(handler, count: int, timeout: float | None):
+    waiters = [
+        asyncio.create_task(
+            handler.wait_for_signal(
+                Signal(name="human_input", workflow_id=f"wf-{i}"), timeout_seconds=timeout
+            )
+        )
+        for i in range(count)
+    ]
+    # Let every waiter register
+    await asyncio.sleep(0)
+    return waiters
+
+
+async def targeted(count: int) -> float:
+    handler = AsyncioSignalHandler()
+    waiters = await start_waiters(handler, count, timeout=None)
+    start = time.perf_counter()
+    for i in range(count):
+        await handler.signal(Signal(name="human_input", workflow_id=f"wf-{i}", payload=i))
+    results = await asyncio.gather(*waiters)
+    elapsed = time.perf_counter() - start
+    assert results == list(range(count))
+    return elapsed
+
+
+async def timeouts(handler, count: int) -> float:
+    waiters = await start_waiters(handler, count, timeout=0.05)
+    start = time.perf_counter()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    # Subtract the timeout itself: what remains is the cost of expiring and removing waiters
+    return time.perf_counter() - start - 0.05
+
+
+async def main():
+    print(f"{'waiters':>8} {'scenario':>10} {'impl':>10} {'total s':>8} {'us/waiter':>10}")
+    for count in WAITERS:
+        rows = [
+            ("targeted", "indexed", await targeted(count)),
+            ("timeout", "indexed", await timeouts(AsyncioSignalHandler(), count)),
+            ("timeout", "reference", await timeouts(ReferenceSignalHandler(), count)),
+        ]
+        for scenario, impl, elapsed in rows:
+            print(f"{count:>8} {scenario:>10} {impl:>10} {elapsed:>8.3f} {elapsed / count * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""
+Benchmark for short tasks under TemporalExecutor: regular activities, local
+activities and batched activities.
+
+A workflow runs N trivial @workflow_tasks through `executor.execute(...)` against
+the Temporal dev server (`WorkflowEnvironment.start_local()`, downloaded on first
+use). Each regular activity costs a schedule/start/complete round trip through the
+server; local activities run in the workflow's worker and only record a marker;
+a batch runs up to `activity_batch_size` calls in a single activity.
+
+Requires temporalio.
+
+Usage:
+    python examples/benchmarks/bench_temporal_activities.py
+"""
+
+import sys
+import os
+import asyncio
+import functools
+import time
+import uuid
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from temporalio import workflow  # noqa: E402
+from temporalio.testing import WorkflowEnvironment  # noqa: E402
+from temporalio.worker import UnsandboxedWorkflowRunner, Worker  # noqa: E402
+
+from metaagent.executor.temporal import TemporalExecutor, TemporalExecutorConfig  # noqa: E402
+from metaagent.executor.workflow_task import workflow_task  # noqa: E402
+
+TASK_QUEUE = "metaagent-bench"
+SIZES = [10, 100]
+
+
+@workflow_task(name="bench.remote")
+async def remote(i: int) -> int:
+    return i
+
+
+@workflow_task(name="bench.local", local=True)
+async def local(i: int) -> int:
+    return i
+
+
+@workflow_task(name="bench.batched", batch=True)
+async def batched(i: int) -> int:
+    return i
+
+
+@workflow_task(name="bench.local_batched", local=True, batch=True)
+async def local_batched(i: int) -> int:
+    return i
+
+
+TASKS = {
+    "activity": remote,
+    "local": local,
+    "batched": batched,
+    "local+batched": local_batched,
+}
+
+
+@workflow.defn
+class ShortTasksWorkflow:
+    @workflow.run
+    async def run(self, mode: str, count: int) -> int:
+        executor = TemporalExecutor(
+            config=TemporalExecutorConfig(host="", task_queue=TASK_QUEUE)
+        )
+        task = TASKS[mode]
+        results = await executor.execute(*(functools.partial(task, i) for i in range(count)))
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
+        return sum(results)
+
+
+async def main():
+    functions = {
+        func.execution_metadata["activity_name"]: func for func in TASKS.values()
+    }
+    activities = [
+        TemporalExecutor.wrap_as_activity(name, func) for name, func in functions.items()
+    ]
+    activities.append(TemporalExecutor.create_batch_activity(functions))
+
+    async with await WorkflowEnvironment.start_local() as env:
+        async with Worker(
+            env.client,
+            task_queue=TASK_QUEUE,
+            workflows=[ShortTasksWorkflow],
+            activities=activities,
+            workflow_runner=UnsandboxedWorkflowRunner(),
+        ):
+            print(f"{'tasks':>6} {'mode':>14} {'total s':>8} {'ms/task':>8}")
+            for count in SIZES:
+                for mode in TASKS:
+                    start = time.perf_counter()
+                    total = await env.client.execute_workflow(
+                        ShortTasksWorkflow.run,
+                        args=[mode, count],
+                        id=f"bench-{mode}-{count}-{uuid.uuid4()}",
+                        task_queue=TASK_QUEUE,
+                    )
+                    elapsed = time.perf_counter() - start
+                    assert total == sum(range(count))
+                    print(f"{count:>6} {mode:>14} {elapsed:>8.3f} {elapsed / count * 1e3:>8.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
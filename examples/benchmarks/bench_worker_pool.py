@@ -0,0 +1,93 @@
+"""
+Throughput benchmark for the worker process pool against a single process.
+
+Each task models the work around an LLM or tool call: it waits on simulated
+network I/O, then parses a JSON response and validates it with pydantic. In one
+process the parsing serializes on one core; with pool="workers" it spreads over
+the worker processes while each worker still overlaps many calls' I/O.
+
+Usage:
+    python examples/benchmarks/bench_worker_pool.py [tasks] [workers]
+"""
+
+import sys
+import os
+import asyncio
+import functools
+import json
+import multiprocessing
+import time
+from typing import List
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from pydantic import BaseModel  # noqa: E402
+
+from metaagent.executor.executor import AsyncioExecutor, ExecutorConfig  # noqa: E402
+from metaagent.executor.workflow_task import workflow_task  # noqa: E402
+
+RESPONSE = json.dumps(
+    {
+        "choices": [
+            {"index": i, "message": {"role": "assistant", "content": "token " * 200}, "scores": list(range(50))}
+            for i in range(20)
+        ]
+    }
+)
+
+
+class Message(BaseModel):
+    role: str
+    content: str
+
+
+class Choice(BaseModel):
+    index: int
+    message: Message
+    scores: List[int]
+
+
+class Completion(BaseModel):
+    choices: List[Choice]
+
+
+async def handle_call(i: int) -> int:
+    await asyncio.sleep(0.005)  # Network round trip
+    completion = Completion.model_validate(json.loads(RESPONSE))
+    return len(completion.model_dump_json()) + i
+
+
+@workflow_task(pool="workers")
+async def handle_call_in_workers(i: int) -> int:
+    return await handle_call(i)
+
+
+async def measure(executor: AsyncioExecutor, task, count: int) -> float:
+    start = time.perf_counter()
+    async for _ in executor.execute_streaming(
+        (functools.partial(task, i) for i in range(count)), max_concurrency=256
+    ):
+        pass
+    return time.perf_counter() - start
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+
+    single = AsyncioExecutor()
+    multi = AsyncioExecutor(config=ExecutorConfig(worker_pool_workers=workers))
+    # Process start-up is not part of the measurement
+    await multi.worker_pool.warm_up()
+
+    print(f"{'mode':>16} {'tasks':>7} {'total s':>8} {'tasks/s':>9}")
+    for label, executor, task in [
+        ("single process", single, handle_call),
+        (f"{workers} workers", multi, handle_call_in_workers),
+    ]:
+        elapsed = await measure(executor, task, count)
+        print(f"{label:>16} {count:>7} {elapsed:>8.2f} {count / elapsed:>9.0f}")
+    multi.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,7 +3,7 @@ import openai
 import os
 
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from httpx import Client
 from pydantic import BaseModel, ConfigDict, field_validator
@@ -274,6 +274,54 @@ class GoogleSettings(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class ExecutorSettings(BaseModel):
+    """
+    Settings shared by the executors (see metaagent.executor.executor.ExecutorConfig).
+    """
+
+    max_concurrent_activities: int | None = None
+    """Most tasks running at once, shared between sessions by the fair scheduler. Unbounded by default"""
+
+    timeout_seconds: float | None = None
+    """Default overall timeout in seconds of a task, across all its attempts"""
+
+    retry_policy: Dict[str, Any] | None = None
+    """Default retry policy of tasks without their own (the fields of a RetryPolicy)"""
+
+    scheduler_weights: Dict[str, float] = {}
+    """Fair-share weight per scheduling key (session or workflow id); keys not listed get weight 1"""
+
+    scheduler_aging_seconds: float | None = 5.0
+    """Waiting tasks gain one priority level per this many seconds; null disables aging"""
+
+    default_pool: str = "thread"
+    """Pool for synchronous tasks that don't choose one: "thread", "process", "workers" or a named thread pool"""
+
+    thread_pools: Dict[str, int] = {}
+    """Named thread pools and their sizes, e.g. {"io": 32}"""
+
+    process_pool_workers: int | None = None
+    """Number of process pool workers. Defaults to the number of CPUs"""
+
+    process_pool_max_tasks_per_child: int | None = None
+    """Replace a process pool worker after this many tasks. Never by default"""
+
+    worker_pool_workers: int | None = None
+    """Number of worker processes for pool="workers" tasks. Defaults to the number of CPUs"""
+
+    worker_pool_crash_retries: int = 1
+    """How many times a task is resubmitted after the worker process running it died"""
+
+    memo_path: str | None = None
+    """SQLite file for memoized task results; null disables memoization"""
+
+    memo_ttl_seconds: float | None = None
+    """How long memoized results are kept. Forever by default"""
+
+    memo_max_bytes: int | None = None
+    """Size limit of the memo store. None by default"""
+
+
 class TemporalSettings(BaseModel):
     """
     Temporal settings for the MCP Agent application.
@@ -284,6 +332,46 @@ class TemporalSettings(BaseModel):
     task_queue: str
     api_key: str | None = None
 
+    local_activity_timeout: float = 10.0
+    """Start-to-close timeout in seconds of local activities that set no timeout of their own"""
+
+    activity_batch_size: int = 50
+    """Most @workflow_task(batch=True) calls combined into one activity"""
+
+
+class DurableSettings(BaseModel):
+    """
+    Settings for the local durable executor (single-node resumable workflows).
+    """
+
+    journal_path: str = "workflows.journal.db"
+    """SQLite file that journals task results and workflow state"""
+
+    lease_seconds: float = 30.0
+    """How long a workflow run stays claimed if its process stops renewing it"""
+
+
+class RateLimitSettings(BaseModel):
+    """
+    Quota of one provider or model. Unset limits are not enforced.
+    """
+
+    requests_per_minute: float | None = None
+
+    tokens_per_minute: float | None = None
+
+
+class RateLimiterSettings(BaseModel):
+    """
+    Settings for the shared rate limiter that LLM and search calls wait on.
+    """
+
+    limits: Dict[str, RateLimitSettings] = {}
+    """Quotas keyed by provider ("openai") or model ("gpt-4o", "openai/gpt-4o")"""
+
+    adapt_to_headers: bool = True
+    """Follow the limits and resets reported in providers' rate-limit response headers"""
+
 
 class UsageTelemetrySettings(BaseModel):
     """
@@ -318,6 +406,15 @@ class OpenTelemetrySettings(BaseModel):
     sample_rate: float = 1.0
     """Sample rate for tracing (1.0 = sample everything)"""
 
+    operation_sample_rates: Dict[str, float] = {}
+    """Per-operation sample rate overrides, keyed by span name or dotted span-name prefix"""
+
+    record_args: bool = True
+    """Record primitive arguments of traced functions as span attributes"""
+
+    max_arg_length: int = 256
+    """Truncate recorded argument values to this many characters"""
+
 
 class LogPathSettings(BaseModel):
     """
@@ -345,15 +442,33 @@ class LogPathSettings(BaseModel):
     """
 
 
+class EventRateLimitSettings(BaseModel):
+    """
+    Settings for rate limiting log events per namespace and event type.
+    """
+
+    rate: float = 20.0
+    """Sustained events per second allowed for each namespace and event type"""
+
+    burst: int = 100
+    """Number of events that can pass at once before the rate applies"""
+
+    namespace_rates: Dict[str, float] = {}
+    """Per-namespace-prefix overrides of `rate`, e.g. {"metaagent.mcp.mcp_aggregator": 5}"""
+
+    summary_interval: float = 10.0
+    """Minimum seconds between summary events reporting suppressed counts"""
+
+
 class LoggerSettings(BaseModel):
     """
     Logger settings for the MCP Agent application.
     """
 
     # Original transport configuration (kept for backward compatibility)
-    type: Literal["none", "console", "file", "http"] = "console"
+    type: Literal["none", "console", "file", "binary", "http"] = "console"
 
-    transports: List[Literal["none", "console", "file", "http"]] = []
+    transports: List[Literal["none", "console", "file", "binary", "http"]] = []
     """List of transports to use (can enable multiple simultaneously)"""
 
     level: Literal["debug", "info", "warning", "error"] = "info"
@@ -362,9 +477,30 @@ class LoggerSettings(BaseModel):
     progress_display: bool = False
     """Enable or disable the progress display"""
 
+    progress_max_fps: float = 10.0
+    """Maximum frames per second rendered by the progress display; updates in between are coalesced"""
+
+    rate_limit: EventRateLimitSettings | None = None
+    """Rate limit events per namespace and event type (errors are never limited)"""
+
     path: str = "mcp-agent.jsonl"
     """Path to log file, if logger 'type' is 'file'."""
 
+    file_index: bool = False
+    """
+    Maintain a sidecar index (<log>.idx) of byte offsets per session, trace and time,
+    so the 'file' transport's logs can be queried without scanning them.
+    """
+
+    file_max_bytes: int | None = None
+    """Rotate the 'file' transport's log to <stem>.<index><suffix> once it reaches this size."""
+
+    binary_segment_max_bytes: int = 64 * 1024 * 1024
+    """
+    Size at which the 'binary' transport starts a new segment.
+    Binary logs are written next to the log path with an .evlog suffix.
+    """
+
     # Settings for advanced log path configuration
     path_settings: LogPathSettings | None = None
     """
@@ -391,6 +527,38 @@ class LoggerSettings(BaseModel):
     """HTTP timeout seconds for event transport"""
 
 
+class ProfilingSettings(BaseModel):
+    """
+    Settings for the opt-in profiler (stage timers and sampled stacks per workflow run).
+    """
+
+    enabled: bool = False
+
+    output_dir: str = "profiles"
+    """Directory the .folded (collapsed stacks) and .stages.txt artifacts are written to"""
+
+    sample_interval: float = 0.01
+    """Seconds between stack samples"""
+
+
+class MetricsSettings(BaseModel):
+    """
+    Settings for the in-process metrics registry (Prometheus text format).
+    """
+
+    export_path: str | None = None
+    """Periodically write metrics to this file, e.g. for a node_exporter textfile collector"""
+
+    export_interval: float = 15.0
+    """Seconds between metric file exports"""
+
+    http_port: int | None = None
+    """Serve metrics at http://<http_host>:<http_port>/metrics"""
+
+    http_host: str = "127.0.0.1"
+    """Interface the metrics endpoint binds to"""
+
+
 class Settings(BaseSettings):
     """
     Settings class for the MCP Agent application.
@@ -407,12 +575,18 @@ class Settings(BaseSettings):
     mcp: MCPSettings | None = MCPSettings()
     """MCP config, such as MCP servers"""
 
-    execution_engine: Literal["asyncio", "temporal"] = "asyncio"
+    execution_engine: Literal["asyncio", "temporal", "durable"] = "asyncio"
     """Execution engine for the MCP Agent application"""
 
+    executor: ExecutorSettings | None = ExecutorSettings()
+    """Concurrency, scheduling, timeout, retry, pool and memoization settings of the executor"""
+
     temporal: TemporalSettings | None = None
     """Settings for Temporal workflow orchestration"""
 
+    durable: DurableSettings | None = None
+    """Settings for the local durable executor"""
+
     anthropic: AnthropicSettings | None = None
     """Settings for using Anthropic models in the MCP Agent application"""
 
@@ -440,6 +614,15 @@ class Settings(BaseSettings):
     usage_telemetry: UsageTelemetrySettings | None = UsageTelemetrySettings()
     """Usage tracking settings for the MCP Agent application"""
 
+    metrics: MetricsSettings | None = MetricsSettings()
+    """Metrics exposition settings for the MCP Agent application"""
+
+    profiling: ProfilingSettings | None = ProfilingSettings()
+    """Profiling settings for the MCP Agent application"""
+
+    rate_limits: RateLimiterSettings | None = RateLimiterSettings()
+    """Provider and model quotas for LLM and search API calls"""
+
     @classmethod
     def find_config(cls) -> Path | None:
         """Find the config file in the current directory or parent directories."""
@@ -4,7 +4,8 @@ A central context object to store global state that is shared across the applica
 
 import asyncio
 import concurrent.futures
-from typing import Any, Optional, Union, TYPE_CHECKING
+import threading
+from typing import Any, Callable, Optional, Union, TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict
 
@@ -13,14 +14,14 @@ from mcp import ServerSession
 from opentelemetry import trace
 from opentelemetry.propagate import set_global_textmap
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 
 from metaagent.config import get_settings
-from metaagent.config import Settings
-from metaagent.executor.executor import Executor
+from metaagent.config import DurableSettings, ExecutorSettings, Settings
+from metaagent.executor.executor import Executor, ExecutorConfig
 from metaagent.executor.decorator_registry import (
     DecoratorRegistry,
     register_asyncio_decorators,
@@ -28,9 +29,13 @@ from metaagent.executor.decorator_registry import (
 )
 from metaagent.executor.task_registry import ActivityRegistry
 from metaagent.executor.executor import AsyncioExecutor
+from metaagent.executor.rate_limiter import RateLimiter, rate_limiter
 
-from metaagent.logging.events import EventFilter
+from metaagent.logging.events import EventFilter, RateLimitingFilter
 from metaagent.logging.logger import LoggingConfig
+from metaagent.logging.metrics import metrics
+from metaagent.logging.profiling import profiler
+from metaagent.logging.tracing import OperationSampler, telemetry
 from metaagent.logging.transport import create_transport
 from metaagent.mcp.mcp_server_registry import ServerRegistry
 # from metaagent.workflows.llm.llm_selector import ModelSelector
@@ -67,6 +72,9 @@ class Context(BaseModel):
     task_registry: Optional[ActivityRegistry] = None
     decorator_registry: Optional[DecoratorRegistry] = None
 
+    # Provider quotas shared by every LLM and search call in the process
+    rate_limiter: Optional[RateLimiter] = None
+
     tracer: Optional[trace.Tracer] = None
 
     model_config = ConfigDict(
@@ -75,10 +83,62 @@ class Context(BaseModel):
     )
 
 
+class _DeferredSpanProcessor(SpanProcessor):
+    """
+    Span processor that creates the processor it delegates to (and its exporter)
+    when the first span ends, so applications that never record a span do not pay
+    for exporter imports, connections or export threads.
+    """
+
+    def __init__(self, factory: Callable[[], SpanProcessor]):
+        self._factory = factory
+        self._processor: SpanProcessor | None = None
+        self._lock = threading.Lock()
+
+    def _get_processor(self) -> SpanProcessor:
+        if self._processor is None:
+            with self._lock:
+                if self._processor is None:
+                    self._processor = self._factory()
+        return self._processor
+
+    def on_start(self, span: Span, parent_context=None) -> None:
+        if self._processor is not None:
+            self._processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        self._get_processor().on_end(span)
+
+    def shutdown(self) -> None:
+        if self._processor is not None:
+            self._processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        if self._processor is None:
+            return True
+        return self._processor.force_flush(timeout_millis)
+
+
+def _otlp_span_processor(endpoint: str) -> SpanProcessor:
+    # Imported on first use: the OTLP exporter pulls in protobuf and an HTTP client
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+    return BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint))
+
+
+def _console_span_processor() -> SpanProcessor:
+    return BatchSpanProcessor(ConsoleSpanExporter())
+
+
 async def configure_otel(config: "Settings"):
     """
     Configure OpenTelemetry based on the application config.
+    Runs in a thread: creating the provider and exporters is blocking work.
     """
+    await asyncio.to_thread(_configure_otel, config)
+
+
+def _configure_otel(config: "Settings"):
     if not config.otel.enabled:
         return
 
@@ -106,22 +166,26 @@ async def configure_otel(config: "Settings"):
         }
     )
 
-    # Create provider with resource
-    tracer_provider = TracerProvider(resource=resource)
+    # Create provider with resource; sampling is decided once at the root span
+    sampler = ParentBased(
+        OperationSampler(config.otel.sample_rate, config.otel.operation_sample_rates)
+    )
+    tracer_provider = TracerProvider(resource=resource, sampler=sampler)
 
-    # Add exporters based on config
+    # Add exporters based on config; each is created when the first span ends
     otlp_endpoint = config.otel.otlp_endpoint
     if otlp_endpoint:
-        exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
-        tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+        tracer_provider.add_span_processor(
+            _DeferredSpanProcessor(lambda: _otlp_span_processor(otlp_endpoint))
+        )
 
         if config.otel.console_debug:
             tracer_provider.add_span_processor(
-                BatchSpanProcessor(ConsoleSpanExporter())
+                _DeferredSpanProcessor(_console_span_processor)
             )
     else:
         # Default to console exporter in development
-        tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+        tracer_provider.add_span_processor(_DeferredSpanProcessor(_console_span_processor))
 
     # Set as global tracer provider
     trace.set_tracer_provider(tracer_provider)
@@ -131,7 +195,17 @@ async def configure_logger(config: "Settings", session_id: str | None = None):
     """
     Configure logging and tracing based on the application config.
     """
-    event_filter: EventFilter = EventFilter(min_level=config.logger.level)
+    rate_limit = config.logger.rate_limit
+    if rate_limit:
+        event_filter: EventFilter = RateLimitingFilter(
+            min_level=config.logger.level,
+            rate=rate_limit.rate,
+            burst=rate_limit.burst,
+            namespace_rates=rate_limit.namespace_rates,
+            summary_interval=rate_limit.summary_interval,
+        )
+    else:
+        event_filter: EventFilter = EventFilter(min_level=config.logger.level)
     logger.info(f"Configuring logger with level: {config.logger.level}")
     transport = create_transport(
         settings=config.logger, event_filter=event_filter, session_id=session_id
@@ -142,6 +216,7 @@ async def configure_logger(config: "Settings", session_id: str | None = None):
         batch_size=config.logger.batch_size,
         flush_interval=config.logger.flush_interval,
         progress_display=config.logger.progress_display,
+        progress_max_fps=config.logger.progress_max_fps,
     )
 
 
@@ -153,22 +228,73 @@ async def configure_usage_telemetry(_config: "Settings"):
     pass
 
 
-async def configure_executor(config: "Settings"):
+async def configure_metrics(config: "Settings"):
+    """
+    Expose the metrics registry based on the application config.
+    """
+    if not config.metrics:
+        return
+    if config.metrics.http_port is not None:
+        metrics.serve(config.metrics.http_port, host=config.metrics.http_host)
+    if config.metrics.export_path:
+        metrics.export_periodically(
+            config.metrics.export_path, interval=config.metrics.export_interval
+        )
+
+
+async def configure_profiling(config: "Settings"):
+    """
+    Enable the profiler based on the application config.
+    """
+    profiler.configure(config.profiling)
+
+
+async def configure_rate_limits(config: "Settings"):
+    """
+    Apply the provider and model quotas from the application config.
+    """
+    rate_limiter.configure(config.rate_limits)
+
+
+async def configure_executor(config: "Settings", context: "Context"):
     """
     Configure the executor based on the application config.
+    Runs in a thread: the Temporal and durable executors import their dependencies
+    and open connections or files when they are created.
     """
-    if config.execution_engine == "asyncio":
-        return AsyncioExecutor()
-    elif config.execution_engine == "temporal":
-        # Configure Temporal executor
-        from metaagent.executor.temporal import TemporalExecutor
+    return await asyncio.to_thread(_create_executor, config, context)
 
-        executor = TemporalExecutor(config=config.temporal)
-        return executor
+
+def _create_executor(config: "Settings", context: "Context"):
+    executor_settings = (config.executor or ExecutorSettings()).model_dump(
+        exclude_unset=True
+    )
+    if config.execution_engine == "temporal":
+        # Configure Temporal executor
+        from metaagent.executor.temporal import (
+            TemporalExecutor,
+            TemporalExecutorConfig,
+        )
+
+        temporal_settings = config.temporal.model_dump() if config.temporal else {}
+        executor_config = TemporalExecutorConfig(
+            **temporal_settings, **executor_settings
+        )
+        return TemporalExecutor(config=executor_config, context=context)
+    elif config.execution_engine == "durable":
+        # Configure the local durable executor
+        from metaagent.executor.durable import DurableExecutor
+
+        settings = config.durable or DurableSettings()
+        return DurableExecutor(
+            journal_path=settings.journal_path,
+            config=ExecutorConfig(**executor_settings),
+            lease_seconds=settings.lease_seconds,
+            context=context,
+        )
     else:
         # Default to asyncio executor
-        executor = AsyncioExecutor()
-        return executor
+        return AsyncioExecutor(config=ExecutorConfig(**executor_settings), context=context)
 
 
 async def initialize_context(
@@ -178,6 +304,12 @@ async def initialize_context(
 ):
     """
     Initialize the global application context.
+
+    Configuration steps that do not depend on each other (otel, logging, metrics,
+    profiling, rate limits, the executor) are gathered; the blocking ones (otel
+    and the executor) run in threads, so they overlap with the rest. MCP servers
+    are not started here: each one is launched when it is first requested from
+    the server registry.
     """
     if config is None:
         config = get_settings()
@@ -190,14 +322,19 @@ async def initialize_context(
 
     context.session_id = session_id
 
-    # Configure logging and telemetry
-    await configure_otel(config)
-    await configure_logger(config, context.session_id)
-    await configure_usage_telemetry(config)
-
-    # Configure the executor
-    context.executor = await configure_executor(config)
+    # Configure logging, telemetry and the executor
+    *_, context.executor = await asyncio.gather(
+        configure_otel(config),
+        configure_logger(config, context.session_id),
+        configure_usage_telemetry(config),
+        configure_metrics(config),
+        configure_profiling(config),
+        configure_rate_limits(config),
+        configure_executor(config, context),
+    )
+    context.rate_limiter = rate_limiter
     context.task_registry = ActivityRegistry()
+    context.task_registry.register_workflow_tasks()
 
     context.decorator_registry = DecoratorRegistry()
     register_asyncio_decorators(context.decorator_registry)
@@ -205,6 +342,7 @@ async def initialize_context(
 
     # Store the tracer in context if needed
     context.tracer = trace.get_tracer(config.otel.service_name)
+    telemetry.configure(config.otel, tracer=context.tracer)
 
     if store_globally:
         global _global_context
@@ -220,9 +358,17 @@ async def cleanup_context():
 
     # Shutdown logging and telemetry
     await LoggingConfig.shutdown()
+    metrics.shutdown()
+    profiler.shutdown()
+
+    if _global_context is not None and isinstance(
+        _global_context.executor, AsyncioExecutor
+    ):
+        _global_context.executor.shutdown()
 
 
 _global_context: Context | None = None
+_global_context_init: "asyncio.Task[Context] | None" = None
 
 
 def get_current_context() -> Context:
@@ -251,6 +397,27 @@ def get_current_context() -> Context:
     return _global_context
 
 
+async def aget_current_context() -> Context:
+    """
+    Asynchronous initializer/getter for global application context.
+    Initializes it on the running event loop, once even if called concurrently.
+    """
+    global _global_context_init
+    if _global_context is not None:
+        return _global_context
+
+    init = _global_context_init
+    if init is None or init.get_loop() is not asyncio.get_running_loop():
+        init = asyncio.ensure_future(initialize_context(store_globally=True))
+        _global_context_init = init
+    try:
+        # Shielded so that a cancelled caller does not cancel initialization for the others
+        return await asyncio.shield(init)
+    finally:
+        if init.done() and _global_context_init is init:
+            _global_context_init = None
+
+
 def get_current_config():
     """
     Get the current application config.
@@ -0,0 +1,516 @@
+"""
+DAG workflows on top of an Executor: tasks declare their inputs and each one
+starts as soon as those inputs are available.
+
+    dag = DAG(executor, max_concurrency=8)
+    script = dag.task("script", write_script, topic)
+    boards = dag.task("storyboards", split_storyboards, script)
+    images = dag.map("image", draw_image, boards)         # one task per storyboard
+    upscaled = dag.map("upscale", upscale, images)        # item i starts when image i is done
+    video = dag.task("video", make_video, upscaled)
+
+    async for name, result in dag.stream():
+        ...                                               # intermediate results as they finish
+    # or: run = await dag.run(); run.results["video"]; print(run.report())
+
+Nodes passed as arguments (directly, or inside lists, tuples and dicts) are
+replaced by their results. `dag.ref(name)` refers to a node defined later, and
+`after=` adds ordering-only dependencies; cycles are rejected before anything runs.
+
+When a task fails, the tasks that depend on it are skipped (their result is a
+DAGDependencyError) while independent branches keep running. After each run a
+timing report with the critical path is logged and available from `DAGRun.report()`.
+"""
+
+import asyncio
+import functools
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+)
+
+from metaagent.executor.executor import AsyncioExecutor, Executor
+from metaagent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DAGCycleError(ValueError):
+    """The DAG's dependencies contain a cycle."""
+
+
+class DAGDependencyError(RuntimeError):
+    """A task was skipped because one of its dependencies failed."""
+
+
+class NodeRef:
+    """Reference to a DAG node by name, resolved when the DAG is validated."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"NodeRef({self.name!r})"
+
+
+class DAGNode:
+    """A task (or, for `DAG.map`, one task per item of another node's result)."""
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        after: Iterable["DAGNode | NodeRef | str"] = (),
+        over: "DAGNode | NodeRef | None" = None,
+    ):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.after = list(after)
+        self.over = over
+        self.dependencies: List[DAGNode] = []
+
+    @property
+    def is_map(self) -> bool:
+        return self.over is not None
+
+    def __repr__(self) -> str:
+        return f"DAGNode({self.name!r})"
+
+
+class NodeTiming:
+    """When a task (or a map item) started and finished, relative to the start of the run."""
+
+    __slots__ = ("name", "node", "ready", "start", "end", "dependencies", "ok")
+
+    def __init__(self, name: str, ready: float, dependencies: List[str], node: str | None = None):
+        self.name = name
+        # Name of the DAG node; for a map item `name` is `node[i]`
+        self.node = node or name
+        self.ready = ready
+        self.start = ready
+        self.end = ready
+        self.dependencies = dependencies
+        self.ok = True
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def wait(self) -> float:
+        """Time between its dependencies finishing and the task starting."""
+        return self.start - self.ready
+
+
+class DAGRun:
+    """Results and timings of one DAG run."""
+
+    def __init__(self, name: str, results: Dict[str, Any], timings: Dict[str, NodeTiming], wall_time: float):
+        self.name = name
+        self.results = results
+        self.timings = timings
+        self.wall_time = wall_time
+
+    @property
+    def failed(self) -> Dict[str, BaseException]:
+        return {
+            name: result
+            for name, result in self.results.items()
+            if isinstance(result, BaseException)
+        }
+
+    def critical_path(self) -> List[NodeTiming]:
+        """The chain of dependent tasks that determined the run's wall time."""
+        if not self.timings:
+            return []
+        by_node: Dict[str, List[NodeTiming]] = {}
+        for timing in self.timings.values():
+            by_node.setdefault(timing.node, []).append(timing)
+
+        def latest(dependency: str) -> NodeTiming | None:
+            # A map node has no timing of its own, only its items do; skipped tasks have none
+            if dependency in self.timings:
+                return self.timings[dependency]
+            items = by_node.get(dependency)
+            return max(items, key=lambda t: t.end) if items else None
+
+        node = max(self.timings.values(), key=lambda timing: timing.end)
+        path = [node]
+        while True:
+            timings = [t for t in map(latest, node.dependencies) if t is not None]
+            if not timings:
+                break
+            node = max(timings, key=lambda t: t.end)
+            path.append(node)
+        return list(reversed(path))
+
+    def report(self) -> str:
+        """Per-task timing table followed by the critical path."""
+        busy = sum(timing.duration for timing in self.timings.values())
+        parallelism = busy / self.wall_time if self.wall_time else 0.0
+        header = f"{'task':<40} {'start s':>8} {'wait s':>8} {'run s':>8}  status"
+        lines = [
+            f"# DAG {self.name}: {len(self.timings)} tasks, wall {self.wall_time:.3f}s, "
+            f"task time {busy:.3f}s, parallelism {parallelism:.1f}x",
+            header,
+            "-" * len(header),
+        ]
+        for timing in sorted(self.timings.values(), key=lambda t: t.start):
+            lines.append(
+                f"{timing.name[:40]:<40} {timing.start:>8.3f} {timing.wait:>8.3f} "
+                f"{timing.duration:>8.3f}  {'ok' if timing.ok else 'failed'}"
+            )
+        path = self.critical_path()
+        lines.append(
+            f"critical path ({sum(t.duration for t in path):.3f}s of task time): "
+            + " -> ".join(f"{t.name} ({t.duration:.3f}s)" for t in path)
+        )
+        return "\n".join(lines) + "\n"
+
+
+class DAG:
+    """A set of tasks with declared inputs, run with dependency-driven parallelism."""
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        name: str = "dag",
+        max_concurrency: int | None = None,
+    ):
+        """
+        Args:
+            executor: Executor that runs each task. Defaults to a new AsyncioExecutor
+            name: Name used in the timing report
+            max_concurrency: Maximum number of tasks of this DAG running at once
+        """
+        self.executor = executor or AsyncioExecutor()
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.nodes: Dict[str, DAGNode] = {}
+
+    def _add(self, node: DAGNode) -> DAGNode:
+        if node.name in self.nodes:
+            raise ValueError(f"DAG {self.name} already has a task named {node.name!r}")
+        self.nodes[node.name] = node
+        return node
+
+    def task(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        after: Iterable["DAGNode | NodeRef | str"] = (),
+        **kwargs: Any,
+    ) -> DAGNode:
+        """Add a task that runs `func(*args, **kwargs)` once the nodes among its arguments are done."""
+        return self._add(DAGNode(name, func, args, kwargs, after=after))
+
+    def map(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        over: "DAGNode | NodeRef",
+        *args: Any,
+        after: Iterable["DAGNode | NodeRef | str"] = (),
+        **kwargs: Any,
+    ) -> DAGNode:
+        """
+        Add one task `func(item, *args, **kwargs)` per item of `over`'s result.
+        Mapping over another map node pipelines item by item. The node's result is
+        the list of item results.
+        """
+        return self._add(DAGNode(name, func, args, kwargs, after=after, over=over))
+
+    def ref(self, name: str) -> NodeRef:
+        """Refer to a node by name, e.g. one that is added later."""
+        return NodeRef(name)
+
+    def _lookup(self, value: "DAGNode | NodeRef | str", owner: DAGNode) -> DAGNode:
+        name = value.name if isinstance(value, (DAGNode, NodeRef)) else value
+        node = self.nodes.get(name)
+        if node is None or (isinstance(value, DAGNode) and node is not value):
+            raise ValueError(f"Task {owner.name!r} depends on {name!r}, which is not in DAG {self.name}")
+        return node
+
+    def _collect_refs(self, value: Any, found: List[Any]) -> None:
+        if isinstance(value, (DAGNode, NodeRef)):
+            found.append(value)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self._collect_refs(item, found)
+        elif isinstance(value, dict):
+            for item in value.values():
+                self._collect_refs(item, found)
+
+    def validate(self) -> List[DAGNode]:
+        """Resolve dependencies and return the nodes in topological order; raises DAGCycleError."""
+        for node in self.nodes.values():
+            refs: List[Any] = list(node.after)
+            if node.over is not None:
+                refs.append(node.over)
+            self._collect_refs(node.args, refs)
+            self._collect_refs(node.kwargs, refs)
+            dependencies: Dict[str, DAGNode] = {}
+            for ref in refs:
+                dependency = self._lookup(ref, node)
+                dependencies[dependency.name] = dependency
+            node.dependencies = list(dependencies.values())
+            if node.over is not None:
+                node.over = self._lookup(node.over, node)
+
+        # Kahn's algorithm; whatever cannot be ordered is on (or behind) a cycle
+        remaining = {name: len(node.dependencies) for name, node in self.nodes.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for node in self.nodes.values():
+            for dependency in node.dependencies:
+                dependents[dependency.name].append(node.name)
+        ready = [name for name, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            name = ready.pop()
+            order.append(self.nodes[name])
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.nodes):
+            raise DAGCycleError(f"DAG {self.name} has a cycle: {' -> '.join(self._find_cycle())}")
+        return order
+
+    def _find_cycle(self) -> List[str]:
+        visiting: List[str] = []
+        done = set()
+
+        def visit(node: DAGNode) -> List[str] | None:
+            if node.name in visiting:
+                return visiting[visiting.index(node.name):] + [node.name]
+            if node.name in done:
+                return None
+            visiting.append(node.name)
+            for dependency in node.dependencies:
+                cycle = visit(dependency)
+                if cycle:
+                    return cycle
+            visiting.pop()
+            done.add(node.name)
+            return None
+
+        for node in self.nodes.values():
+            cycle = visit(node)
+            if cycle:
+                return cycle
+        return []
+
+    async def run(self) -> DAGRun:
+        """Run every task and return all results with the run's timings."""
+        runner = _DAGRunner(self)
+        async for _ in runner.stream():
+            pass
+        return runner.result
+
+    async def stream(self) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Run the DAG, yielding `(name, result)` as each task finishes (`name[i]` for
+        map items). Stopping early cancels the tasks still running.
+        """
+        async for item in _DAGRunner(self).stream():
+            yield item
+
+
+class _DAGRunner:
+    """State of one DAG run."""
+
+    def __init__(self, dag: DAG):
+        self.dag = dag
+        self.order = dag.validate()
+        self.loop = asyncio.get_running_loop()
+        self.started_at = self.loop.time()
+        self.semaphore = asyncio.Semaphore(dag.max_concurrency) if dag.max_concurrency else None
+        self.futures: Dict[str, asyncio.Future] = {
+            node.name: self.loop.create_future() for node in self.order
+        }
+        # For map nodes: resolves to the list of per-item futures once the item count is known
+        self.item_futures: Dict[str, asyncio.Future] = {
+            node.name: self.loop.create_future() for node in self.order if node.is_map
+        }
+        self.completed: asyncio.Queue[Tuple[str, Any]] = asyncio.Queue()
+        self.timings: Dict[str, NodeTiming] = {}
+        self.results: Dict[str, Any] = {}
+        self.result: DAGRun | None = None
+
+    def _now(self) -> float:
+        return self.loop.time() - self.started_at
+
+    def _finish(self, name: str, result: Any) -> None:
+        self.results[name] = result
+        self.completed.put_nowait((name, result))
+
+    def _resolve(self, value: Any) -> Any:
+        if isinstance(value, (DAGNode, NodeRef)):
+            return self.futures[value.name].result()
+        if isinstance(value, list):
+            return [self._resolve(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self._resolve(item) for item in value)
+        if isinstance(value, dict):
+            return {key: self._resolve(item) for key, item in value.items()}
+        return value
+
+    async def _wait_for(self, names: List[str]) -> BaseException | None:
+        """Wait for dependencies; return an error if any of them failed."""
+        for name in names:
+            result = await asyncio.shield(self.futures[name])
+            if isinstance(result, BaseException):
+                return DAGDependencyError(f"Skipped: dependency {name!r} failed: {result}")
+        return None
+
+    async def _execute(self, timing: NodeTiming, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self.semaphore:
+            await self.semaphore.acquire()
+        try:
+            timing.start = self._now()
+            results = await self.dag.executor.execute(functools.partial(func, *args, **kwargs))
+            result = results[0]
+        except Exception as e:
+            result = e
+        finally:
+            timing.end = self._now()
+            if self.semaphore:
+                self.semaphore.release()
+        timing.ok = not isinstance(result, BaseException)
+        return result
+
+    async def _run_task(self, node: DAGNode) -> None:
+        dependencies = [dependency.name for dependency in node.dependencies]
+        error = await self._wait_for(dependencies)
+        if error is not None:
+            self.futures[node.name].set_result(error)
+            self._finish(node.name, error)
+            return
+        timing = self.timings[node.name] = NodeTiming(node.name, self._now(), dependencies)
+        result = await self._execute(
+            timing, node.func, *self._resolve(node.args), **self._resolve(node.kwargs)
+        )
+        self.futures[node.name].set_result(result)
+        self._finish(node.name, result)
+
+    async def _run_map(self, node: DAGNode) -> None:
+        source = node.over
+        others = [dependency.name for dependency in node.dependencies if dependency is not source]
+
+        if source.is_map:
+            # Pipeline item by item behind the source map
+            source_items = await asyncio.shield(self.item_futures[source.name])
+            if isinstance(source_items, BaseException) and not isinstance(source_items, DAGDependencyError):
+                source_items = DAGDependencyError(f"Skipped: dependency {source.name!r} failed: {source_items}")
+        else:
+            error = await self._wait_for([source.name])
+            values = self.futures[source.name].result()
+            if error is not None:
+                source_items = error
+            elif not isinstance(values, Iterable):
+                source_items = TypeError(
+                    f"Cannot map {node.name!r} over {source.name!r}: "
+                    f"its result is a {type(values).__name__}, not an iterable"
+                )
+            else:
+                source_items = []
+                for value in values:
+                    future = self.loop.create_future()
+                    future.set_result(value)
+                    source_items.append(future)
+
+        if isinstance(source_items, BaseException):
+            self.item_futures[node.name].set_result(source_items)
+            self.futures[node.name].set_result(source_items)
+            self._finish(node.name, source_items)
+            return
+
+        item_futures = [self.loop.create_future() for _ in source_items]
+        self.item_futures[node.name].set_result(item_futures)
+
+        async def run_item(index: int, source_item: asyncio.Future, future: asyncio.Future):
+            item_name = f"{node.name}[{index}]"
+            source_name = f"{source.name}[{index}]" if source.is_map else source.name
+            value = await asyncio.shield(source_item)
+            error = await self._wait_for(others)
+            if isinstance(value, BaseException):
+                error = DAGDependencyError(f"Skipped: {source_name} failed: {value}")
+            if error is not None:
+                future.set_result(error)
+                self._finish(item_name, error)
+                return
+            timing = self.timings[item_name] = NodeTiming(
+                item_name, self._now(), [source_name] + others, node=node.name
+            )
+            result = await self._execute(
+                timing, node.func, value, *self._resolve(node.args), **self._resolve(node.kwargs)
+            )
+            future.set_result(result)
+            self._finish(item_name, result)
+
+        await asyncio.gather(
+            *(
+                run_item(index, source_item, future)
+                for index, (source_item, future) in enumerate(zip(source_items, item_futures))
+            )
+        )
+        results = [future.result() for future in item_futures]
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            result = DAGDependencyError(
+                f"{len(failures)} of {len(results)} items of {node.name} failed; first: {failures[0]}"
+            )
+        else:
+            result = results
+        self.futures[node.name].set_result(result)
+        self._finish(node.name, result)
+
+    async def _run_node(self, node: DAGNode) -> None:
+        """Run a node; an unexpected error becomes the result of the node and its pending items."""
+        try:
+            if node.is_map:
+                await self._run_map(node)
+            else:
+                await self._run_task(node)
+        except Exception as e:
+            logger.error(f"DAG {self.dag.name}: task {node.name!r} raised: {e}")
+            if node.is_map:
+                items = self.item_futures[node.name]
+                if not items.done():
+                    items.set_result(e)
+                elif isinstance(items.result(), list):
+                    for future in items.result():
+                        if not future.done():
+                            future.set_result(e)
+            if not self.futures[node.name].done():
+                self.futures[node.name].set_result(e)
+                self._finish(node.name, e)
+
+    async def stream(self) -> AsyncIterator[Tuple[str, Any]]:
+        tasks = [asyncio.ensure_future(self._run_node(node)) for node in self.order]
+        try:
+            pending = len(self.order)
+            while pending:
+                name, result = await self.completed.get()
+                if name in self.futures:
+                    pending -= 1
+                yield name, result
+            # Surface bugs in the engine itself rather than hanging
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        wall_time = self._now()
+        self.result = DAGRun(self.dag.name, self.results, self.timings, wall_time)
+        logger.info(f"DAG {self.dag.name} finished in {wall_time:.3f}s\n{self.result.report()}")
@@ -0,0 +1,401 @@
+"""
+Local durable executor: Temporal-like resumability for single-node deployments.
+
+DurableExecutor journals the tasks each workflow run starts and completes, and
+its WorkflowState updates, into an append-only SQLite (WAL) file. When a workflow
+whose previous run did not complete is started again (e.g. after a crash or a
+restart), tasks that already completed return their journaled results instead
+of re-executing, and the workflow state is restored from its last snapshot.
+
+As with Temporal, replay relies on the workflow starting its tasks in the same
+order every time it runs: a task is matched to the journal by its position in
+the run and its name. A task that doesn't match is re-executed with a warning,
+and failed tasks are always re-executed.
+
+A run is identified by the "workflow_id" in the workflow metadata or, failing
+that, by the workflow name and a canonical hash of the `run` arguments. Once a
+run completes, starting the same workflow id again begins a new run.
+
+A run in progress holds a lease on its journal entry, renewed while it runs, so
+a concurrent start of the same workflow id begins a separate run instead of
+replaying (and appending to) the live one. An unfinished run is resumed once
+its owner has exited, died (same host) or let the lease expire.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import os
+import pickle
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
+
+from metaagent.executor.executor import AsyncioExecutor, ExecutorConfig, _task_name
+from metaagent.executor.memo import canonical_json
+from metaagent.executor.workflow_signal import SignalHandler
+from metaagent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from metaagent.context import Context
+    from metaagent.executor.workflow import Workflow
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    workflow_id TEXT NOT NULL,
+    workflow TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    owner TEXT,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS runs_workflow_id ON runs (workflow_id);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    seq INTEGER,
+    kind TEXT NOT NULL,
+    task TEXT,
+    payload BLOB,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_run_id ON events (run_id);
+"""
+
+TASK_STARTED = "task_started"
+TASK_COMPLETED = "task_completed"
+TASK_FAILED = "task_failed"
+STATE = "state"
+RUN_COMPLETED = "run_completed"
+
+DEFAULT_LEASE_SECONDS = 30.0
+"""How long a run stays claimed without its owner renewing the lease"""
+
+
+def _owner_alive(owner: str) -> bool:
+    """Whether the process that claimed a run may still be running it."""
+    host, _, pid = owner.partition(":")
+    pid = pid.partition(":")[0]
+    if host != socket.gethostname() or not pid.isdigit() or int(pid) == os.getpid():
+        # Other hosts, and other runs of this process, are judged by their lease
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+class WorkflowJournal:
+    """Append-only SQLite journal of workflow runs, task results and state snapshots."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        # WAL with synchronous=NORMAL survives process crashes without an fsync per entry
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(runs)")}
+        for column, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+            if column not in columns:
+                # Journals created before runs were leased
+                self._conn.execute(f"ALTER TABLE runs ADD COLUMN {column} {kind}")
+        self._lock = threading.Lock()
+
+    def claim_run(
+        self,
+        workflow_id: str,
+        workflow: str,
+        owner: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    ) -> Tuple[str, bool]:
+        """
+        Claim the most recent unfinished run of `workflow_id` that no live owner
+        holds, or create a new run if there is none. Returns `(run_id, resumed)`.
+        """
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, so two claimants cannot both win
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                rows = self._conn.execute(
+                    "SELECT run_id, owner, lease_until FROM runs WHERE workflow_id = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM events "
+                    "WHERE events.run_id = runs.run_id AND kind = ?) "
+                    "ORDER BY rowid DESC",
+                    (workflow_id, RUN_COMPLETED),
+                ).fetchall()
+                for run_id, holder, lease_until in rows:
+                    if holder is None or (lease_until or 0) < now or not _owner_alive(holder):
+                        self._conn.execute(
+                            "UPDATE runs SET owner = ?, lease_until = ? WHERE run_id = ?",
+                            (owner, now + lease_seconds, run_id),
+                        )
+                        self._conn.execute("COMMIT")
+                        return run_id, True
+
+                run_id = uuid.uuid4().hex
+                self._conn.execute(
+                    "INSERT INTO runs (run_id, workflow_id, workflow, created_at, owner, lease_until) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (run_id, workflow_id, workflow, now, owner, now + lease_seconds),
+                )
+                self._conn.execute("COMMIT")
+                return run_id, False
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def renew_lease(self, run_id: str, owner: str, lease_seconds: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET lease_until = ? WHERE run_id = ? AND owner = ?",
+                (time.time() + lease_seconds, run_id, owner),
+            )
+
+    def release_run(self, run_id: str, owner: str) -> None:
+        """Give up the claim on a run, so that it can be resumed right away."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET owner = NULL, lease_until = NULL WHERE run_id = ? AND owner = ?",
+                (run_id, owner),
+            )
+
+    def load(self, run_id: str) -> Tuple[Dict[int, Tuple[str, bytes]], bytes | None]:
+        """Return the completed task results by sequence number and the last state snapshot."""
+        completed: Dict[int, Tuple[str, bytes]] = {}
+        state = None
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, kind, task, payload FROM events "
+                "WHERE run_id = ? AND kind IN (?, ?) ORDER BY id",
+                (run_id, TASK_COMPLETED, STATE),
+            ).fetchall()
+        for seq, kind, task, payload in rows:
+            if kind == TASK_COMPLETED:
+                completed[seq] = (task, payload)
+            else:
+                state = payload
+        return completed, state
+
+    def append(
+        self,
+        run_id: str,
+        kind: str,
+        seq: int | None = None,
+        task: str | None = None,
+        payload: bytes | None = None,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO events (run_id, seq, kind, task, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (run_id, seq, kind, task, payload, time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class DurableRun:
+    """A workflow run in progress, with the journaled results it can replay."""
+
+    def __init__(
+        self,
+        journal: WorkflowJournal,
+        run_id: str,
+        workflow_id: str,
+        completed: Dict[int, Tuple[str, bytes]],
+        state: bytes | None,
+    ):
+        self.journal = journal
+        self.run_id = run_id
+        self.workflow_id = workflow_id
+        self.completed = completed
+        self.state = state
+        self.replayed = 0
+        self._seq = itertools.count()
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self.completed) or self.state is not None
+
+    def next_seq(self) -> int:
+        return next(self._seq)
+
+
+_current_run: ContextVar[DurableRun | None] = ContextVar("metaagent_durable_run", default=None)
+
+
+class DurableExecutor(AsyncioExecutor):
+    """
+    AsyncioExecutor that journals workflow runs so they can resume after a restart.
+    Tasks executed outside a `Workflow.run` behave exactly as with AsyncioExecutor.
+    """
+
+    def __init__(
+        self,
+        journal_path: str | Path = "workflows.journal.db",
+        config: ExecutorConfig | None = None,
+        signal_bus: SignalHandler | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        context: Optional["Context"] = None,
+    ):
+        """
+        Args:
+            journal_path: SQLite file that journals task results and workflow state
+            config: Executor configuration
+            signal_bus: Signal handler for workflow signals
+            lease_seconds: How long a run stays claimed if this process stops renewing it
+            context: Application context
+        """
+        super().__init__(config=config, signal_bus=signal_bus, context=context)
+        self.execution_engine = "durable"
+        self.journal = WorkflowJournal(journal_path)
+        self.lease_seconds = lease_seconds
+
+    async def _renew_lease(self, run_id: str, owner: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            await asyncio.to_thread(self.journal.renew_lease, run_id, owner, self.lease_seconds)
+
+    @asynccontextmanager
+    async def workflow_run(self, workflow_id: str, workflow: str) -> AsyncIterator[DurableRun]:
+        """
+        Resume an unfinished run of `workflow_id` that no one else is running, or
+        start a new one, for the duration of the block. The run is marked completed
+        if the block exits normally.
+        """
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        # Journal reads and writes run in threads, off the event loop
+        run_id, resumed = await asyncio.to_thread(
+            self.journal.claim_run, workflow_id, workflow, owner, self.lease_seconds
+        )
+        completed, state = (
+            await asyncio.to_thread(self.journal.load, run_id) if resumed else ({}, None)
+        )
+
+        run = DurableRun(self.journal, run_id, workflow_id, completed, state)
+        if run.resumed:
+            logger.info(
+                f"Resuming workflow {workflow_id} (run {run_id}) with "
+                f"{len(completed)} completed tasks"
+            )
+        renewal = asyncio.ensure_future(self._renew_lease(run_id, owner))
+        token = _current_run.set(run)
+        try:
+            yield run
+            await asyncio.to_thread(self.journal.append, run_id, RUN_COMPLETED)
+        finally:
+            _current_run.reset(token)
+            renewal.cancel()
+            await asyncio.to_thread(self.journal.release_run, run_id, owner)
+
+    async def run_workflow(
+        self,
+        workflow: "Workflow",
+        run: Callable[..., Coroutine[Any, Any, R]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> R:
+        """Run `workflow.run` durably, restoring its state if the run is resumed."""
+        workflow_id = workflow.state.metadata.get("workflow_id")
+        if workflow_id is None:
+            try:
+                arguments = canonical_json([args, kwargs])
+            except TypeError as e:
+                logger.warning(
+                    f"Running {workflow.name} without durability: set a workflow_id "
+                    f"in its metadata ({e})"
+                )
+                return await run(workflow, *args, **kwargs)
+            digest = hashlib.sha256(arguments.encode()).hexdigest()[:16]
+            workflow_id = f"{workflow.name}:{digest}"
+
+        async with self.workflow_run(str(workflow_id), workflow.name) as durable_run:
+            if durable_run.state is not None:
+                workflow.state = pickle.loads(durable_run.state)
+            result = await run(workflow, *args, **kwargs)
+            await self.record_state(workflow.state)
+            return result
+
+    async def record_state(self, state: Any) -> None:
+        """Journal a snapshot of the current run's workflow state."""
+        run = _current_run.get()
+        if run is None:
+            return
+        try:
+            payload = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Workflow state of {run.workflow_id} cannot be journaled: {e}")
+            return
+        await asyncio.to_thread(run.journal.append, run.run_id, STATE, payload=payload)
+
+    async def _execute_task(
+        self, task: Callable[..., R] | Coroutine[Any, Any, R], **kwargs: Any
+    ) -> R | BaseException:
+        run = _current_run.get()
+        if run is None:
+            return await super()._execute_task(task, **kwargs)
+
+        # Assigned before the first await, so tasks started together keep their order
+        seq = run.next_seq()
+        name = _task_name(task)
+        entry = run.completed.get(seq)
+        if entry is not None:
+            if entry[0] == name:
+                if asyncio.iscoroutine(task):
+                    task.close()
+                run.replayed += 1
+                return pickle.loads(entry[1])
+            logger.warning(
+                f"Workflow {run.workflow_id} started {name} as task {seq}, but the "
+                f"journal has {entry[0]}; re-executing it. Workflows must start their "
+                "tasks in a deterministic order to be replayed."
+            )
+
+        await asyncio.to_thread(run.journal.append, run.run_id, TASK_STARTED, seq, name)
+        result = await super()._execute_task(task, **kwargs)
+        if isinstance(result, BaseException):
+            await asyncio.to_thread(
+                run.journal.append, run.run_id, TASK_FAILED, seq, name, repr(result).encode()
+            )
+            return result
+
+        try:
+            payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # Not replayable; the task will run again if the workflow resumes
+            logger.debug(f"Result of {name} cannot be journaled: {e}")
+            return result
+        await asyncio.to_thread(run.journal.append, run.run_id, TASK_COMPLETED, seq, name, payload)
+        return result
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        self.journal.close()
@@ -1,14 +1,21 @@
 import asyncio
 import functools
+import inspect
+import math
+import time
 from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
+from collections import deque
+from contextlib import asynccontextmanager, nullcontext
 from datetime import timedelta
 from typing import (
     Any,
+    AsyncIterable,
     AsyncIterator,
     Callable,
     Coroutine,
+    Deque,
     Dict,
+    Iterable,
     List,
     Optional,
     Type,
@@ -19,6 +26,21 @@ from typing import (
 from pydantic import BaseModel, ConfigDict
 
 from metaagent.context_dependent import ContextDependent
+from metaagent.executor.memo import MemoStore, memo_key
+from metaagent.executor.process_pool import ProcessPool
+from metaagent.executor.scheduler import DEFAULT_KEY, FairScheduler, current_scheduling
+from metaagent.executor.task_policy import (
+    RetryPolicy,
+    TaskTimeoutError,
+    annotate_failure,
+    to_seconds,
+    current_deadline,
+    deadline,
+)
+from metaagent.executor.task_timing import current_task_timing, timing_task
+from metaagent.executor.thread_pool import ThreadPool
+from metaagent.executor.worker_pool import WorkerPool
+from metaagent.executor.workflow_task import TaskPool, get_execution_metadata
 from metaagent.executor.workflow_signal import (
     AsyncioSignalHandler,
     Signal,
@@ -26,22 +48,144 @@ from metaagent.executor.workflow_signal import (
     SignalValueT,
 )
 from metaagent.logging.logger import get_logger
+from metaagent.logging.metrics import metrics
+from metaagent.logging.profiling import profiler
+from metaagent.logging.tracing import telemetry
 
 if TYPE_CHECKING:
     from metaagent.context import Context
 
 logger = get_logger(__name__)
 
+_queued_tasks = metrics.gauge(
+    "executor_queued_tasks",
+    "Tasks waiting for an executor concurrency slot",
+    ["engine"],
+)
+_running_tasks = metrics.gauge(
+    "executor_running_tasks",
+    "Tasks currently running in the executor",
+    ["engine"],
+)
+
 # Type variable for the return type of tasks
 R = TypeVar("R")
 
+_TASK_SPAN_NAME = "metaagent.executor.task"
+
+
+async def _aiter_chunks(
+    inputs: Iterable[Any] | AsyncIterable[Any], chunk_size: int
+) -> AsyncIterator[List[Any]]:
+    """Lazily group a (sync or async) iterable into lists of up to chunk_size items."""
+    chunk: List[Any] = []
+    if isinstance(inputs, AsyncIterable):
+        async for item in inputs:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for item in inputs:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _next_completed(tasks: Deque[asyncio.Task], ordered: bool) -> List[Any]:
+    """Wait for the next task (the oldest one if ordered) and return its results."""
+    if ordered:
+        results = await tasks[0]
+        tasks.popleft()
+        return results
+
+    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    results = []
+    for task in done:
+        tasks.remove(task)
+        results.extend(task.result())
+    return results
+
+
+_EXHAUSTED = object()
+
+
+def _is_task_source(value: Any) -> bool:
+    """Whether an execute_streaming argument is an iterable of tasks rather than a task."""
+    if isinstance(value, AsyncIterable):
+        return True
+    # Not asyncio.iscoroutine, which also accepts plain generators before Python 3.12
+    return isinstance(value, Iterable) and not callable(value) and not inspect.iscoroutine(value)
+
+
+class _TaskSource:
+    """Pulls tasks one at a time from a sync or async iterable."""
+
+    def __init__(self, source: Iterable[Any] | AsyncIterable[Any]):
+        if isinstance(source, AsyncIterable):
+            self._async_iterator = source.__aiter__()
+            self._iterator = None
+        else:
+            self._async_iterator = None
+            self._iterator = iter(source)
+
+    async def next(self) -> Any:
+        if self._iterator is not None:
+            return next(self._iterator, _EXHAUSTED)
+        try:
+            return await self._async_iterator.__anext__()
+        except StopAsyncIteration:
+            return _EXHAUSTED
+
+
+def _task_name(task: Callable[..., Any] | Coroutine[Any, Any, Any]) -> str:
+    """Readable name of a task (coroutine or callable) for diagnostics."""
+    if asyncio.iscoroutine(task):
+        return task.__qualname__
+    if isinstance(task, functools.partial):
+        task = task.func
+    return getattr(task, "__qualname__", None) or type(task).__name__
+
 
 class ExecutorConfig(BaseModel):
     """Configuration for executors."""
 
     max_concurrent_activities: int | None = None  # Unbounded by default
-    timeout_seconds: timedelta | None = None  # No timeout by default
-    retry_policy: Dict[str, Any] | None = None
+    # Default overall timeout of a task, across all attempts. No timeout by default
+    timeout_seconds: timedelta | None = None
+    # Default RetryPolicy (or its fields as a dict) for tasks without their own. No retries by default
+    retry_policy: Dict[str, Any] | RetryPolicy | None = None
+
+    # How max_concurrent_activities slots are shared between sessions/workflows
+    # (see metaagent.executor.scheduler). Keys not listed get weight 1.
+    scheduler_weights: Dict[str, float] = {}
+    # Waiting tasks gain one priority level per this many seconds; None disables aging
+    scheduler_aging_seconds: float | None = 5.0
+
+    # Pool for synchronous tasks whose @workflow_task metadata doesn't set `pool`.
+    # With "workers", async @workflow_task functions run in the worker processes too
+    default_pool: TaskPool = "thread"
+    # Named thread pools and their sizes, e.g. {"io": 32, "disk": 4}, so that one slow
+    # class of blocking work cannot starve the others. Naming a pool "thread" replaces
+    # the event loop's default thread pool.
+    thread_pools: Dict[str, int] = {}
+    process_pool_workers: int | None = None  # Number of CPUs by default
+    # Module-level functions run once in every worker process (e.g. to preload models)
+    process_pool_warmup: List[Callable[[], Any]] = []
+    process_pool_max_tasks_per_child: int | None = None  # Never recycle workers by default
+    # Worker processes with their own event loops for pool="workers" tasks
+    worker_pool_workers: int | None = None  # Number of CPUs by default
+    worker_pool_warmup: List[Callable[[], Any]] = []
+    # How many times a task is resubmitted after the worker running it died
+    worker_pool_crash_retries: int = 1
+
+    # SQLite file for memoized @workflow_task(memoize=True) results; None disables memoization
+    memo_path: str | None = None
+    memo_ttl_seconds: float | None = None  # Keep results forever by default
+    memo_max_bytes: int | None = None  # No size limit by default
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
@@ -60,12 +204,8 @@ class Executor(ABC, ContextDependent):
         super().__init__(context=context, **kwargs)
         self.execution_engine = engine
 
-        if config:
-            self.config = config
-        else:
-            # TODO: saqadri - executor config should be loaded from settings
-            # ctx = get_current_context()
-            self.config = ExecutorConfig()
+        # initialize_context builds the config from the `executor` settings
+        self.config = config or ExecutorConfig()
 
         self.signal_bus = signal_bus
 
@@ -97,35 +237,69 @@ class Executor(ABC, ContextDependent):
     async def map(
         self,
         func: Callable[..., R],
-        inputs: List[Any],
+        inputs: Iterable[Any] | AsyncIterable[Any],
         **kwargs: Any,
     ) -> List[R | BaseException]:
         """
         Run `func(item)` for each item in `inputs` with concurrency limit.
+        Results are returned in input order; see `map_streaming` for the options
+        and for consuming results without holding them all in memory.
         """
-        results: List[R, BaseException] = []
-
-        async def run(item):
-            if self.config.max_concurrent_activities:
-                semaphore = asyncio.Semaphore(self.config.max_concurrent_activities)
-                async with semaphore:
-                    return await self.execute(functools.partial(func, item), **kwargs)
-            else:
-                return await self.execute(functools.partial(func, item), **kwargs)
+        return [result async for result in self.map_streaming(func, inputs, **kwargs)]
 
-        coros = [run(x) for x in inputs]
-        # gather all, each returns a single-element list
-        list_of_lists = await asyncio.gather(*coros, return_exceptions=True)
+    async def map_streaming(
+        self,
+        func: Callable[..., R],
+        inputs: Iterable[Any] | AsyncIterable[Any],
+        ordered: bool = True,
+        max_concurrency: int | None = None,
+        chunk_size: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[R | BaseException]:
+        """
+        Run `func(item)` for each item in `inputs`, yielding results as they are produced.
+
+        Inputs are consumed lazily through a sliding window of in-flight tasks,
+        so memory stays bounded by the window regardless of how many inputs there are.
+
+        Args:
+            func: Function applied to each input (sync or async)
+            inputs: Any iterable or async iterable of inputs
+            ordered: Yield results in input order (a slow item holds back later
+                results) instead of in completion order
+            max_concurrency: Maximum number of in-flight tasks. Defaults to
+                `max_concurrent_activities`; without either, every input is submitted
+                as soon as it is read. Set it to bound memory for large inputs
+            chunk_size: Submit inputs to the executor in batches of this many items;
+                the window then counts batches
+            **kwargs: Passed through to `execute`
+        """
+        window = max_concurrency or self.config.max_concurrent_activities or math.inf
 
-        # Flatten results
-        for entry in list_of_lists:
-            if isinstance(entry, list):
-                results.extend(entry)
-            else:
-                # Means we got an exception at the gather level
-                results.append(entry)
+        async def run_chunk(chunk: List[Any]) -> List[R | BaseException]:
+            try:
+                return await self.execute(
+                    *(functools.partial(func, item) for item in chunk), **kwargs
+                )
+            except Exception as e:
+                # Means execute itself failed; report it for every item of the batch
+                return [e] * len(chunk)
 
-        return results
+        tasks: Deque[asyncio.Task] = deque()
+        try:
+            async for chunk in _aiter_chunks(inputs, chunk_size or 1):
+                tasks.append(asyncio.ensure_future(run_chunk(chunk)))
+                while len(tasks) >= window:
+                    for result in await _next_completed(tasks, ordered):
+                        yield result
+
+            while tasks:
+                for result in await _next_completed(tasks, ordered):
+                    yield result
+        finally:
+            # The consumer stopped early (or failed); don't leave work running
+            for task in tasks:
+                task.cancel()
 
     async def validate_task(
         self, task: Callable[..., R] | Coroutine[Any, Any, R]
@@ -188,51 +362,282 @@ class AsyncioExecutor(Executor):
         self,
         config: ExecutorConfig | None = None,
         signal_bus: SignalHandler | None = None,
+        context: Optional["Context"] = None,
     ):
         signal_bus = signal_bus or AsyncioSignalHandler()
-        super().__init__(engine="asyncio", config=config, signal_bus=signal_bus)
+        super().__init__(
+            engine="asyncio", config=config, signal_bus=signal_bus, context=context
+        )
 
-        self._activity_semaphore: asyncio.Semaphore | None = None
+        self._scheduler: FairScheduler | None = None
         if self.config.max_concurrent_activities is not None:
-            self._activity_semaphore = asyncio.Semaphore(
-                self.config.max_concurrent_activities
+            self._scheduler = FairScheduler(
+                self.config.max_concurrent_activities,
+                weights=self.config.scheduler_weights,
+                aging_seconds=self.config.scheduler_aging_seconds,
             )
 
+        self._process_pool: ProcessPool | None = None
+        self._worker_pool: WorkerPool | None = None
+        self._thread_pools: Dict[str, ThreadPool] = {}
+        self._memo_store: MemoStore | None = None
+        self._retry_policy = RetryPolicy.from_value(self.config.retry_policy)
+        for name, size in self.config.thread_pools.items():
+            if name in ("process", "workers"):
+                raise ValueError(f'"{name}" is reserved for the {name} pool')
+            self._thread_pools[name] = ThreadPool(name, size)
+
+    @property
+    def process_pool(self) -> ProcessPool:
+        """Process pool for CPU-bound synchronous tasks, created on first use."""
+        if self._process_pool is None:
+            self._process_pool = ProcessPool(
+                max_workers=self.config.process_pool_workers,
+                warmup=self.config.process_pool_warmup,
+                max_tasks_per_child=self.config.process_pool_max_tasks_per_child,
+            )
+        return self._process_pool
+
+    @property
+    def worker_pool(self) -> WorkerPool:
+        """Worker processes running pool="workers" tasks, created on first use."""
+        if self._worker_pool is None:
+            self._worker_pool = WorkerPool(
+                workers=self.config.worker_pool_workers,
+                warmup=self.config.worker_pool_warmup,
+                crash_retries=self.config.worker_pool_crash_retries,
+            )
+        return self._worker_pool
+
+    @property
+    def memo_store(self) -> MemoStore | None:
+        """Store of memoized task results, opened on first use if `memo_path` is set."""
+        if self._memo_store is None and self.config.memo_path:
+            self._memo_store = MemoStore(
+                self.config.memo_path,
+                ttl_seconds=self.config.memo_ttl_seconds,
+                max_bytes=self.config.memo_max_bytes,
+            )
+        return self._memo_store
+
+    async def run_in_pool(
+        self, pool: TaskPool, func: Callable[..., R], *args: Any, **kwargs: Any
+    ) -> R:
+        """Run the blocking function `func(*args, **kwargs)` in the named pool."""
+        if pool in self._thread_pools:
+            return await self._thread_pools[pool].run(func, *args, **kwargs)
+        if pool == "process":
+            return await self.process_pool.run(func, *args, **kwargs)
+        if pool == "workers":
+            return await self.worker_pool.run(func, *args, **kwargs)
+        if pool == "thread":
+            loop = asyncio.get_running_loop()
+            timing = current_task_timing()
+            submitted_at = time.perf_counter()
+
+            def call() -> R:
+                if timing is not None:
+                    timing.pool_wait += time.perf_counter() - submitted_at
+                return func(*args, **kwargs)
+
+            return await loop.run_in_executor(None, call)
+        raise ValueError(
+            f"Unknown executor pool '{pool}'. Configure it in ExecutorConfig.thread_pools "
+            f"(configured: {sorted(self._thread_pools)})"
+        )
+
+    def shutdown(self) -> None:
+        """Release executor resources (worker processes and named thread pools)."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+        for pool in self._thread_pools.values():
+            pool.shutdown()
+        if self._memo_store is not None:
+            self._memo_store.close()
+            self._memo_store = None
+
+    def _runs_in_workers(self, task: Callable[..., Any]) -> bool:
+        metadata = get_execution_metadata(task)
+        pool = metadata.get("pool")
+        if pool is None and metadata:
+            pool = self.config.default_pool
+        return pool == "workers"
+
     async def _execute_task(
         self, task: Callable[..., R] | Coroutine[Any, Any, R], **kwargs: Any
     ) -> R | BaseException:
         async def run_task(task: Callable[..., R] | Coroutine[Any, Any, R]) -> R:
-            try:
-                if asyncio.iscoroutine(task):
-                    return await task
-                elif asyncio.iscoroutinefunction(task):
-                    return await task(**kwargs)
-                else:
-                    # Execute the callable and await if it returns a coroutine
-                    loop = asyncio.get_running_loop()
+            if asyncio.iscoroutine(task):
+                return await task
+            elif self._runs_in_workers(task):
+                return await self.worker_pool.run(task, **kwargs)
+            elif asyncio.iscoroutinefunction(task):
+                return await task(**kwargs)
+            else:
+                pool = get_execution_metadata(task).get("pool") or self.config.default_pool
+                result = await self.run_in_pool(pool, task, **kwargs)
+
+                # Handle case where the sync function returns a coroutine
+                if asyncio.iscoroutine(result):
+                    return await result
 
-                    # If kwargs are provided, wrap the function with partial
-                    if kwargs:
-                        wrapped_task = functools.partial(task, **kwargs)
-                        result = await loop.run_in_executor(None, wrapped_task)
-                    else:
-                        result = await loop.run_in_executor(None, task)
+                return result
 
-                    # Handle case where the sync function returns a coroutine
-                    if asyncio.iscoroutine(result):
-                        return await result
+        span_cm = telemetry.start_span(_TASK_SPAN_NAME) or nullcontext()
+        with timing_task(_task_name(task)) as timing, span_cm as span:
+            memo = memo_key(task, kwargs) if self.config.memo_path else None
+            if memo is None:
+                result = await self._run_with_policy(task, run_task)
+            else:
+                # A hit skips the task entirely, including waiting for a concurrency slot
+                name, key = memo
+                hit, result = await self.memo_store.aget(key)
+                if hit:
+                    timing.memo_hit = True
+                else:
+                    result = await self._run_with_policy(task, run_task)
+                    if not isinstance(result, BaseException):
+                        await self.memo_store.aput(key, name, result)
 
-                    return result
+            timing.finish(ok=not isinstance(result, BaseException))
+            if span is not None and span.is_recording():
+                span.set_attributes(timing.span_attributes())
+            return result
+
+    async def _run_with_policy(
+        self,
+        task: Callable[..., R] | Coroutine[Any, Any, R],
+        run_task: Callable[[Any], Coroutine[Any, Any, R]],
+    ) -> R | BaseException:
+        """
+        Run a task under its timeouts, inherited deadline and retry policy. A failed
+        task returns the exception of its last attempt (see `annotate_failure`).
+        """
+        metadata = get_execution_metadata(task)
+        policy = (
+            RetryPolicy.from_value(metadata["retry_policy"])
+            if metadata.get("retry_policy") is not None
+            else self._retry_policy
+        )
+        overall = to_seconds(
+            metadata.get("schedule_to_close_timeout") or self.config.timeout_seconds
+        )
+        attempt_timeout = to_seconds(metadata.get("start_to_close_timeout"))
+
+        loop = asyncio.get_running_loop()
+        task_deadline = current_deadline()
+        if overall is not None:
+            candidate = loop.time() + overall
+            task_deadline = candidate if task_deadline is None else min(task_deadline, candidate)
+
+        # A coroutine object can only be awaited once, so it cannot be retried.
+        # 0 attempts means no limit other than the task deadline
+        max_attempts = 1 if asyncio.iscoroutine(task) else max(0, policy.maximum_attempts)
+        timing = current_task_timing()
+        first_started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            started = time.perf_counter()
+            waited = timing.slot_wait + timing.pool_wait if timing is not None else 0.0
+            try:
+                return await self._run_task_in_slot(
+                    task, run_task, attempt_timeout, task_deadline
+                )
             except Exception as e:
-                # TODO: saqadri - adding logging or other error handling here
-                return e
+                error = e
+            finally:
+                if timing is not None:
+                    # Run time is the attempt minus what it spent waiting for a slot or a thread
+                    waited = timing.slot_wait + timing.pool_wait - waited
+                    timing.run += time.perf_counter() - started - waited
+                    timing.attempts += 1
+
+            delay = policy.backoff(attempt)
+            if (
+                (max_attempts and attempt >= max_attempts)
+                or not policy.is_retryable(error)
+                or (task_deadline is not None and loop.time() + delay >= task_deadline)
+            ):
+                return annotate_failure(
+                    error, _task_name(task), attempt, time.perf_counter() - first_started
+                )
+            logger.debug(
+                f"Retrying {_task_name(task)} in {delay:.2f}s after attempt {attempt} "
+                f"failed: {type(error).__name__}: {error}"
+            )
+            await asyncio.sleep(delay)
 
-        if self._activity_semaphore:
-            async with self._activity_semaphore:
-                return await run_task(task)
+    async def _run_task_in_slot(
+        self,
+        task: Callable[..., R] | Coroutine[Any, Any, R],
+        run_task: Callable[[Any], Coroutine[Any, Any, R]],
+        attempt_timeout: float | None = None,
+        task_deadline: float | None = None,
+    ) -> R:
+        queued = _queued_tasks.labels(self.execution_engine)
+        running = _running_tasks.labels(self.execution_engine)
+        stage = f"executor.task {_task_name(task)}" if profiler.enabled else ""
+        if self._scheduler:
+            scope = current_scheduling()
+            key = scope.key or (self._context and self._context.session_id) or DEFAULT_KEY
+            priority = scope.priority
+            if priority is None:
+                priority = get_execution_metadata(task).get("priority", 0)
+            submitted_at = time.perf_counter()
+            with queued.track_inprogress():
+                await self._scheduler.acquire(key, priority, scope.weight)
+            timing = current_task_timing()
+            if timing is not None:
+                timing.slot_wait += time.perf_counter() - submitted_at
+            try:
+                with running.track_inprogress(), profiler.stage(stage):
+                    return await self._run_attempt(task, run_task, attempt_timeout, task_deadline)
+            finally:
+                self._scheduler.release()
         else:
+            with running.track_inprogress(), profiler.stage(stage):
+                return await self._run_attempt(task, run_task, attempt_timeout, task_deadline)
+
+    async def _run_attempt(
+        self,
+        task: Callable[..., R] | Coroutine[Any, Any, R],
+        run_task: Callable[[Any], Coroutine[Any, Any, R]],
+        attempt_timeout: float | None,
+        task_deadline: float | None,
+    ) -> R:
+        """Run one attempt, cancelling it if it outlives its timeout or the task deadline."""
+        loop = asyncio.get_running_loop()
+        timeout, deadline_bound = attempt_timeout, False
+        if task_deadline is not None:
+            remaining = task_deadline - loop.time()
+            if timeout is None or remaining < timeout:
+                timeout, deadline_bound = remaining, True
+        if timeout is None:
             return await run_task(task)
 
+        if timeout <= 0:
+            if asyncio.iscoroutine(task):
+                task.close()
+            raise TaskTimeoutError(_task_name(task), 0.0, deadline_exceeded=True)
+
+        started = loop.time()
+        # Child tasks started by this one inherit what is left of its budget
+        with deadline(timeout):
+            try:
+                return await asyncio.wait_for(run_task(task), timeout)
+            except asyncio.TimeoutError as e:
+                if isinstance(e, TaskTimeoutError) or loop.time() - started < timeout:
+                    # Raised by the task itself, not by our timeout
+                    raise
+                raise TaskTimeoutError(
+                    _task_name(task), timeout, deadline_exceeded=deadline_bound
+                ) from None
+
     async def execute(
         self,
         *tasks: Callable[..., R] | Coroutine[Any, Any, R],
@@ -247,24 +652,48 @@ class AsyncioExecutor(Executor):
 
     async def execute_streaming(
         self,
-        *tasks: List[Callable[..., R] | Coroutine[Any, Any, R]],
+        *tasks: Callable[..., R] | Coroutine[Any, Any, R],
+        max_concurrency: int | None = None,
         **kwargs: Any,
     ) -> AsyncIterator[R | BaseException]:
+        """
+        Execute tasks and yield results as they complete.
+
+        Tasks may also be given as a single (async) iterable, which is consumed lazily:
+        with `max_concurrency` (default `max_concurrent_activities`) at most that many
+        tasks are in flight, and the next one starts only when another completes.
+        Without a limit every task starts at once.
+        """
+        if len(tasks) == 1 and _is_task_source(tasks[0]):
+            source = tasks[0]
+        else:
+            source = tasks
+        window = max_concurrency or self.config.max_concurrent_activities or math.inf
+
         # TODO: saqadri - validate if async with self.execution_context() is needed here
         async with self.execution_context():
-            # Create futures for all tasks
-            futures = [
-                asyncio.create_task(self._execute_task(task, **kwargs))
-                for task in tasks
-            ]
-            pending = set(futures)
-
-            while pending:
-                done, pending = await asyncio.wait(
-                    pending, return_when=asyncio.FIRST_COMPLETED
-                )
-                for future in done:
-                    yield await future
+            # Finished tasks are queued by their done callbacks, so each completion is O(1)
+            completed: asyncio.Queue[asyncio.Task] = asyncio.Queue()
+            in_flight: set[asyncio.Task] = set()
+            iterator = _TaskSource(source)
+            try:
+                while True:
+                    while len(in_flight) < window:
+                        task = await iterator.next()
+                        if task is _EXHAUSTED:
+                            break
+                        future = asyncio.ensure_future(self._execute_task(task, **kwargs))
+                        future.add_done_callback(completed.put_nowait)
+                        in_flight.add(future)
+                    if not in_flight:
+                        return
+                    future = await completed.get()
+                    in_flight.discard(future)
+                    yield future.result()
+            finally:
+                # The consumer stopped early (or failed); don't leave work running
+                for future in in_flight:
+                    future.cancel()
 
     async def signal(
         self,
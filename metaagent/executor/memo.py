@@ -0,0 +1,279 @@
+"""
+Durable memoization of @workflow_task results in a local SQLite database.
+
+Tasks opt in with `@workflow_task(memoize=True)` and executors opt in with
+`ExecutorConfig.memo_path`. Results are keyed by:
+- the task name
+- the task's code version: `memo_version` if given, otherwise a hash of the
+  function's source, so editing a task invalidates its cached results
+- a canonical hash of its arguments
+- for methods, the identity of the instance: its `memo_key()` if it defines
+  one, otherwise a canonical hash of the instance itself (pydantic models and
+  dataclasses). Methods of other objects are not memoized, since two instances
+  in different states would otherwise share results
+
+so re-running a workflow after a crash or a code change elsewhere skips the
+tasks that already finished. Entries expire after `ttl_seconds`, and the least
+recently used entries are evicted once the store grows past `max_bytes`.
+
+Only successful results are stored. Tasks whose arguments cannot be hashed
+canonically, or whose results cannot be pickled, simply run uncached.
+"""
+
+import asyncio
+import dataclasses
+import functools
+import hashlib
+import inspect
+import json
+import pickle
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+from pydantic import BaseModel
+
+from metaagent.executor.workflow_task import get_execution_metadata
+from metaagent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    key TEXT PRIMARY KEY,
+    task TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS memo_accessed_at ON memo (accessed_at);
+CREATE INDEX IF NOT EXISTS memo_created_at ON memo (created_at);
+"""
+
+
+def _canonical(value: Any) -> Any:
+    """Convert arguments to a JSON-serializable form that is stable across runs."""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, bytes):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, Enum):
+        return {"__enum__": f"{type(value).__qualname__}.{value.name}"}
+    if isinstance(value, (datetime, date)):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"__timedelta__": value.total_seconds()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": sorted(json.dumps(_canonical(item), sort_keys=True) for item in value)}
+    if isinstance(value, dict):
+        return {
+            "__dict__": sorted(
+                (json.dumps(_canonical(k), sort_keys=True), _canonical(v))
+                for k, v in value.items()
+            )
+        }
+    if isinstance(value, BaseModel):
+        return {type(value).__qualname__: _canonical(value.model_dump(mode="json"))}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {type(value).__qualname__: _canonical(dataclasses.asdict(value))}
+    raise TypeError(f"Cannot hash argument of type {type(value).__name__} for memoization")
+
+
+def canonical_json(value: Any) -> str:
+    """Serialize (argument) values to a canonical JSON string; raises TypeError if unsupported."""
+    return json.dumps(_canonical(value), sort_keys=True)
+
+
+@functools.lru_cache(maxsize=1024)
+def _code_version(func: Callable[..., Any]) -> str:
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        code = getattr(func, "__code__", None)
+        source = repr((code.co_code, code.co_consts)) if code else repr(func)
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+def _instance_identity(instance: Any) -> Any:
+    """Stable identity of the object a memoized method is bound to; raises TypeError if it has none."""
+    if isinstance(instance, type):
+        return {"__class__": f"{instance.__module__}.{instance.__qualname__}"}
+    custom = getattr(instance, "memo_key", None)
+    if callable(custom):
+        return {type(instance).__qualname__: _canonical(custom())}
+    try:
+        return _canonical(instance)
+    except TypeError:
+        raise TypeError(
+            f"Cannot identify the {type(instance).__name__} instance of a memoized method; "
+            "define memo_key() on it"
+        ) from None
+
+
+def memo_key(task: Callable[..., Any], kwargs: Dict[str, Any]) -> Tuple[str, str] | None:
+    """
+    Return `(task name, key)` for a memoizable task call, or None if the task
+    doesn't opt in or its arguments cannot be hashed canonically.
+    """
+    metadata = get_execution_metadata(task)
+    if not metadata.get("memoize") or asyncio.iscoroutine(task):
+        return None
+
+    args: Tuple[Any, ...] = ()
+    call_kwargs = dict(kwargs)
+    func = task
+    while hasattr(func, "func") and hasattr(func, "args"):
+        args = tuple(func.args) + args
+        call_kwargs = {**func.keywords, **call_kwargs}
+        func = func.func
+    instance = getattr(func, "__self__", None) if hasattr(func, "__func__") else None
+    func = getattr(func, "__func__", func)
+
+    name = metadata.get("activity_name") or func.__qualname__
+    version = metadata.get("memo_version") or _code_version(func)
+    try:
+        if instance is None:
+            arguments = canonical_json([args, call_kwargs])
+        else:
+            arguments = canonical_json([_instance_identity(instance), args, call_kwargs])
+    except TypeError as e:
+        logger.debug(f"Not memoizing {name}: {e}")
+        return None
+    digest = hashlib.sha256(f"{name}\0{version}\0{arguments}".encode()).hexdigest()
+    return name, digest
+
+
+class MemoStore:
+    """SQLite-backed store of pickled task results with TTL and size-based LRU eviction."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            ttl_seconds: Entries older than this are ignored and purged. None keeps them forever
+            max_bytes: Evict least recently used entries once stored results exceed this size
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM memo"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return `(True, value)` for a live entry, `(False, None)` otherwise."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, value FROM memo WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None
+            created_at, blob = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._delete(key)
+                return False, None
+            self._conn.execute("UPDATE memo SET accessed_at = ? WHERE key = ?", (now, key))
+        try:
+            return True, pickle.loads(blob)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable memoized result {key}: {e}")
+            with self._lock:
+                self._delete(key)
+            return False, None
+
+    def put(self, key: str, task: str, value: Any) -> bool:
+        """Store a result. Returns False if it cannot be pickled."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"Not memoizing result of {task}: {e}")
+            return False
+
+        now = time.time()
+        with self._lock:
+            self._delete(key)
+            self._conn.execute(
+                "INSERT INTO memo (key, task, created_at, accessed_at, size, value) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, task, now, now, len(blob), blob),
+            )
+            self._total_bytes += len(blob)
+            self._evict(now)
+        return True
+
+    def _delete(self, key: str) -> None:
+        row = self._conn.execute("SELECT size FROM memo WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM memo WHERE key = ?", (key,))
+            self._total_bytes -= row[0]
+
+    def _evict(self, now: float) -> None:
+        if self.ttl_seconds is not None:
+            cutoff = now - self.ttl_seconds
+            expired = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM memo WHERE created_at < ?", (cutoff,)
+            ).fetchone()[0]
+            if expired:
+                self._conn.execute("DELETE FROM memo WHERE created_at < ?", (cutoff,))
+                self._total_bytes -= expired
+        if self.max_bytes is None or self._total_bytes <= self.max_bytes:
+            return
+        # Oldest-accessed first, until we are back under the limit
+        rows = self._conn.execute("SELECT key, size FROM memo ORDER BY accessed_at").fetchall()
+        evict = []
+        for key, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            evict.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM memo WHERE key = ?", evict)
+
+    def clear(self, task: str | None = None) -> int:
+        """Delete all entries, or only those of one task. Returns the number deleted."""
+        with self._lock:
+            if task is None:
+                count = self._conn.execute("DELETE FROM memo").rowcount
+            else:
+                count = self._conn.execute("DELETE FROM memo WHERE task = ?", (task,)).rowcount
+            self._total_bytes = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM memo"
+            ).fetchone()[0]
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        """Number of entries and total size of stored results."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM memo").fetchone()[0]
+            return {"entries": entries, "bytes": self._total_bytes}
+
+    async def aget(self, key: str) -> Tuple[bool, Any]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, task: str, value: Any) -> bool:
+        return await asyncio.to_thread(self.put, key, task, value)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
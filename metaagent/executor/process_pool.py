@@ -0,0 +1,154 @@
+"""
+Process pool for CPU-bound synchronous tasks run by AsyncioExecutor.
+
+Tasks and their arguments are pickled once in the parent, so anything that
+cannot cross the process boundary fails fast with a TaskNotPicklableError that
+names the task, instead of an opaque error from inside concurrent.futures.
+
+Workers run the configured warm-up hooks once when they start (e.g. to preload
+models) and are replaced after `max_tasks_per_child` tasks to bound memory growth.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Sequence, TypeVar
+
+R = TypeVar("R")
+
+
+class TaskNotPicklableError(TypeError):
+    """Raised when a task, its arguments or its result cannot be pickled for a process pool."""
+
+
+def _task_name(func: Callable[..., Any]) -> str:
+    while hasattr(func, "func") and hasattr(func, "args"):
+        func = func.func
+    return getattr(func, "__qualname__", None) or type(func).__name__
+
+
+def _run_warmup_hooks(hooks: Sequence[Callable[[], Any]]) -> None:
+    """Worker initializer: run each warm-up hook once per worker process."""
+    for hook in hooks:
+        hook()
+
+
+def _call_pickled(payload: bytes) -> bytes:
+    """Worker entry point: unpickle and run a task, returning its pickled result."""
+    func, args, kwargs = pickle.loads(payload)
+    result = func(*args, **kwargs)
+    try:
+        return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise TaskNotPicklableError(
+            f"Result of process-pool task '{_task_name(func)}' "
+            f"({type(result).__name__}) cannot be pickled: {e}"
+        ) from None
+
+
+def _noop() -> None:
+    return None
+
+
+class ProcessPool:
+    """
+    Lazily started process pool.
+
+    On Python 3.11+ workers are recycled by ProcessPoolExecutor itself; on older
+    versions the whole pool is replaced once it has run
+    `max_tasks_per_child * max_workers` tasks.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        warmup: Sequence[Callable[[], Any]] = (),
+        max_tasks_per_child: int | None = None,
+        start_method: str = "spawn",
+    ):
+        """
+        Args:
+            max_workers: Number of worker processes. Defaults to the number of CPUs
+            warmup: Module-level functions run once in every worker when it starts
+            max_tasks_per_child: Replace a worker after it has run this many tasks
+            start_method: multiprocessing start method ("spawn" is safe with threads and event loops)
+        """
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.warmup: List[Callable[[], Any]] = list(warmup)
+        self.max_tasks_per_child = max_tasks_per_child
+        self.start_method = start_method
+
+        self._pool: ProcessPoolExecutor | None = None
+        self._submitted = 0
+        self._lock = threading.Lock()
+
+        for hook in self.warmup:
+            self._check_picklable(hook, f"Warm-up hook '{_task_name(hook)}'")
+
+    @staticmethod
+    def _check_picklable(obj: Any, what: str) -> bytes:
+        try:
+            return pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            raise TaskNotPicklableError(
+                f"{what} cannot be sent to a process pool: {e}. "
+                "Process-pool tasks and warm-up hooks must be module-level functions, "
+                "and their arguments must be picklable (no lambdas, closures, locks, "
+                "open files or clients)."
+            ) from None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        kwargs: dict[str, Any] = {}
+        if self.max_tasks_per_child and sys.version_info >= (3, 11):
+            kwargs["max_tasks_per_child"] = self.max_tasks_per_child
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=_run_warmup_hooks if self.warmup else None,
+            initargs=(tuple(self.warmup),) if self.warmup else (),
+            **kwargs,
+        )
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if (
+                self._pool is not None
+                and self.max_tasks_per_child
+                and sys.version_info < (3, 11)
+                and self._submitted >= self.max_tasks_per_child * self.max_workers
+            ):
+                # Let in-flight tasks finish in the old pool; new tasks go to a fresh one
+                self._pool.shutdown(wait=False)
+                self._pool = None
+            if self._pool is None:
+                self._pool = self._new_pool()
+                self._submitted = 0
+            self._submitted += 1
+            return self._pool
+
+    async def warm_up(self) -> None:
+        """Start every worker (and run its warm-up hooks) now rather than on first use."""
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        await asyncio.gather(
+            *(loop.run_in_executor(pool, _noop) for _ in range(self.max_workers))
+        )
+
+    async def run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Run `func(*args, **kwargs)` in a worker process and return its result."""
+        payload = self._check_picklable(
+            (func, args, kwargs), f"Task '{_task_name(func)}' (or its arguments)"
+        )
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._get_pool(), _call_pickled, payload)
+        return pickle.loads(result)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,352 @@
+"""
+Shared token-bucket rate limiter for provider quotas (requests and tokens per minute).
+
+Limits are keyed by provider or model. A call to "openai/gpt-4o-mini" takes from
+every bucket that matches: "openai/gpt-4o-mini", "gpt-4o-mini" and "openai". Callers
+wait (asynchronously, or blocking for synchronous code) until their request fits
+instead of firing it and failing with a 429.
+
+    from metaagent.executor.rate_limiter import rate_limiter
+
+    rate_limiter.set_limit("openai", requests_per_minute=500, tokens_per_minute=200_000)
+    waited = await rate_limiter.acquire("openai/gpt-4o-mini", tokens=1200)
+
+Waits are reservations: each caller takes its share immediately (a bucket may go
+into debt) and sleeps until the debt is repaid, so waiters are served in arrival
+order and no lock is held while sleeping.
+
+Limits adapt to the provider's rate-limit response headers (OpenAI's
+x-ratelimit-*, Anthropic's anthropic-ratelimit-*, retry-after): buckets follow the
+reported limits when none is configured, never assume more remaining capacity than
+reported, and pause until the reported reset after a 429.
+
+Metrics:
+- rate_limit_wait_seconds{key}: time callers waited for a rate limit
+- rate_limit_waited_seconds_total{key}: total time spent waiting
+"""
+
+import asyncio
+import functools
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Tuple
+
+from metaagent.logging.metrics import metrics
+
+if TYPE_CHECKING:
+    from metaagent.config import RateLimiterSettings
+
+_wait = metrics.histogram(
+    "rate_limit_wait_seconds",
+    "Time callers waited for a provider rate limit",
+    ["key"],
+)
+_waited_total = metrics.counter(
+    "rate_limit_waited_seconds_total",
+    "Total time spent waiting for provider rate limits",
+    ["key"],
+)
+
+REQUESTS = "requests"
+TOKENS = "tokens"
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+# Per-minute limit of a bucket that only carries a retry-after pause
+_UNLIMITED = 1e12
+
+
+class _Bucket:
+    """Token bucket holding up to one minute of quota, refilled continuously."""
+
+    def __init__(self, per_minute: float, configured: bool):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        # Configured limits are not overridden by the limits providers report
+        self.configured = configured
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def set_limit(self, per_minute: float) -> None:
+        self._refill(time.monotonic())
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = min(self.level, per_minute)
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` and return how long the caller must wait for it."""
+        self._refill(now)
+        # A single request larger than the bucket could never fit; let it through when the bucket is full
+        self.level -= min(amount, self.capacity)
+        wait = -self.level / self.rate if self.level < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+    def adjust(self, amount: float) -> None:
+        """Take `amount` more (or give back, if negative) without waiting."""
+        self._refill(time.monotonic())
+        self.level = min(self.capacity, self.level - amount)
+
+    def observe(self, remaining: float | None, reset: float | None, now: float) -> None:
+        self._refill(now)
+        if remaining is not None:
+            self.level = min(self.level, remaining)
+            if remaining <= 0 and reset:
+                self.blocked_until = max(self.blocked_until, now + reset)
+
+    def block(self, seconds: float, now: float) -> None:
+        self._refill(now)
+        self.level = min(self.level, 0.0)
+        self.blocked_until = max(self.blocked_until, now + seconds)
+
+
+def _parse_reset(value: str, now: datetime) -> float | None:
+    """Seconds until a reset given as "6m0s"/"20ms" (OpenAI), seconds, or an RFC 3339 time (Anthropic)."""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION.findall(value)
+    if parts:
+        return sum(float(number) * _UNITS[unit] for number, unit in parts)
+    try:
+        return max(0.0, (datetime.fromisoformat(value.replace("Z", "+00:00")) - now).total_seconds())
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(headers: Mapping[str, str], now: datetime) -> float | None:
+    if "retry-after-ms" in headers:
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - now).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize provider rate-limit headers to {"requests": (limit, remaining, reset),
+    "tokens": (...), "retry_after": seconds}; missing values are None.
+    """
+    normalized: Dict[str, str] = {}
+    for name, value in (headers or {}).items():
+        name = name.lower()
+        # litellm passes provider headers through with this prefix
+        if name.startswith("llm_provider-"):
+            name = name[len("llm_provider-"):]
+        normalized.setdefault(name, str(value))
+
+    now = datetime.now(timezone.utc)
+
+    def number(name: str) -> float | None:
+        try:
+            return float(normalized[name])
+        except (KeyError, ValueError):
+            return None
+
+    parsed: Dict[str, Any] = {}
+    for kind in (REQUESTS, TOKENS):
+        limit = number(f"x-ratelimit-limit-{kind}")
+        remaining = number(f"x-ratelimit-remaining-{kind}")
+        reset = normalized.get(f"x-ratelimit-reset-{kind}")
+        if limit is None and remaining is None:
+            limit = number(f"anthropic-ratelimit-{kind}-limit")
+            remaining = number(f"anthropic-ratelimit-{kind}-remaining")
+            reset = normalized.get(f"anthropic-ratelimit-{kind}-reset")
+        parsed[kind] = (limit, remaining, _parse_reset(reset, now) if reset else None)
+    parsed["retry_after"] = _parse_retry_after(normalized, now)
+    return parsed
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute buckets keyed by provider or model."""
+
+    def __init__(self, adapt_to_headers: bool = True):
+        self.adapt_to_headers = adapt_to_headers
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, settings: "RateLimiterSettings | None") -> None:
+        """Apply the `rate_limits` section of the application settings."""
+        if settings is None:
+            return
+        self.adapt_to_headers = settings.adapt_to_headers
+        for key, limit in settings.limits.items():
+            self.set_limit(
+                key,
+                requests_per_minute=limit.requests_per_minute,
+                tokens_per_minute=limit.tokens_per_minute,
+            )
+
+    def set_limit(
+        self,
+        key: str,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ) -> None:
+        """Limit calls to a provider ("openai") or model ("gpt-4o", "openai/gpt-4o")."""
+        with self._lock:
+            for kind, per_minute in ((REQUESTS, requests_per_minute), (TOKENS, tokens_per_minute)):
+                if per_minute is None:
+                    self._buckets.pop((key, kind), None)
+                elif (key, kind) in self._buckets:
+                    bucket = self._buckets[(key, kind)]
+                    bucket.set_limit(per_minute)
+                    bucket.configured = True
+                else:
+                    self._buckets[(key, kind)] = _Bucket(per_minute, configured=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    @staticmethod
+    def _candidates(key: str) -> List[str]:
+        candidates = [key]
+        if "/" in key:
+            provider, model = key.split("/", 1)
+            candidates += [model, provider]
+        return list(dict.fromkeys(candidates))
+
+    def _reserve(self, key: str, requests: float, tokens: float) -> float:
+        now = time.monotonic()
+        wait = 0.0
+        with self._lock:
+            for candidate in self._candidates(key):
+                for kind, amount in ((REQUESTS, requests), (TOKENS, tokens)):
+                    bucket = self._buckets.get((candidate, kind))
+                    if bucket is not None and amount:
+                        wait = max(wait, bucket.reserve(amount, now))
+        return wait
+
+    def _record(self, key: str, waited: float) -> None:
+        _wait.labels(key).observe(waited)
+        if waited:
+            _waited_total.labels(key).inc(waited)
+
+    async def acquire(self, key: str, requests: float = 1, tokens: float = 0) -> float:
+        """Wait until `requests` requests and `tokens` tokens fit the limits of `key`; returns the wait in seconds."""
+        wait = self._reserve(key, requests, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self._record(key, wait)
+        return wait
+
+    def acquire_sync(self, key: str, requests: float = 1, tokens: float = 0) -> float:
+        """Blocking `acquire`, for synchronous callers."""
+        wait = self._reserve(key, requests, tokens)
+        if wait > 0:
+            time.sleep(wait)
+        self._record(key, wait)
+        return wait
+
+    def settle(self, key: str, estimated_tokens: float, actual_tokens: float) -> None:
+        """Correct the tokens taken by `acquire` once a call reports its actual usage."""
+        if actual_tokens == estimated_tokens:
+            return
+        with self._lock:
+            for candidate in self._candidates(key):
+                bucket = self._buckets.get((candidate, TOKENS))
+                if bucket is not None:
+                    bucket.adjust(actual_tokens - estimated_tokens)
+
+    def update_from_headers(self, key: str, headers: Mapping[str, Any] | None) -> None:
+        """Adapt the limits of `key` to the rate-limit headers of a provider response (or 429 error)."""
+        if not headers or not self.adapt_to_headers:
+            return
+        parsed = parse_rate_limit_headers(headers)
+        now = time.monotonic()
+        with self._lock:
+            for kind in (REQUESTS, TOKENS):
+                limit, remaining, reset = parsed[kind]
+                bucket = self._buckets.get((key, kind))
+                if bucket is None and limit:
+                    bucket = self._buckets[(key, kind)] = _Bucket(limit, configured=False)
+                    # The new bucket starts full; `remaining` below brings it in line
+                elif bucket is not None and limit and not bucket.configured and limit != bucket.capacity:
+                    bucket.set_limit(limit)
+                if bucket is not None:
+                    bucket.observe(remaining, reset, now)
+        if parsed["retry_after"]:
+            self.pause(key, parsed["retry_after"])
+
+    def pause(self, key: str, seconds: float) -> None:
+        """Make every caller of `key` wait `seconds` (e.g. for a 429's retry-after)."""
+        now = time.monotonic()
+        with self._lock:
+            buckets = [
+                bucket
+                for candidate in self._candidates(key)
+                for kind in (REQUESTS, TOKENS)
+                if (bucket := self._buckets.get((candidate, kind))) is not None
+            ]
+            if not buckets:
+                # Nothing is known about the quota; a bucket that only carries the pause
+                buckets = [self._buckets.setdefault((key, REQUESTS), _Bucket(_UNLIMITED, configured=False))]
+            for bucket in buckets:
+                bucket.block(seconds, now)
+
+    def rejected(self, key: str, headers: Mapping[str, Any] | None, fallback_seconds: float = 1.0) -> None:
+        """Record a 429 for `key`: adapt to its headers and pause for its retry-after (or `fallback_seconds`)."""
+        retry_after = parse_rate_limit_headers(headers)["retry_after"] if headers else None
+        self.update_from_headers(key, headers)
+        if not (retry_after and self.adapt_to_headers):
+            self.pause(key, fallback_seconds)
+
+    def observe_response(
+        self, key: str, status: int, headers: Mapping[str, Any] | None, fallback_seconds: float = 1.0
+    ) -> None:
+        """Feed an HTTP response from `key` to its limits: a 429 pauses callers, any other status adapts to the headers."""
+        if status == 429:
+            self.rejected(key, headers, fallback_seconds=fallback_seconds)
+        else:
+            self.update_from_headers(key, headers)
+
+    def limited(self, key: str, requests: float = 1) -> Callable:
+        """
+        Decorator that acquires one request of `key` before each call of a sync or async function.
+        Sync functions block while they wait, so code running on an event loop should
+        call them with `asyncio.to_thread` (as the search tools' `asearch()` does) or
+        decorate async functions instead.
+        """
+
+        def decorator(func: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    await self.acquire(key, requests=requests)
+                    return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                self.acquire_sync(key, requests=requests)
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+rate_limiter = RateLimiter()
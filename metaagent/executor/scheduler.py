@@ -0,0 +1,261 @@
+"""
+Priority and weighted fair-share scheduling of executor concurrency slots.
+
+When many sessions share one executor, a plain semaphore hands slots out in
+arrival order, so a session that fans out hundreds of tasks delays everyone
+else. FairScheduler instead queues waiting tasks per key (session or workflow
+id) and, whenever a slot frees up, picks the next task by:
+
+1. Priority (lower runs first), raised by one level for every `aging_seconds`
+   a task has waited, so low-priority tasks cannot starve
+2. Weighted fair queuing across keys (start-time fair queuing): each key is
+   charged 1/weight of virtual time per task it runs, and the key with the
+   least virtual time goes next
+3. Arrival order
+
+Tasks pick up their key, priority and weight from the enclosing `scheduling()`
+scope, e.g.:
+
+    with scheduling(key=session_id, priority=1):
+        await executor.execute(...)
+
+Queue wait and queue depth are exported per priority level (keys are session or
+workflow ids, too many to label by) as `executor_schedule_wait_seconds{priority}`
+and `executor_scheduled_queued_tasks{priority}`.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Deque, Dict, Iterator, NamedTuple, Tuple
+
+from metaagent.logging.metrics import metrics
+
+DEFAULT_KEY = "default"
+"""Key of tasks that run outside any scheduling scope and without a session id"""
+
+_schedule_wait = metrics.histogram(
+    "executor_schedule_wait_seconds",
+    "Time tasks waited for an executor concurrency slot, per task priority",
+    ["priority"],
+)
+_scheduled_queued = metrics.gauge(
+    "executor_scheduled_queued_tasks",
+    "Tasks waiting for an executor concurrency slot, per task priority",
+    ["priority"],
+)
+
+
+class SchedulingScope(NamedTuple):
+    key: str | None = None
+    priority: int | None = None
+    weight: float | None = None
+
+
+_current_scope: ContextVar[SchedulingScope] = ContextVar(
+    "metaagent_scheduling_scope", default=SchedulingScope()
+)
+
+
+@contextmanager
+def scheduling(
+    key: str | None = None, priority: int | None = None, weight: float | None = None
+) -> Iterator[SchedulingScope]:
+    """
+    Set the scheduling key, priority and/or weight of executor tasks started in this block.
+    Unset values are inherited from the enclosing scope.
+
+    Args:
+        key: Fair-share key, usually a session or workflow id
+        priority: Task priority; lower values run first (default 0)
+        weight: Share of the executor for this key relative to other keys (default 1)
+    """
+    outer = _current_scope.get()
+    scope = SchedulingScope(
+        key=key if key is not None else outer.key,
+        priority=priority if priority is not None else outer.priority,
+        weight=weight if weight is not None else outer.weight,
+    )
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def current_scheduling() -> SchedulingScope:
+    """The scheduling scope of the current task."""
+    return _current_scope.get()
+
+
+class _Waiter:
+    __slots__ = ("future", "priority", "seq", "enqueued_at")
+
+    def __init__(self, future: asyncio.Future, priority: int, seq: int):
+        self.future = future
+        self.priority = priority
+        self.seq = seq
+        self.enqueued_at = time.monotonic()
+
+
+class _KeyState:
+    __slots__ = ("key", "weight", "finish", "queues", "waiting")
+
+    def __init__(self, key: str, weight: float):
+        self.key = key
+        self.weight = weight
+        # Virtual time at which this key's last dispatched task "finishes"
+        self.finish = 0.0
+        # FIFO queue per priority level
+        self.queues: Dict[int, Deque[_Waiter]] = {}
+        self.waiting = 0
+
+
+class FairScheduler:
+    """
+    Hands out a fixed number of concurrency slots by priority and weighted fair share.
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        weights: Dict[str, float] | None = None,
+        aging_seconds: float | None = 5.0,
+    ):
+        """
+        Args:
+            capacity: Number of tasks that may hold a slot at once
+            weights: Fair-share weight per key; keys not listed get weight 1
+            aging_seconds: Raise a waiting task's priority by one level per this many
+                seconds of waiting. None disables aging
+        """
+        if capacity < 1:
+            raise ValueError("FairScheduler capacity must be at least 1")
+        self.capacity = capacity
+        self.weights = dict(weights or {})
+        self.aging_seconds = aging_seconds
+
+        self._available = capacity
+        self._waiting = 0
+        self._virtual_time = 0.0
+        self._keys: Dict[str, _KeyState] = {}
+        self._seq = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        """Number of tasks waiting for a slot."""
+        return self._waiting
+
+    def _key_state(self, key: str, weight: float | None) -> _KeyState:
+        state = self._keys.get(key)
+        if state is None:
+            state = self._keys[key] = _KeyState(key, self.weights.get(key, 1.0))
+        if weight is not None:
+            state.weight = weight
+        return state
+
+    def _charge(self, state: _KeyState) -> None:
+        start = max(self._virtual_time, state.finish)
+        state.finish = start + 1.0 / state.weight
+        self._virtual_time = start
+
+    async def acquire(
+        self, key: str = DEFAULT_KEY, priority: int = 0, weight: float | None = None
+    ) -> None:
+        """Wait for a slot for a task of `key`."""
+        state = self._key_state(key, weight)
+        if self._available > 0 and not self._waiting:
+            self._available -= 1
+            self._charge(state)
+            _schedule_wait.labels(str(priority)).observe(0.0)
+            return
+
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), priority, next(self._seq))
+        state.queues.setdefault(priority, deque()).append(waiter)
+        state.waiting += 1
+        _scheduled_queued.labels(str(priority)).inc()
+        self._waiting += 1
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was granted just as we were cancelled; pass it on
+                self.release()
+            else:
+                self._remove(state, waiter)
+            raise
+
+    def _remove(self, state: _KeyState, waiter: _Waiter) -> None:
+        queue = state.queues.get(waiter.priority)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if not queue:
+            del state.queues[waiter.priority]
+        state.waiting -= 1
+        _scheduled_queued.labels(str(waiter.priority)).dec()
+        self._waiting -= 1
+        self._forget_if_idle(state)
+
+    def _forget_if_idle(self, state: _KeyState) -> None:
+        # Idle keys with no outstanding share of virtual time carry no state worth keeping
+        if not state.waiting and state.finish <= self._virtual_time:
+            self._keys.pop(state.key, None)
+
+    def release(self) -> None:
+        """Return a slot and hand it to the next waiting task, if any."""
+        self._available += 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._available > 0 and self._waiting:
+            now = time.monotonic()
+            best: Tuple[float, float, int] | None = None
+            best_state: _KeyState | None = None
+            best_priority = 0
+            for state in self._keys.values():
+                if not state.waiting:
+                    continue
+                start = max(self._virtual_time, state.finish)
+                for priority, queue in state.queues.items():
+                    head = queue[0]
+                    effective = priority
+                    if self.aging_seconds:
+                        effective -= int((now - head.enqueued_at) / self.aging_seconds)
+                    rank = (effective, start, head.seq)
+                    if best is None or rank < best:
+                        best, best_state, best_priority = rank, state, priority
+
+            queue = best_state.queues[best_priority]
+            waiter = queue.popleft()
+            if not queue:
+                del best_state.queues[best_priority]
+            best_state.waiting -= 1
+            _scheduled_queued.labels(str(best_priority)).dec()
+            self._waiting -= 1
+            if waiter.future.done():
+                # Cancelled while queued but not yet removed
+                continue
+
+            self._available -= 1
+            self._charge(best_state)
+            _schedule_wait.labels(str(best_priority)).observe(now - waiter.enqueued_at)
+            waiter.future.set_result(None)
+
+        for state in [s for s in self._keys.values() if not s.waiting]:
+            self._forget_if_idle(state)
+
+    @asynccontextmanager
+    async def slot(
+        self, key: str = DEFAULT_KEY, priority: int = 0, weight: float | None = None
+    ) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire(key, priority, weight)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,158 @@
+"""
+Timeouts, deadlines and retry policies for tasks run by AsyncioExecutor.
+
+- Deadlines propagate: a task runs under the deadline of whatever started it
+  (see `deadline()`), so child tasks only get the remaining budget.
+- `schedule_to_close_timeout` (or `ExecutorConfig.timeout_seconds`) bounds a task
+  across all its attempts; `start_to_close_timeout` bounds each attempt.
+- Retries back off exponentially with jitter, and only for retryable exceptions.
+
+Timed-out async tasks are cancelled. Synchronous tasks cannot be interrupted once
+their thread or process has picked them up; they are abandoned (and tasks still
+queued in a named thread pool never start).
+"""
+
+import asyncio
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import Any, Dict, Iterator, List, Type, Union
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
+
+ErrorType = Union[str, Type[BaseException]]
+
+_deadline: ContextVar[float | None] = ContextVar("metaagent_task_deadline", default=None)
+
+
+def annotate_failure(error: BaseException, task_name: str, attempts: int, elapsed: float) -> BaseException:
+    """
+    Record how a task failed on the exception of its last attempt, which is what the
+    executor returns: `task_attempts` and `task_elapsed` (seconds, across attempts)
+    attributes, plus a note in the traceback on Python 3.11+.
+    """
+    try:
+        error.task_attempts = attempts
+        error.task_elapsed = elapsed
+    except AttributeError:
+        # Exception types with __slots__
+        pass
+    if hasattr(error, "add_note"):
+        error.add_note(
+            f"Task {task_name} failed after {attempts} attempt{'s' if attempts != 1 else ''} "
+            f"in {elapsed:.3f}s"
+        )
+    return error
+
+
+class TaskTimeoutError(asyncio.TimeoutError):
+    """A task attempt ran past its timeout or the deadline it inherited."""
+
+    def __init__(self, task_name: str, timeout: float, deadline_exceeded: bool = False):
+        reason = "deadline exceeded" if deadline_exceeded else "timed out"
+        super().__init__(f"Task {task_name} {reason} after {timeout:.3f}s")
+        self.task_name = task_name
+        self.timeout = timeout
+        self.deadline_exceeded = deadline_exceeded
+
+
+def to_seconds(value: float | timedelta | None) -> float | None:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value
+
+
+@contextmanager
+def deadline(seconds: float | timedelta | None) -> Iterator[float | None]:
+    """
+    Run the block (and every task it starts) with at most `seconds` left.
+    An enclosing, earlier deadline still applies.
+    """
+    seconds = to_seconds(seconds)
+    current = _deadline.get()
+    if seconds is not None:
+        candidate = asyncio.get_running_loop().time() + seconds
+        current = candidate if current is None else min(current, candidate)
+    token = _deadline.set(current)
+    try:
+        yield current
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> float | None:
+    """Loop time by which the current task must finish, if any."""
+    return _deadline.get()
+
+
+def remaining_time() -> float | None:
+    """Seconds left before the current deadline, if any."""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return max(0.0, current - asyncio.get_running_loop().time())
+
+
+def _matches(error: BaseException, types: List[ErrorType]) -> bool:
+    for error_type in types:
+        if isinstance(error_type, str):
+            if any(
+                error_type in (cls.__name__, f"{cls.__module__}.{cls.__qualname__}")
+                for cls in type(error).__mro__
+            ):
+                return True
+        elif isinstance(error, error_type):
+            return True
+    return False
+
+
+class RetryPolicy(BaseModel):
+    """
+    Retry policy for a task, given as `ExecutorConfig.retry_policy` or
+    `@workflow_task(retry_policy=...)` (a dict with these fields, or a RetryPolicy).
+    Intervals are in seconds. Error types are classes or class names (plain or qualified).
+    """
+
+    # 0 means unlimited, as with Temporal: retry until the schedule-to-close deadline
+    maximum_attempts: int = Field(
+        default=1, validation_alias=AliasChoices("maximum_attempts", "max_attempts")
+    )
+    initial_interval: float = 1.0
+    backoff_coefficient: float = 2.0
+    maximum_interval: float | None = None  # 100 x initial_interval by default
+    jitter: float = 0.2  # Each delay is scaled by a random factor in [1 - jitter, 1 + jitter]
+    retryable_error_types: List[ErrorType] = []  # Any Exception by default
+    non_retryable_error_types: List[ErrorType] = []
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
+
+    @field_validator("initial_interval", "maximum_interval", mode="before")
+    @classmethod
+    def _to_seconds(cls, value: Any) -> Any:
+        return to_seconds(value)
+
+    @classmethod
+    def from_value(cls, value: "RetryPolicy | Dict[str, Any] | None") -> "RetryPolicy":
+        if value is None:
+            return cls()
+        if isinstance(value, RetryPolicy):
+            return value
+        return cls.model_validate(value)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if not isinstance(error, Exception):
+            return False
+        if isinstance(error, TaskTimeoutError) and error.deadline_exceeded:
+            return False
+        if _matches(error, self.non_retryable_error_types):
+            return False
+        return not self.retryable_error_types or _matches(error, self.retryable_error_types)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retrying after failed attempt number `attempt` (starting at 1)."""
+        maximum = self.maximum_interval or 100 * self.initial_interval
+        delay = min(self.initial_interval * self.backoff_coefficient ** (attempt - 1), maximum)
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, delay)
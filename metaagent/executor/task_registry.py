@@ -6,6 +6,8 @@ The user just writes standard functions annotated with @workflow_task, but behin
 
 from typing import Any, Callable, Dict, List
 
+from metaagent.executor.workflow_task import get_execution_metadata, registered_workflow_tasks
+
 
 class ActivityRegistry:
     """Centralized task/activity management with validation and metadata."""
@@ -22,6 +24,12 @@ class ActivityRegistry:
         self._activities[name] = func
         self._metadata[name] = metadata or {}
 
+    def register_workflow_tasks(self):
+        """Register every @workflow_task function defined so far that isn't registered yet."""
+        for name, func in registered_workflow_tasks().items():
+            if name not in self._activities:
+                self.register(name, func, get_execution_metadata(func))
+
     def get_activity(self, name: str) -> Callable:
         if name not in self._activities:
             raise KeyError(f"Activity '{name}' not found.")
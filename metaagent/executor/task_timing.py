@@ -0,0 +1,179 @@
+"""
+Per-task execution timing for AsyncioExecutor: where each task's latency went.
+
+For every task the executor records when it was enqueued and how long it spent
+
+- waiting for a concurrency slot (`max_concurrent_activities`),
+- waiting for a thread in its pool (synchronous tasks on thread pools), and
+- running (all attempts, excluding the waits above).
+
+They are exported as histograms keyed by task name, set as attributes on the
+task's span, and collected per workflow run: `Workflow.run` results carry a
+summary in `WorkflowResult.metadata["timing"]`, and `collect_task_timings()`
+does the same for any block of code.
+
+Metrics:
+- executor_task_latency_seconds{task}: enqueue to completion
+- executor_task_slot_wait_seconds{task}: waiting for a concurrency slot
+- executor_task_pool_wait_seconds{task}: waiting for a pool thread
+- executor_task_run_seconds{task}: running
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List
+
+from metaagent.logging.metrics import metrics
+
+_latency = metrics.histogram(
+    "executor_task_latency_seconds",
+    "Time from a task being enqueued to its completion",
+    ["task"],
+)
+_slot_wait = metrics.histogram(
+    "executor_task_slot_wait_seconds",
+    "Time a task waited for an executor concurrency slot",
+    ["task"],
+)
+_pool_wait = metrics.histogram(
+    "executor_task_pool_wait_seconds",
+    "Time a synchronous task waited for a thread in its pool",
+    ["task"],
+)
+_run = metrics.histogram(
+    "executor_task_run_seconds",
+    "Time a task spent running, across attempts",
+    ["task"],
+)
+
+_current_timing: ContextVar["TaskTiming | None"] = ContextVar(
+    "metaagent_task_timing", default=None
+)
+_current_collector: ContextVar["TaskTimings | None"] = ContextVar(
+    "metaagent_task_timings", default=None
+)
+
+_PHASES = ("latency", "slot_wait", "pool_wait", "run")
+
+
+class TaskTiming:
+    """Timing of one task run by the executor. Durations are in seconds."""
+
+    __slots__ = (
+        "name",
+        "enqueued_at",
+        "latency",
+        "slot_wait",
+        "pool_wait",
+        "run",
+        "attempts",
+        "memo_hit",
+        "ok",
+        "_started",
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self.enqueued_at = time.time()
+        self.latency = 0.0
+        self.slot_wait = 0.0
+        self.pool_wait = 0.0
+        self.run = 0.0
+        self.attempts = 0
+        self.memo_hit = False
+        self.ok = True
+        self._started = time.perf_counter()
+
+    def finish(self, ok: bool) -> None:
+        self.latency = time.perf_counter() - self._started
+        self.ok = ok
+        _latency.labels(self.name).observe(self.latency)
+        _slot_wait.labels(self.name).observe(self.slot_wait)
+        _pool_wait.labels(self.name).observe(self.pool_wait)
+        _run.labels(self.name).observe(self.run)
+        collector = _current_collector.get()
+        while collector is not None:
+            collector.timings.append(self)
+            collector = collector.parent
+
+    def span_attributes(self) -> Dict[str, Any]:
+        return {
+            "metaagent.task.name": self.name,
+            "metaagent.task.enqueued_at": self.enqueued_at,
+            "metaagent.task.latency_seconds": self.latency,
+            "metaagent.task.slot_wait_seconds": self.slot_wait,
+            "metaagent.task.pool_wait_seconds": self.pool_wait,
+            "metaagent.task.run_seconds": self.run,
+            "metaagent.task.attempts": self.attempts,
+            "metaagent.task.memo_hit": self.memo_hit,
+            "metaagent.task.ok": self.ok,
+        }
+
+
+def current_task_timing() -> TaskTiming | None:
+    """Timing of the task the caller is running in, if any."""
+    return _current_timing.get()
+
+
+@contextmanager
+def timing_task(name: str) -> Iterator[TaskTiming]:
+    """Record the timing of the task run inside the block."""
+    timing = TaskTiming(name)
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        _current_timing.reset(token)
+
+
+class TaskTimings:
+    """Timings of the tasks that finished inside a `collect_task_timings()` block."""
+
+    def __init__(self, parent: "TaskTimings | None" = None):
+        self.parent = parent
+        self.timings: List[TaskTiming] = []
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Totals, means and maxima of each phase per task name, plus overall totals:
+        {"tasks": n, "failed": n, "memo_hits": n, "totals": {...}, "by_task": {name: {...}}}
+        """
+        by_task: Dict[str, Dict[str, Any]] = {}
+        totals = {phase: 0.0 for phase in _PHASES}
+        for timing in self.timings:
+            entry = by_task.get(timing.name)
+            if entry is None:
+                entry = by_task[timing.name] = {"count": 0, "failed": 0, "attempts": 0}
+                for phase in _PHASES:
+                    entry[phase] = {"total": 0.0, "mean": 0.0, "max": 0.0}
+            entry["count"] += 1
+            entry["failed"] += not timing.ok
+            entry["attempts"] += timing.attempts
+            for phase in _PHASES:
+                value = getattr(timing, phase)
+                stats = entry[phase]
+                stats["total"] += value
+                stats["max"] = max(stats["max"], value)
+                totals[phase] += value
+        for entry in by_task.values():
+            for phase in _PHASES:
+                entry[phase]["mean"] = entry[phase]["total"] / entry["count"]
+        return {
+            "tasks": len(self.timings),
+            "failed": sum(not timing.ok for timing in self.timings),
+            "memo_hits": sum(timing.memo_hit for timing in self.timings),
+            "totals": totals,
+            "by_task": by_task,
+        }
+
+
+@contextmanager
+def collect_task_timings() -> Iterator[TaskTimings]:
+    """Collect the timings of every task that finishes inside the block (including nested blocks)."""
+    timings = TaskTimings(parent=_current_collector.get())
+    token = _current_collector.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_collector.reset(token)
@@ -6,8 +6,10 @@ Read more: https://docs.temporal.io/develop/python/core-application
 """
 
 import asyncio
+import dataclasses
 import functools
 import uuid
+from datetime import timedelta
 from typing import (
     Any,
     AsyncIterator,
@@ -16,16 +18,20 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     TYPE_CHECKING,
 )
 
 from pydantic import ConfigDict
 from temporalio import activity, workflow, exceptions
 from temporalio.client import Client as TemporalClient
+from temporalio.common import RetryPolicy as TemporalRetryPolicy
 from temporalio.worker import Worker
 
 from metaagent.config import TemporalSettings
 from metaagent.executor.executor import Executor, ExecutorConfig, R
+from metaagent.executor.task_policy import RetryPolicy
+from metaagent.executor.workflow_task import get_execution_metadata
 from metaagent.executor.workflow_signal import (
     BaseSignalHandler,
     Signal,
@@ -178,6 +184,60 @@ class TemporalExecutorConfig(ExecutorConfig, TemporalSettings):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+BATCH_ACTIVITY_NAME = "metaagent.batch_activities"
+"""Activity that runs several @workflow_task(batch=True) calls in one round trip"""
+
+
+def _to_timedelta(value: timedelta | float | None) -> timedelta | None:
+    if value is None or isinstance(value, timedelta):
+        return value
+    return timedelta(seconds=value)
+
+
+def to_temporal_retry_policy(
+    value: TemporalRetryPolicy | RetryPolicy | Dict[str, Any] | None,
+) -> TemporalRetryPolicy | None:
+    """Convert a RetryPolicy (or its fields as a dict) to Temporal's; fields left unset keep Temporal's defaults."""
+    if value is None or isinstance(value, TemporalRetryPolicy):
+        return value
+    policy = RetryPolicy.from_value(value)
+    fields = policy.model_fields_set
+    options: Dict[str, Any] = {}
+    if "initial_interval" in fields:
+        options["initial_interval"] = timedelta(seconds=policy.initial_interval)
+    if "backoff_coefficient" in fields:
+        options["backoff_coefficient"] = policy.backoff_coefficient
+    if "maximum_interval" in fields and policy.maximum_interval is not None:
+        options["maximum_interval"] = timedelta(seconds=policy.maximum_interval)
+    if "maximum_attempts" in fields:
+        options["maximum_attempts"] = policy.maximum_attempts
+    if policy.non_retryable_error_types:
+        options["non_retryable_error_types"] = [
+            t if isinstance(t, str) else t.__name__ for t in policy.non_retryable_error_types
+        ]
+    return TemporalRetryPolicy(**options)
+
+
+async def _heartbeat_every(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        activity.heartbeat()
+
+
+def _activity_name(task: Callable[..., Any]) -> str:
+    """The activity name of a task: from its @workflow_task metadata, else its module and qualified name."""
+    func = task
+    while isinstance(func, functools.partial):
+        func = func.func
+    return get_execution_metadata(func).get("activity_name") or f"{func.__module__}.{func.__qualname__}"
+
+
+def _activity_args(task: Callable[..., Any], kwargs: Dict[str, Any]) -> List[Any]:
+    """Positional activity arguments: those bound by functools.partial, then kwargs["args"]."""
+    args = list(task.args) if isinstance(task, functools.partial) else []
+    return args + list(kwargs.get("args", ()))
+
+
 class TemporalExecutor(Executor):
     """Executor that runs @workflows as Temporal workflows, with @workflow_tasks as Temporal activities"""
 
@@ -213,27 +273,126 @@ class TemporalExecutor(Executor):
     def wrap_as_activity(
         activity_name: str,
         func: Callable[..., R] | Coroutine[Any, Any, R],
+        heartbeat_interval: timedelta | float | None = None,
         **kwargs: Any,
     ) -> Coroutine[Any, Any, R]:
         """
         Convert a function into a Temporal activity and return its info.
+        With `heartbeat_interval`, the activity heartbeats that often while it runs
+        (synchronous functions then run in a thread so the heartbeats keep going).
         """
+        if heartbeat_interval is None:
+            heartbeat_interval = get_execution_metadata(func).get("heartbeat_interval")
+        heartbeat_interval = _to_timedelta(heartbeat_interval)
 
         @activity.defn(name=activity_name)
         async def wrapped_activity(*args, **local_kwargs):
+            heartbeat = None
+            if heartbeat_interval:
+                heartbeat = asyncio.create_task(
+                    _heartbeat_every(heartbeat_interval.total_seconds())
+                )
             try:
                 if asyncio.iscoroutinefunction(func):
                     return await func(*args, **local_kwargs)
                 elif asyncio.iscoroutine(func):
                     return await func
+                elif heartbeat is not None:
+                    return await asyncio.to_thread(func, *args, **local_kwargs)
                 else:
                     return func(*args, **local_kwargs)
             except Exception as e:
                 # Handle exceptions gracefully
                 raise e
+            finally:
+                if heartbeat is not None:
+                    heartbeat.cancel()
 
         return wrapped_activity
 
+    @staticmethod
+    def create_batch_activity(tasks: Dict[str, Callable[..., Any]]) -> Callable[..., Any]:
+        """
+        The activity that runs batches of @workflow_task(batch=True) calls, given the
+        task functions by activity name. Register it with the worker alongside them.
+        It heartbeats while it runs when scheduled with a heartbeat timeout.
+        """
+
+        def retryable(activity_name: str, error: BaseException) -> bool:
+            if isinstance(error, exceptions.ApplicationError) and error.non_retryable:
+                return False
+            metadata = get_execution_metadata(tasks[activity_name])
+            return RetryPolicy.from_value(metadata.get("retry_policy")).is_retryable(error)
+
+        @activity.defn(name=BATCH_ACTIVITY_NAME)
+        async def run_batch(calls: List[Tuple[str, List[Any]]]) -> List[Dict[str, Any]]:
+            async def run_one(activity_name: str, args: List[Any]) -> Any:
+                func = tasks[activity_name]
+                if asyncio.iscoroutinefunction(func):
+                    return await func(*args)
+                result = await asyncio.to_thread(func, *args)
+                if asyncio.iscoroutine(result):
+                    return await result
+                return result
+
+            heartbeat = None
+            heartbeat_timeout = activity.info().heartbeat_timeout
+            if heartbeat_timeout:
+                heartbeat = asyncio.create_task(
+                    _heartbeat_every(heartbeat_timeout.total_seconds() / 3)
+                )
+            try:
+                outcomes = await asyncio.gather(
+                    *(run_one(name, args) for name, args in calls), return_exceptions=True
+                )
+            finally:
+                if heartbeat is not None:
+                    heartbeat.cancel()
+            # One failed call must not fail (and retry) the whole batch; the workflow retries it alone
+            return [
+                {
+                    "error": type(outcome).__name__,
+                    "message": str(outcome),
+                    "retryable": retryable(name, outcome),
+                }
+                if isinstance(outcome, BaseException)
+                else {"value": outcome}
+                for (name, _), outcome in zip(calls, outcomes)
+            ]
+
+        return run_batch
+
+    def _activity_options(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Options shared by execute_activity and execute_local_activity for a task's metadata."""
+        options: Dict[str, Any] = {
+            "schedule_to_close_timeout": _to_timedelta(
+                metadata.get("schedule_to_close_timeout", self.config.timeout_seconds)
+            ),
+            "start_to_close_timeout": _to_timedelta(metadata.get("start_to_close_timeout")),
+            "retry_policy": to_temporal_retry_policy(metadata.get("retry_policy")),
+        }
+        if metadata.get("local"):
+            if options["schedule_to_close_timeout"] is None and options["start_to_close_timeout"] is None:
+                # Temporal requires a timeout for local activities
+                options["start_to_close_timeout"] = timedelta(
+                    seconds=self.config.local_activity_timeout
+                )
+        else:
+            options["task_queue"] = self.config.task_queue
+            options["heartbeat_timeout"] = _to_timedelta(metadata.get("heartbeat_timeout"))
+        return {key: value for key, value in options.items() if value is not None}
+
+    async def _run_activity(self, activity_name: str, args: List[Any], local: bool, **options: Any) -> Any:
+        try:
+            if local:
+                return await workflow.execute_local_activity(activity_name, args=args, **options)
+            return await workflow.execute_activity(activity_name, args=args, **options)
+        except Exception as e:
+            # Properly propagate activity errors
+            if isinstance(e, exceptions.ActivityError):
+                raise e.cause if e.cause else e
+            raise
+
     async def _execute_task_as_async(
         self, task: Callable[..., R] | Coroutine[Any, Any, R], **kwargs: Any
     ) -> R | BaseException:
@@ -280,37 +439,92 @@ class TemporalExecutor(Executor):
             )
 
         execution_metadata: Dict[str, Any] = getattr(func, "execution_metadata", {})
-
-        # Derive stable activity name, e.g. module + qualname
-        activity_name = execution_metadata.get("activity_name")
-        if not activity_name:
-            activity_name = f"{func.__module__}.{func.__qualname__}"
-
-        schedule_to_close = execution_metadata.get(
-            "schedule_to_close_timeout", self.config.timeout_seconds
+        activity_name = _activity_name(func)
+
+        options = {**self._activity_options(execution_metadata), **kwargs}
+        options.pop("args", None)
+        return await self._run_activity(
+            activity_name,
+            _activity_args(task, kwargs),
+            local=bool(execution_metadata.get("local")),
+            **options,
         )
 
-        retry_policy = execution_metadata.get("retry_policy", None)
-
-        _task_activity = self.wrap_as_activity(activity_name=activity_name, func=task)
-
-        # # For partials, we pass the partial's arguments
-        # args = task.args if isinstance(task, functools.partial) else ()
+    def _plan_batches(self, tasks) -> Tuple[List[int], List[List[int]]]:
+        """Split task indexes into tasks run on their own and batches of compatible batch=True tasks."""
+        single: List[int] = []
+        groups: Dict[Tuple[bool, str], List[int]] = {}
+        for index, task in enumerate(tasks):
+            metadata = get_execution_metadata(task)
+            if not metadata.get("batch") or asyncio.iscoroutine(task):
+                single.append(index)
+                continue
+            # Only calls with the same activity options can share an activity
+            options = self._activity_options(metadata)
+            key = (bool(metadata.get("local")), repr(sorted(options.items())))
+            groups.setdefault(key, []).append(index)
+
+        batches: List[List[int]] = []
+        size = max(1, self.config.activity_batch_size)
+        for indexes in groups.values():
+            for start in range(0, len(indexes), size):
+                chunk = indexes[start:start + size]
+                if len(chunk) == 1:
+                    single.extend(chunk)
+                else:
+                    batches.append(chunk)
+        return single, batches
+
+    async def _execute_batch(self, tasks, **kwargs: Any) -> List[R | BaseException]:
+        """Run compatible batch=True tasks as one activity."""
+        metadata = get_execution_metadata(tasks[0])
+        calls = [
+            (_activity_name(task), _activity_args(task, kwargs))
+            for task in tasks
+        ]
         try:
-            result = await workflow.execute_activity(
-                activity_name,
-                args=kwargs.get("args", ()),
-                task_queue=self.config.task_queue,
-                schedule_to_close_timeout=schedule_to_close,
-                retry_policy=retry_policy,
-                **kwargs,
+            outcomes = await self._run_activity(
+                BATCH_ACTIVITY_NAME,
+                [calls],
+                local=bool(metadata.get("local")),
+                **self._activity_options(metadata),
             )
-            return result
         except Exception as e:
-            # Properly propagate activity errors
-            if isinstance(e, exceptions.ActivityError):
-                raise e.cause if e.cause else e
-            raise
+            return [e] * len(tasks)
+
+        results: List[R | BaseException] = []
+        retries: List[Tuple[int, TemporalRetryPolicy]] = []
+        for index, (task, outcome) in enumerate(zip(tasks, outcomes)):
+            if "error" not in outcome:
+                results.append(outcome["value"])
+                continue
+            results.append(exceptions.ApplicationError(outcome["message"], type=outcome["error"]))
+            retry_policy = self._remaining_retry_policy(get_execution_metadata(task))
+            if outcome.get("retryable") and retry_policy is not None:
+                retries.append((index, retry_policy))
+        # Failed calls get the rest of their retry policy as activities of their own
+        retried = await asyncio.gather(
+            *(self._retry_batched(tasks[index], retry_policy, **kwargs) for index, retry_policy in retries),
+            return_exceptions=True,
+        )
+        for (index, _), result in zip(retries, retried):
+            results[index] = result
+        return results
+
+    @staticmethod
+    def _remaining_retry_policy(metadata: Dict[str, Any]) -> TemporalRetryPolicy | None:
+        """The retry policy of a batched call after its first attempt failed in the batch; None if it has no attempts left."""
+        policy = to_temporal_retry_policy(metadata.get("retry_policy")) or TemporalRetryPolicy()
+        if policy.maximum_attempts == 1:
+            return None
+        if policy.maximum_attempts > 1:
+            policy = dataclasses.replace(policy, maximum_attempts=policy.maximum_attempts - 1)
+        return policy
+
+    async def _retry_batched(self, task, retry_policy: TemporalRetryPolicy, **kwargs: Any) -> R | BaseException:
+        # A durable timer inside the workflow
+        await asyncio.sleep(retry_policy.initial_interval.total_seconds())
+        return await self._execute_task(task, **{**kwargs, "retry_policy": retry_policy})
 
     async def execute(
         self,
@@ -325,10 +539,20 @@ class TemporalExecutor(Executor):
 
         # TODO: saqadri - validate if async with self.execution_context() is needed here
         async with self.execution_context():
-            return await asyncio.gather(
-                *(self._execute_task(task, **kwargs) for task in tasks),
+            single, batches = self._plan_batches(tasks)
+            outcomes = await asyncio.gather(
+                *(self._execute_task(tasks[index], **kwargs) for index in single),
+                *(self._execute_batch([tasks[index] for index in batch], **kwargs) for batch in batches),
                 return_exceptions=True,
             )
+            results: List[R | BaseException] = [None] * len(tasks)
+            for index, outcome in zip(single, outcomes):
+                results[index] = outcome
+            for batch, outcome in zip(batches, outcomes[len(single):]):
+                batch_results = outcome if isinstance(outcome, list) else [outcome] * len(batch)
+                for index, result in zip(batch, batch_results):
+                    results[index] = result
+            return results
 
     async def execute_streaming(
         self,
@@ -377,13 +601,22 @@ class TemporalExecutor(Executor):
         await self.ensure_client()
 
         if self._worker is None:
-            # We'll collect the activities from the global registry
-            # and optionally wrap them with `activity.defn` if we want
-            # (Not strictly required if your code calls `execute_activity("name")` by name)
+            # We'll collect the activities from the global registry and wrap them
+            # with `activity.defn`, which also starts their heartbeats
             activity_registry = self.context.task_registry
-            activities = []
-            for name in activity_registry.list_activities():
-                activities.append(activity_registry.get_activity(name))
+            activities = [
+                self.wrap_as_activity(name, activity_registry.get_activity(name))
+                for name in activity_registry.list_activities()
+            ]
+            # Runs batches of @workflow_task(batch=True) calls in one activity
+            activities.append(
+                self.create_batch_activity(
+                    {
+                        name: activity_registry.get_activity(name)
+                        for name in activity_registry.list_activities()
+                    }
+                )
+            )
 
             # Now we attempt to discover any classes that are recognized as workflows
             # But in this simple example, we rely on the user specifying them or
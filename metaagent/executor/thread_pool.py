@@ -0,0 +1,132 @@
+"""
+Named, fixed-size thread pools for blocking tasks run by AsyncioExecutor.
+
+Each class of blocking work (network I/O, disk, CPU-heavy C extensions) can get
+its own pool, so a slow class cannot starve the others of threads. Every pool
+exports its queue depth, busy threads and utilization through the metrics registry:
+
+- executor_pool_queued_tasks{pool}: tasks submitted but not yet started
+- executor_pool_active_threads{pool}: threads currently running a task
+- executor_pool_max_workers{pool}: configured size of the pool
+- executor_pool_utilization{pool}: active threads / max workers
+- executor_pool_queue_wait_seconds{pool}: time tasks spent waiting for a thread
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from metaagent.executor.task_timing import current_task_timing
+from metaagent.logging.metrics import metrics
+
+R = TypeVar("R")
+
+_queued = metrics.gauge(
+    "executor_pool_queued_tasks",
+    "Tasks submitted to a thread pool that have not started yet",
+    ["pool"],
+)
+_active = metrics.gauge(
+    "executor_pool_active_threads",
+    "Threads of a thread pool that are running a task",
+    ["pool"],
+)
+_max_workers = metrics.gauge(
+    "executor_pool_max_workers",
+    "Configured size of a thread pool",
+    ["pool"],
+)
+_utilization = metrics.gauge(
+    "executor_pool_utilization",
+    "Fraction of a thread pool's threads that are running a task",
+    ["pool"],
+)
+_queue_wait = metrics.histogram(
+    "executor_pool_queue_wait_seconds",
+    "Time tasks spent waiting for a thread pool worker",
+    ["pool"],
+)
+
+
+class ThreadPool:
+    """A named ThreadPoolExecutor, started on first use, that reports its load as metrics."""
+
+    def __init__(self, name: str, max_workers: int):
+        """
+        Args:
+            name: Pool name, used for thread names and the `pool` metric label
+            max_workers: Number of threads in the pool
+        """
+        if max_workers < 1:
+            raise ValueError(f"Thread pool '{name}' needs at least one worker")
+
+        self.name = name
+        self.max_workers = max_workers
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._active_count = 0
+
+        self._queued = _queued.labels(name)
+        self._active = _active.labels(name)
+        self._utilization = _utilization.labels(name)
+        self._queue_wait = _queue_wait.labels(name)
+        _max_workers.labels(name).set(max_workers)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"metaagent-{self.name}",
+                )
+            return self._executor
+
+    def _set_active(self, delta: int) -> None:
+        with self._lock:
+            self._active_count += delta
+            self._active.set(self._active_count)
+            self._utilization.set(self._active_count / self.max_workers)
+
+    async def run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Run `func(*args, **kwargs)` on a thread of this pool and return its result."""
+        timing = current_task_timing()
+        submitted_at = time.perf_counter()
+        # "queued" -> "started", or "abandoned" if the caller stops waiting before it starts
+        state = ["queued"]
+        state_lock = threading.Lock()
+
+        def call() -> R:
+            with state_lock:
+                if state[0] == "abandoned":
+                    return None
+                state[0] = "started"
+            self._queued.dec()
+            waited = time.perf_counter() - submitted_at
+            self._queue_wait.observe(waited)
+            if timing is not None:
+                timing.pool_wait += waited
+            self._set_active(1)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._set_active(-1)
+
+        self._queued.inc()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), call)
+        finally:
+            with state_lock:
+                if state[0] == "queued":
+                    state[0] = "abandoned"
+                    self._queued.dec()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the pool's threads. Tasks that have not started are cancelled."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
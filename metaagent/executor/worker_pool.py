@@ -0,0 +1,538 @@
+"""
+Pool of worker processes, each running its own event loop, for tasks run by
+AsyncioExecutor with `pool="workers"`.
+
+Unlike the process pool (one blocking call per process at a time), a worker runs
+many async tasks concurrently, so JSON parsing, serialization and pydantic work
+around I/O-bound LLM and tool calls spreads over every core. No broker is needed:
+the coordinator talks to each worker over a multiprocessing pipe.
+
+- Tasks go to the worker with the fewest tasks in flight.
+- `run` returns a task's result; `stream` yields the items of an (async) generator
+  task as the worker produces them.
+- A worker that dies is replaced. Its in-flight tasks are resubmitted up to
+  `crash_retries` times (so they must tolerate running again), then fail with a
+  WorkerCrashedError. Streams that already produced items are not resubmitted.
+- Cancelling a task (e.g. on timeout) cancels it in the worker.
+- A stream runs at most `STREAM_WINDOW` items ahead of its consumer: the worker
+  waits for the coordinator to grant credit as items are consumed.
+
+Tasks, their arguments and results are pickled: tasks must be module-level functions.
+
+Metrics:
+- executor_worker_tasks_in_flight{worker}: tasks sent to a worker and not finished
+- executor_worker_restarts_total: workers replaced after exiting unexpectedly
+"""
+
+import asyncio
+import inspect
+import itertools
+import multiprocessing
+import pickle
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, AsyncIterator, Callable, Dict, List, Sequence, TypeVar
+
+from metaagent.executor.process_pool import (
+    ProcessPool,
+    TaskNotPicklableError,
+    _run_warmup_hooks,
+    _task_name,
+)
+from metaagent.logging.logger import get_logger
+from metaagent.logging.metrics import metrics
+
+R = TypeVar("R")
+
+logger = get_logger(__name__)
+
+_in_flight = metrics.gauge(
+    "executor_worker_tasks_in_flight",
+    "Tasks sent to a worker process that have not finished",
+    ["worker"],
+)
+_restarts = metrics.counter(
+    "executor_worker_restarts_total",
+    "Worker processes replaced after exiting unexpectedly",
+)
+
+# Messages are pickled tuples; the first element is one of these
+_RUN, _STREAM, _CANCEL, _CREDIT, _SHUTDOWN = "run", "stream", "cancel", "credit", "shutdown"
+_READY, _RESULT, _ERROR, _ITEM, _END = "ready", "result", "error", "item", "end"
+
+
+STREAM_WINDOW = 64
+"""Most stream items a worker sends ahead of the consumer"""
+
+# Credit is returned to the worker in batches of this many consumed items
+_CREDIT_BATCH = STREAM_WINDOW // 4
+
+
+class WorkerCrashedError(RuntimeError):
+    """A worker process exited while running a task (or the pool was shut down)."""
+
+
+def _dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _dump_error(error: BaseException) -> bytes:
+    try:
+        payload = _dumps(error)
+        pickle.loads(payload)
+        return payload
+    except Exception:
+        return _dumps(RuntimeError(f"{type(error).__name__}: {error}"))
+
+
+# Worker process side
+
+
+class _WorkerServer:
+    """Runs the tasks received over `conn` on the worker's event loop."""
+
+    def __init__(self, conn: Connection):
+        self.conn = conn
+        self.tasks: Dict[int, asyncio.Task] = {}
+        # Items each stream may still send before the coordinator grants more
+        self.credits: Dict[int, asyncio.Semaphore] = {}
+        self.loop = asyncio.get_running_loop()
+        self.stopped = self.loop.create_future()
+        self._send_lock = threading.Lock()
+
+    def send(self, *message: Any) -> None:
+        with self._send_lock:
+            self.conn.send_bytes(_dumps(message))
+
+    def receive(self) -> None:
+        """Reader thread: hand every message to the event loop."""
+        while True:
+            try:
+                message = pickle.loads(self.conn.recv_bytes())
+            except (EOFError, OSError):
+                # The coordinator is gone
+                message = (_SHUTDOWN,)
+            self.loop.call_soon_threadsafe(self.dispatch, message)
+            if message[0] == _SHUTDOWN:
+                return
+
+    def dispatch(self, message: tuple) -> None:
+        kind = message[0]
+        if kind in (_RUN, _STREAM):
+            _, task_id, payload = message
+            if kind == _STREAM:
+                self.credits[task_id] = asyncio.Semaphore(STREAM_WINDOW)
+            self.tasks[task_id] = self.loop.create_task(self.run(kind, task_id, payload))
+        elif kind == _CREDIT:
+            credit = self.credits.get(message[1])
+            if credit is not None:
+                for _ in range(message[2]):
+                    credit.release()
+        elif kind == _CANCEL:
+            task = self.tasks.get(message[1])
+            if task is not None:
+                task.cancel()
+        elif kind == _SHUTDOWN and not self.stopped.done():
+            self.stopped.set_result(None)
+
+    async def run(self, kind: str, task_id: int, payload: bytes) -> None:
+        try:
+            func, args, kwargs = pickle.loads(payload)
+            if kind == _STREAM:
+                await self.stream(task_id, func(*args, **kwargs))
+                self.send(_END, task_id)
+                return
+            if inspect.iscoroutinefunction(func):
+                result = await func(*args, **kwargs)
+            else:
+                result = await self.loop.run_in_executor(None, lambda: func(*args, **kwargs))
+                if inspect.iscoroutine(result):
+                    result = await result
+            try:
+                payload = _dumps(result)
+            except Exception as e:
+                raise TaskNotPicklableError(
+                    f"Result of worker task '{_task_name(func)}' "
+                    f"({type(result).__name__}) cannot be pickled: {e}"
+                ) from None
+            self.send(_RESULT, task_id, payload)
+        except asyncio.CancelledError:
+            pass
+        except BaseException as e:
+            self.send(_ERROR, task_id, _dump_error(e))
+        finally:
+            self.tasks.pop(task_id, None)
+            self.credits.pop(task_id, None)
+
+    async def stream(self, task_id: int, items: Any) -> None:
+        credit = self.credits[task_id]
+        if hasattr(items, "__aiter__"):
+            async for item in items:
+                await credit.acquire()
+                self.send(_ITEM, task_id, _dumps(item))
+        else:
+            for item in items:
+                # Also lets other tasks (and cancellation) through between items
+                await credit.acquire()
+                self.send(_ITEM, task_id, _dumps(item))
+                await asyncio.sleep(0)
+
+    async def serve(self) -> None:
+        threading.Thread(target=self.receive, name="worker-reader", daemon=True).start()
+        self.send(_READY)
+        await self.stopped
+        for task in list(self.tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+
+
+async def _serve(conn: Connection) -> None:
+    await _WorkerServer(conn).serve()
+
+
+def _worker_main(conn: Connection, warmup: Sequence[Callable[[], Any]]) -> None:
+    """Worker process entry point."""
+    _run_warmup_hooks(warmup)
+    try:
+        asyncio.run(_serve(conn))
+    finally:
+        conn.close()
+
+
+# Coordinator side
+
+
+class _Call:
+    """A task sent to a worker, and where its result goes."""
+
+    def __init__(self, task_id: int, kind: str, payload: bytes, name: str):
+        self.task_id = task_id
+        self.kind = kind
+        self.payload = payload
+        self.name = name
+        self.attempts = 0
+        self.loop = asyncio.get_running_loop()
+        self.worker: "_Worker | None" = None
+        self.future: asyncio.Future | None = None
+        self.items: asyncio.Queue | None = None
+        self.streamed = False
+        if kind == _STREAM:
+            self.items = asyncio.Queue()
+        else:
+            self.future = self.loop.create_future()
+
+    def fail(self, error: BaseException) -> None:
+        if self.items is not None:
+            self.items.put_nowait((_ERROR, error))
+        elif not self.future.done():
+            self.future.set_exception(error)
+
+
+class _Worker:
+    """Coordinator-side handle of one worker process."""
+
+    def __init__(self, pool: "WorkerPool", index: int):
+        self.pool = pool
+        self.index = index
+        context = multiprocessing.get_context(pool.start_method)
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, tuple(pool.warmup)),
+            name=f"metaagent-worker-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.calls: Dict[int, _Call] = {}
+        self.ready = pool._loop.create_future()
+        self.closing = False
+        self._send_lock = threading.Lock()
+        self._in_flight = _in_flight.labels(str(index))
+        self._in_flight.set(0)
+        self._reader = threading.Thread(
+            target=self._receive, name=f"metaagent-worker-{index}-reader", daemon=True
+        )
+        self._reader.start()
+
+    def send(self, *message: Any) -> None:
+        with self._send_lock:
+            self.conn.send_bytes(_dumps(message))
+
+    def submit(self, call: _Call) -> None:
+        call.attempts += 1
+        call.worker = self
+        self.calls[call.task_id] = call
+        self._in_flight.set(len(self.calls))
+        self.send(call.kind, call.task_id, call.payload)
+
+    def cancel(self, call: _Call) -> None:
+        if self.calls.pop(call.task_id, None) is not None:
+            self._in_flight.set(len(self.calls))
+            try:
+                self.send(_CANCEL, call.task_id)
+            except OSError:
+                pass
+
+    def grant(self, call: _Call, items: int) -> None:
+        """Let the worker send `items` more items of a stream."""
+        if call.task_id in self.calls:
+            try:
+                self.send(_CREDIT, call.task_id, items)
+            except OSError:
+                pass
+
+    def _receive(self) -> None:
+        """Reader thread: hand every message to the coordinator's event loop."""
+        loop = self.pool._loop
+        while True:
+            try:
+                message = self.conn.recv_bytes()
+            except (EOFError, OSError):
+                break
+            try:
+                loop.call_soon_threadsafe(self._dispatch, message)
+            except RuntimeError:
+                # The event loop was closed
+                return
+        # Wait for the exit code here rather than on the event loop
+        self.process.join(1.0)
+        try:
+            loop.call_soon_threadsafe(self.pool._on_exit, self)
+        except RuntimeError:
+            pass
+
+    def _dispatch(self, message: bytes) -> None:
+        kind, *rest = pickle.loads(message)
+        if kind == _READY:
+            if not self.ready.done():
+                self.ready.set_result(True)
+            return
+        task_id = rest[0]
+        call = self.calls.get(task_id)
+        if call is None:
+            # Cancelled meanwhile
+            return
+        if kind == _ITEM:
+            call.streamed = True
+            call.items.put_nowait((_ITEM, rest[1]))
+            return
+        del self.calls[task_id]
+        self._in_flight.set(len(self.calls))
+        if kind == _END:
+            call.items.put_nowait((_END, None))
+        elif kind == _RESULT:
+            if not call.future.done():
+                call.future.set_result(rest[1])
+        elif kind == _ERROR:
+            try:
+                error = pickle.loads(rest[1])
+            except Exception as e:
+                error = RuntimeError(f"Worker task '{call.name}' failed with an error that cannot be unpickled: {e}")
+            call.fail(error)
+
+    def close(self, timeout: float) -> threading.Thread:
+        """
+        Ask the worker to exit and reap it (terminating it after `timeout`) in a
+        thread, which is returned, so that the event loop is not blocked.
+        """
+        self.closing = True
+        try:
+            self.send(_SHUTDOWN)
+        except OSError:
+            pass
+
+        def reap():
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+            self.conn.close()
+
+        reaper = threading.Thread(target=reap, name=f"metaagent-worker-{self.index}-reaper", daemon=True)
+        reaper.start()
+        return reaper
+
+
+class WorkerPool:
+    """
+    Lazily started pool of worker processes running tasks on their own event loops.
+    The workers report to the event loop they were started from; when the pool is
+    used from another loop (e.g. a later `asyncio.run`), they are restarted on it.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        warmup: Sequence[Callable[[], Any]] = (),
+        crash_retries: int = 1,
+        start_method: str = "spawn",
+    ):
+        """
+        Args:
+            workers: Number of worker processes. Defaults to the number of CPUs
+            warmup: Module-level functions run once in every worker when it starts
+            crash_retries: How many times a task is resubmitted after its worker died
+            start_method: multiprocessing start method ("spawn" is safe with threads and event loops)
+        """
+        self.workers = workers or multiprocessing.cpu_count()
+        if self.workers < 1:
+            raise ValueError("A worker pool needs at least one worker")
+        self.warmup: List[Callable[[], Any]] = list(warmup)
+        self.crash_retries = crash_retries
+        self.start_method = start_method
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: List[_Worker] = []
+        self._ids = itertools.count()
+        self._closed = False
+
+        for hook in self.warmup:
+            ProcessPool._check_picklable(hook, f"Warm-up hook '{_task_name(hook)}'")
+
+    def _start(self) -> None:
+        if self._closed:
+            raise RuntimeError("Worker pool has been shut down")
+        loop = asyncio.get_running_loop()
+        if self._loop is not None and self._loop is not loop:
+            # The reader threads deliver to the old loop, which may be closed
+            logger.warning("Worker pool used from a new event loop; restarting its workers")
+            self._stop_workers(timeout=1.0)
+        if self._loop is None:
+            self._loop = loop
+            self._workers = [_Worker(self, index) for index in range(self.workers)]
+
+    def _stop_workers(self, timeout: float) -> None:
+        """Stop the workers of the previous event loop; its tasks still running fail."""
+        workers, self._workers = self._workers, []
+        self._loop = None
+        for worker in workers:
+            for call in list(worker.calls.values()):
+                error = WorkerCrashedError(f"Worker pool moved to a new event loop while running task '{call.name}'")
+                try:
+                    call.loop.call_soon_threadsafe(call.fail, error)
+                except RuntimeError:
+                    # That event loop is closed
+                    pass
+            worker.calls.clear()
+            worker.close(timeout)
+
+    def _dispatch(self, call: _Call) -> None:
+        worker = min(self._workers, key=lambda w: len(w.calls))
+        try:
+            worker.submit(call)
+        except OSError:
+            # The worker is going away; _on_exit resubmits or fails the call
+            pass
+
+    def _on_exit(self, worker: _Worker) -> None:
+        """A worker's pipe closed: replace the worker and deal with its tasks."""
+        calls = list(worker.calls.values())
+        worker.calls.clear()
+        worker._in_flight.set(0)
+        if worker.closing or self._closed:
+            for call in calls:
+                call.fail(WorkerCrashedError(f"Worker pool shut down while running task '{call.name}'"))
+            return
+
+        # The reader thread waited for the process before reporting its exit
+        exitcode = worker.process.exitcode
+        worker.conn.close()
+        if not worker.ready.done():
+            # Died while starting (e.g. a failing warm-up hook): restarting would loop
+            worker.ready.set_result(False)
+            logger.error(f"Worker process {worker.index} exited with code {exitcode} while starting")
+            self._workers.remove(worker)
+            if not self._workers:
+                # Start from scratch on next use
+                self._loop = None
+            for call in calls:
+                call.fail(WorkerCrashedError(f"Worker process failed to start for task '{call.name}'"))
+            return
+        logger.warning(
+            f"Worker process {worker.index} (pid {worker.process.pid}) exited with code {exitcode}; "
+            f"restarting it. {len(calls)} task(s) were in flight"
+        )
+        _restarts.inc()
+        replacement = _Worker(self, worker.index)
+        self._workers[self._workers.index(worker)] = replacement
+        for call in calls:
+            if call.streamed or call.attempts > self.crash_retries:
+                call.fail(
+                    WorkerCrashedError(
+                        f"Worker process exited with code {exitcode} while running task "
+                        f"'{call.name}' (attempt {call.attempts})"
+                    )
+                )
+            else:
+                self._dispatch(call)
+
+    def _cancel(self, call: _Call) -> None:
+        for worker in self._workers:
+            if call.task_id in worker.calls:
+                worker.cancel(call)
+                return
+
+    def _new_call(self, kind: str, func: Callable[..., Any], args: tuple, kwargs: dict) -> _Call:
+        name = _task_name(func)
+        payload = ProcessPool._check_picklable(
+            (func, args, kwargs), f"Task '{name}' (or its arguments)"
+        )
+        self._start()
+        call = _Call(next(self._ids), kind, payload, name)
+        self._dispatch(call)
+        return call
+
+    async def warm_up(self) -> None:
+        """Start every worker (and run its warm-up hooks) now rather than on first use."""
+        self._start()
+        ready = await asyncio.gather(*(worker.ready for worker in self._workers))
+        if not all(ready):
+            raise WorkerCrashedError("Worker processes failed to start; see the logs")
+
+    async def run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Run `func(*args, **kwargs)` (sync or async) in a worker process and return its result."""
+        call = self._new_call(_RUN, func, args, kwargs)
+        try:
+            # Results are unpickled here so that waiting callers do not block the reader threads
+            return pickle.loads(await call.future)
+        except asyncio.CancelledError:
+            self._cancel(call)
+            raise
+
+    async def stream(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """Run the (async) generator function `func` in a worker, yielding its items as they arrive."""
+        call = self._new_call(_STREAM, func, args, kwargs)
+        finished = False
+        consumed = 0
+        try:
+            while True:
+                kind, value = await call.items.get()
+                if kind == _END:
+                    finished = True
+                    return
+                if kind == _ERROR:
+                    finished = True
+                    raise value
+                yield pickle.loads(value)
+                # Credit for the items the consumer has taken, so the worker keeps going
+                consumed += 1
+                if consumed == _CREDIT_BATCH:
+                    call.worker.grant(call, consumed)
+                    consumed = 0
+        finally:
+            if not finished:
+                self._cancel(call)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the worker processes and wait for them; tasks still running fail with WorkerCrashedError."""
+        self._closed = True
+        workers, self._workers = self._workers, []
+        reapers = []
+        for worker in workers:
+            for call in list(worker.calls.values()):
+                call.fail(WorkerCrashedError(f"Worker pool shut down while running task '{call.name}'"))
+            worker.calls.clear()
+            reapers.append(worker.close(timeout))
+        for reaper in reapers:
+            reaper.join()
@@ -1,4 +1,6 @@
+import functools
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from datetime import datetime
 from typing import (
     Any,
@@ -10,7 +12,11 @@ from typing import (
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from metaagent.executor.durable import DurableExecutor
 from metaagent.executor.executor import Executor
+from metaagent.executor.scheduler import scheduling
+from metaagent.executor.task_timing import collect_task_timings
+from metaagent.logging.profiling import profiler
 
 T = TypeVar("T")
 
@@ -43,6 +49,24 @@ class WorkflowResult(BaseModel, Generic[T]):
     end_time: float | None = None
 
 
+def _wrap_run(run):
+    @functools.wraps(run)
+    async def wrapper(self: "Workflow", *args: Any, **kwargs: Any):
+        metadata = self.state.metadata
+        key = metadata.get("workflow_id") or metadata.get("session_id")
+        scope = scheduling(key=str(key)) if key is not None else nullcontext()
+        with scope, collect_task_timings() as timings:
+            if isinstance(self.executor, DurableExecutor):
+                result = await self.executor.run_workflow(self, run, *args, **kwargs)
+            else:
+                result = await run(self, *args, **kwargs)
+        if isinstance(result, WorkflowResult):
+            result.metadata.setdefault("timing", timings.summary())
+        return result
+
+    return wrapper
+
+
 class Workflow(ABC, Generic[T]):
     """
     Base class for user-defined workflows.
@@ -54,8 +78,25 @@ class Workflow(ABC, Generic[T]):
             - any task methods MUST be decorated with @workflow_task.
 
         - Persistent state: Provides a simple `state` object for storing data across tasks.
+        - Profiling: each subclass's `run` is profiled as its own run when profiling is enabled.
+        - Scheduling: tasks started by `run` share the executor fairly under the
+          "workflow_id" (or "session_id") from the workflow metadata, if set.
+        - Durability: with a DurableExecutor, `run` resumes an unfinished run of the same
+          "workflow_id", replaying journaled task results and restoring `state`.
+        - Timing: a `WorkflowResult` returned by `run` gets a per-task summary of slot wait,
+          pool wait and run time of the tasks it executed in `metadata["timing"]`.
     """
 
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        run = cls.__dict__.get("run")
+        if run is not None and not getattr(run, "__profiled__", False):
+            wrapped = _wrap_run(
+                profiler.profiled(f"workflow.run {cls.__name__}", run=True)(run)
+            )
+            wrapped.__profiled__ = True
+            cls.run = wrapped
+
     def __init__(
         self,
         executor: Executor,
@@ -83,11 +124,13 @@ class Workflow(ABC, Generic[T]):
     async def update_state(self, **kwargs):
         """Syntactic sugar to update workflow state."""
         for key, value in kwargs.items():
-            self.state[key] = value
             setattr(self.state, key, value)
 
         self.state.updated_at = datetime.utcnow().timestamp()
 
+        if isinstance(self.executor, DurableExecutor):
+            await self.executor.record_state(self.state)
+
     async def wait_for_input(self, description: str = "Provide input") -> str:
         """
         Convenience method for human input. Uses `human_input` signal
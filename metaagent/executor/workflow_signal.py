@@ -59,10 +59,11 @@ class SignalHandler(Protocol, Generic[SignalValueT]):
 
 
 class PendingSignal(BaseModel):
-    """Tracks a waiting signal handler and its event."""
+    """Tracks a waiting signal handler and its event (or future)."""
 
     registration: SignalRegistration
     event: asyncio.Event | None = None
+    future: asyncio.Future | None = None
     value: SignalValueT | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -191,13 +192,42 @@ class ConsoleSignalHandler(SignalHandler[str]):
 
 class AsyncioSignalHandler(BaseSignalHandler[SignalValueT]):
     """
-    Asyncio-based signal handling using an internal dictionary of asyncio Events.
+    Asyncio-based signal handling using an internal registry of futures.
+
+    A signal with a workflow_id wakes only the waiters of that workflow (and
+    waiters that did not specify a workflow); a signal without one wakes every
+    waiter for its name. Registering, delivering to and removing a waiter are
+    O(1) each, so thousands of concurrently waiting workflows stay cheap.
     """
 
+    def __init__(self):
+        super().__init__()
+        # Map signal_name -> workflow_id -> unique_name -> PendingSignal.
+        # Waiters without a workflow id are kept under None.
+        self._pending_signals: Dict[
+            str, Dict[str | None, Dict[str, PendingSignal]]
+        ] = {}
+        # Map signal_name -> unique_name -> handler
+        self._handlers: Dict[str, Dict[str, Callable]] = {}
+
+    def on_signal(self, signal_name):
+        def decorator(func):
+            async def wrapped(value: SignalValueT):
+                if asyncio.iscoroutinefunction(func):
+                    await func(value)
+                else:
+                    func(value)
+
+            self._handlers.setdefault(signal_name, {})[str(uuid.uuid4())] = wrapped
+            return wrapped
+
+        return decorator
+
     async def wait_for_signal(
         self, signal, timeout_seconds: int | None = None
     ) -> SignalValueT:
-        event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
         unique_name = str(uuid.uuid4())
 
         registration = SignalRegistration(
@@ -205,64 +235,72 @@ class AsyncioSignalHandler(BaseSignalHandler[SignalValueT]):
             unique_name=unique_name,
             workflow_id=signal.workflow_id,
         )
+        pending_signal = PendingSignal(registration=registration, future=future)
 
-        pending_signal = PendingSignal(registration=registration, event=event)
-
-        async with self._lock:
-            # Add to pending signals
-            self._pending_signals.setdefault(signal.name, []).append(pending_signal)
+        # Registry updates don't await, so they need no lock on the event loop
+        waiters = self._pending_signals.setdefault(signal.name, {})
+        waiters.setdefault(signal.workflow_id, {})[unique_name] = pending_signal
 
+        timeout_handle = None
+        if timeout_seconds is not None:
+            timeout_handle = loop.call_later(timeout_seconds, _expire, future)
         try:
-            # Wait for signal
-            if timeout_seconds is not None:
-                await asyncio.wait_for(event.wait(), timeout_seconds)
-            else:
-                await event.wait()
-
-            return pending_signal.value
+            return await future
         except asyncio.TimeoutError as e:
             raise TimeoutError(f"Timeout waiting for signal {signal.name}") from e
         finally:
-            async with self._lock:
-                # Remove from pending signals
-                if signal.name in self._pending_signals:
-                    self._pending_signals[signal.name] = [
-                        ps
-                        for ps in self._pending_signals[signal.name]
-                        if ps.registration.unique_name != unique_name
-                    ]
-                    if not self._pending_signals[signal.name]:
-                        del self._pending_signals[signal.name]
-
-    def on_signal(self, signal_name):
-        def decorator(func):
-            async def wrapped(value: SignalValueT):
-                if asyncio.iscoroutinefunction(func):
-                    await func(value)
-                else:
-                    func(value)
-
-            self._handlers.setdefault(signal_name, []).append(wrapped)
-            return wrapped
-
-        return decorator
+            if timeout_handle is not None:
+                timeout_handle.cancel()
+            self._remove_pending(registration)
+
+    def _remove_pending(self, registration: SignalRegistration) -> None:
+        by_workflow = self._pending_signals.get(registration.signal_name)
+        if by_workflow is None:
+            return
+        waiters = by_workflow.get(registration.workflow_id)
+        if waiters is None or waiters.pop(registration.unique_name, None) is None:
+            return
+        if not waiters:
+            del by_workflow[registration.workflow_id]
+            if not by_workflow:
+                del self._pending_signals[registration.signal_name]
+
+    def _deliver(self, signal) -> None:
+        by_workflow = self._pending_signals.get(signal.name)
+        if not by_workflow:
+            return
+        if signal.workflow_id is None:
+            groups = list(by_workflow)
+        else:
+            groups = [signal.workflow_id, None]
+        for workflow_id in groups:
+            # Delivered waiters leave the registry right away
+            waiters = by_workflow.pop(workflow_id, None)
+            if not waiters:
+                continue
+            for pending_signal in waiters.values():
+                pending_signal.value = signal.payload
+                if not pending_signal.future.done():
+                    pending_signal.future.set_result(signal.payload)
+        if not by_workflow:
+            del self._pending_signals[signal.name]
 
     async def signal(self, signal):
-        async with self._lock:
-            # Notify any waiting coroutines
-            if signal.name in self._pending_signals:
-                pending = self._pending_signals[signal.name]
-                for ps in pending:
-                    ps.value = signal.payload
-                    ps.event.set()
+        # Notify any waiting coroutines
+        self._deliver(signal)
 
         # Notify any registered handler functions
-        tasks = []
-        handlers = self._handlers.get(signal.name, [])
-        for _, handler in handlers:
-            tasks.append(handler(signal))
+        handlers = self._handlers.get(signal.name)
+        if handlers:
+            await asyncio.gather(
+                *(handler(signal) for handler in list(handlers.values())),
+                return_exceptions=True,
+            )
+
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+def _expire(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_exception(asyncio.TimeoutError())
 
 
 # TODO: saqadri - check if we need to do anything to combine this and AsyncioSignalHandler
@@ -0,0 +1,133 @@
+"""
+The @workflow_task decorator, which marks a function as a workflow task (activity)
+and attaches the execution metadata that executors read when running it.
+"""
+
+import asyncio
+from datetime import timedelta
+from typing import Any, Callable, Dict, Literal, TypeVar
+
+R = TypeVar("R")
+
+TaskPool = Literal["thread", "process", "workers"] | str
+"""
+Where AsyncioExecutor runs a synchronous task: "thread" (the event loop's default
+thread pool), "process" (the process pool) or the name of a pool configured in
+`ExecutorConfig.thread_pools`. "workers" runs a sync or async task in the worker
+process pool (see metaagent.executor.worker_pool)
+"""
+
+_workflow_tasks: Dict[str, Callable[..., Any]] = {}
+"""Every @workflow_task function by activity name; a redefinition replaces the earlier one"""
+
+
+def workflow_task(
+    name: str | None = None,
+    schedule_to_close_timeout: timedelta | None = None,
+    start_to_close_timeout: timedelta | None = None,
+    retry_policy: Dict[str, Any] | None = None,
+    pool: TaskPool | None = None,
+    priority: int | None = None,
+    memoize: bool = False,
+    memo_version: str | None = None,
+    local: bool = False,
+    batch: bool = False,
+    heartbeat_timeout: timedelta | None = None,
+    heartbeat_interval: timedelta | None = None,
+    **kwargs: Any,
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """
+    Mark a function as a workflow task. It is added to the task registry of
+    contexts initialized afterwards (see registered_workflow_tasks).
+
+    Args:
+        name: Activity name. Defaults to the function's module and qualified name
+        schedule_to_close_timeout: Overall timeout, across retries. Defaults to the executor's timeout
+        start_to_close_timeout: Timeout of each attempt
+        retry_policy: Retry policy, as the fields of a RetryPolicy
+            (see metaagent.executor.task_policy; Temporal takes the same dict)
+        pool: Run this synchronous task in the "thread" pool, a "process" pool or a
+            named pool from `ExecutorConfig.thread_pools` (e.g. "io"), or run this
+            sync or async task in the "workers" pool of worker processes.
+            Defaults to `ExecutorConfig.default_pool`. Process-pool and worker tasks
+            must be defined at module level so they can be pickled.
+        priority: Scheduling priority when the executor's concurrency is limited;
+            lower runs first. An enclosing `scheduling(priority=...)` scope takes precedence
+        memoize: Reuse stored results of earlier calls with the same arguments when
+            the executor has a memo store (`ExecutorConfig.memo_path`). Methods are
+            only memoized if their instance defines `memo_key()` or is a pydantic
+            model or dataclass
+        memo_version: Version of the task's code for memoization. Defaults to a
+            hash of the function's source
+        local: With Temporal, run as a local activity: in the worker running the
+            workflow, without a round trip through the server. For short tasks
+        batch: With Temporal, combine independent calls passed to the same
+            `execute(...)` into one activity (they must tolerate being retried together).
+            A call that fails in its batch is retried as an activity of its own
+        heartbeat_timeout: With Temporal, fail an attempt that stops heartbeating for this long
+        heartbeat_interval: How often the activity heartbeats. Defaults to a third of
+            `heartbeat_timeout`
+        **kwargs: Additional metadata stored with the task
+    """
+
+    def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        if pool == "process" and asyncio.iscoroutinefunction(func):
+            raise TypeError(
+                f"Task '{func.__qualname__}' is async; only synchronous functions can run in a process pool"
+            )
+
+        if local and (heartbeat_timeout or heartbeat_interval):
+            raise TypeError(
+                f"Task '{func.__qualname__}' is a local activity; local activities cannot heartbeat"
+            )
+
+        metadata: Dict[str, Any] = {
+            "activity_name": name or f"{func.__module__}.{func.__qualname__}",
+            **kwargs,
+        }
+        if schedule_to_close_timeout is not None:
+            metadata["schedule_to_close_timeout"] = schedule_to_close_timeout
+        if start_to_close_timeout is not None:
+            metadata["start_to_close_timeout"] = start_to_close_timeout
+        if retry_policy is not None:
+            metadata["retry_policy"] = retry_policy
+        if pool is not None:
+            metadata["pool"] = pool
+        if priority is not None:
+            metadata["priority"] = priority
+        if memoize:
+            metadata["memoize"] = True
+        if memo_version is not None:
+            metadata["memo_version"] = memo_version
+        if local:
+            metadata["local"] = True
+        if batch:
+            metadata["batch"] = True
+        if heartbeat_timeout is not None:
+            metadata["heartbeat_timeout"] = heartbeat_timeout
+        if heartbeat_interval is not None or heartbeat_timeout is not None:
+            metadata["heartbeat_interval"] = heartbeat_interval or heartbeat_timeout / 3
+
+        # The function itself is returned so process-pool tasks stay picklable by reference
+        func.is_workflow_task = True
+        func.execution_metadata = metadata
+        _workflow_tasks[metadata["activity_name"]] = func
+        return func
+
+    return decorator
+
+
+def registered_workflow_tasks() -> Dict[str, Callable[..., Any]]:
+    """
+    The functions decorated with @workflow_task so far, by activity name.
+    initialize_context registers them with the context's task registry; tasks
+    defined after that must be added with `context.task_registry.register(...)`.
+    """
+    return dict(_workflow_tasks)
+
+
+def get_execution_metadata(task: Callable[..., Any]) -> Dict[str, Any]:
+    """Return the @workflow_task metadata of a task, looking through functools.partial."""
+    while hasattr(task, "func") and hasattr(task, "args"):
+        task = task.func
+    return getattr(task, "execution_metadata", {})
@@ -1,7 +1,24 @@
+import asyncio
+import time
+from contextlib import contextmanager
 import litellm
 from typing import Dict, List, Optional, Union
 from litellm.integrations.custom_logger import CustomLogger
 from MetaAgent.metaagent.simple_logger import logger
+from metaagent.executor.rate_limiter import rate_limiter
+from metaagent.logging.metrics import metrics
+from metaagent.logging.profiling import profiler
+
+_llm_request_duration = metrics.histogram(
+    "llm_request_duration_seconds",
+    "Latency of LLM_API requests by outcome (ok, error, rate_limited, timeout, cancelled)",
+    ["model", "operation", "outcome"],
+)
+_llm_tokens = metrics.counter(
+    "llm_tokens_total",
+    "Tokens consumed by LLM_API requests",
+    ["model", "kind"],
+)
 
 
 class CustomHandler(CustomLogger):
@@ -43,60 +60,183 @@ class CustomHandler(CustomLogger):
         logger.error(f"Error: {response_obj}")
 
 
+def _rate_limit_key(model_name: str) -> str:
+    """"provider/model", so that both provider and model quotas apply."""
+    try:
+        _, provider, _, _ = litellm.get_llm_provider(model_name)
+    except Exception:
+        return model_name
+    if model_name.startswith(f"{provider}/"):
+        return model_name
+    return f"{provider}/{model_name}"
+
+
+def _estimate_tokens(messages: List[Dict]) -> int:
+    """Rough prompt size (4 characters per token); corrected by the reported usage afterwards."""
+    chars = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            chars += sum(len(part.get("text", "")) for part in content if isinstance(part, dict))
+    return chars // 4 + 1
+
+
+def _response_headers(response):
+    hidden_params = getattr(response, "_hidden_params", None) or {}
+    return hidden_params.get("additional_headers") or getattr(response, "_response_headers", None)
+
+
+def _error_headers(error):
+    headers = getattr(error, "litellm_response_headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    return headers
+
+
 class LLM_API:
     # this also support multi-modal language models, such as gpt-4o-mini and gpt-4o.
-    def __init__(self, model_name: str, base_url: str = None, temperature: float = 0.5):
+    def __init__(self, model_name: str, base_url: str = None, temperature: float = 0.5, rate_limit_retries: int = 5):
         self.model_name = model_name
         self.logger = CustomHandler()
         self.base_url = base_url
         self.temperature = temperature
+        # Calls wait on the shared rate limiter; a 429 pauses the quota and is retried this many times
+        self.rate_limit_retries = rate_limit_retries
+        self._rate_limit_key = _rate_limit_key(model_name)
+
+    def _after_response(self, response, estimated_tokens: int, usage=None):
+        """Adapt the rate limits to the response's headers and its actual token usage."""
+        rate_limiter.update_from_headers(self._rate_limit_key, _response_headers(response))
+        usage = usage or getattr(response, "usage", None)
+        if usage and getattr(usage, "total_tokens", None):
+            rate_limiter.settle(self._rate_limit_key, estimated_tokens, usage.total_tokens)
+
+    def _completion(self, messages: List[Dict], operation: str, **kwargs):
+        """litellm.completion after waiting for the model's rate limits."""
+        tokens = _estimate_tokens(messages)
+        for attempt in range(self.rate_limit_retries + 1):
+            rate_limiter.acquire_sync(self._rate_limit_key, tokens=tokens)
+            try:
+                with self._measured(operation) as call:
+                    response = litellm.completion(model=self.model_name, messages=messages, base_url=self.base_url, temperature=self.temperature, **kwargs)
+                    call["usage"] = getattr(response, "usage", None)
+            except litellm.RateLimitError as e:
+                if attempt == self.rate_limit_retries:
+                    raise
+                rate_limiter.rejected(self._rate_limit_key, _error_headers(e), fallback_seconds=2 ** attempt)
+                continue
+            self._after_response(response, tokens)
+            return response
+
+    async def _acompletion(self, messages: List[Dict], operation: str, **kwargs):
+        """litellm.acompletion after waiting for the model's rate limits (without blocking the event loop)."""
+        tokens = _estimate_tokens(messages)
+        for attempt in range(self.rate_limit_retries + 1):
+            await rate_limiter.acquire(self._rate_limit_key, tokens=tokens)
+            try:
+                with self._measured(operation) as call:
+                    response = await litellm.acompletion(model=self.model_name, messages=messages, base_url=self.base_url, temperature=self.temperature, **kwargs)
+                    # A stream's usage comes with its last chunk
+                    call["usage"] = None if kwargs.get("stream") else getattr(response, "usage", None)
+            except litellm.RateLimitError as e:
+                if attempt == self.rate_limit_retries:
+                    raise
+                rate_limiter.rejected(self._rate_limit_key, _error_headers(e), fallback_seconds=2 ** attempt)
+                continue
+            if not kwargs.get("stream"):
+                self._after_response(response, tokens)
+            return response
+
+    @contextmanager
+    def _measured(self, operation: str):
+        """
+        Record the latency of the litellm call made inside the block, labelled by its
+        outcome, and the token usage the block stores in the yielded dict under "usage".
+        Rate-limit waits happen outside the block, so each attempt is measured on its own;
+        a stream is measured until it starts.
+        """
+        start = time.perf_counter()
+        call = {}
+        outcome = "error"
+        try:
+            yield call
+            outcome = "ok"
+        except litellm.RateLimitError:
+            outcome = "rate_limited"
+            raise
+        except (litellm.Timeout, asyncio.TimeoutError):
+            outcome = "timeout"
+            raise
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            _llm_request_duration.labels(self.model_name, operation, outcome).observe(time.perf_counter() - start)
+            self._record_usage(call.get("usage"))
+
+    def _record_usage(self, usage=None):
+        if usage:
+            _llm_tokens.labels(self.model_name, "prompt").inc(getattr(usage, "prompt_tokens", 0) or 0)
+            _llm_tokens.labels(self.model_name, "completion").inc(getattr(usage, "completion_tokens", 0) or 0)
 
+    @profiler.profiled("llm.generate")
     def generate(self, prompt: Optional[Union[str, list[str]]]):
         if isinstance(prompt, list):
             prompt = prompt[0]
         messages = [{"role": "user", "content": prompt}]
         litellm.callbacks = [self.logger]
         
-        response = litellm.completion(model=self.model_name, messages=messages, num_retries=3, base_url=self.base_url, temperature=self.temperature)
+        response = self._completion(messages, "generate")
         return response.choices[0].message.content
 
+    @profiler.profiled("llm.completion")
     def completion(self, messages: List[Dict[str, str]], user_id: str = None):
         if user_id:
             self.logger.user_id = user_id
         litellm.callbacks = [self.logger]
-        response = litellm.completion(model=self.model_name, messages=messages, num_retries=3, base_url=self.base_url, temperature=self.temperature)
+        response = self._completion(messages, "completion")
         return response.choices[0].message.content
     
+    @profiler.profiled("llm.acompletion")
     async def acompletion(self, messages: List[Dict[str, str]], user_id: str = None):
         if user_id:
             self.logger.user_id = user_id
         litellm.callbacks = [self.logger]
-        response = await litellm.acompletion(model=self.model_name, messages=messages, num_retries=3, base_url=self.base_url, temperature=self.temperature)
+        response = await self._acompletion(messages, "acompletion")
         return response.choices[0].message.content
 
+    @profiler.profiled("llm.json_completion")
     def json_completion(self, messages: List[Dict[str, str]], user_id: str = None):
         if user_id:
             self.logger.user_id = user_id
         litellm.callbacks = [self.logger]
-        response = litellm.completion(model=self.model_name, response_format={ "type": "json_object" }, messages=messages, num_retries=3, base_url=self.base_url, temperature=self.temperature)
+        response = self._completion(messages, "json_completion", response_format={ "type": "json_object" })
         return response.choices[0].message.content
     
+    @profiler.profiled("llm.ajson_completion")
     async def ajson_completion(self, messages: List[Dict[str, str]], user_id: str = None):
         if user_id:
             self.logger.user_id = user_id
         litellm.callbacks = [self.logger]
-        response = await litellm.acompletion(model=self.model_name, response_format={ "type": "json_object" }, messages=messages, num_retries=3, base_url=self.base_url, temperature=self.temperature)
+        response = await self._acompletion(messages, "ajson_completion", response_format={ "type": "json_object" })
         return response.choices[0].message.content
     
+    @profiler.profiled("llm.astream_completion")
     async def astream_completion(self, messages: List[Dict[str, str]], user_id: str = None):
         if user_id:
             self.logger.user_id = user_id
         litellm.callbacks = [self.logger]
-        response = await litellm.acompletion(model=self.model_name, messages=messages, stream=True, stream_options={"include_usage": True}, num_retries=3, base_url=self.base_url, temperature=self.temperature)
+        response = await self._acompletion(messages, "astream_completion", stream=True, stream_options={"include_usage": True})
+        usage = None
         async for chunk in response: 
+            usage = getattr(chunk, "usage", None) or usage
             if chunk['choices'][0]['delta']['content'] is None:
                 continue
             yield chunk['choices'][0]['delta']['content']
+        self._record_usage(usage)
+        self._after_response(response, _estimate_tokens(messages), usage)
 
 
 async def main():
@@ -130,5 +270,4 @@ async def main():
     print("res", res)
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,440 @@
+"""
+Compact binary event log format for the Logger module, including:
+- BinaryFileTransport: writes length-prefixed records into size-capped segments
+- BinaryEventReader: stream-filters segments by session, trace, namespace and time
+- A small CLI to query segments and convert them to JSONL
+
+Each segment is self-contained. It starts with a magic header followed by a
+zlib stream of frames `<kind:u8><length:u32><payload>`, sync-flushed after every
+record so a crash never loses more than the record being written. Namespace,
+event name, session and workflow ids are interned: the first time a string is
+seen in a segment it is written once as a STRING frame, and EVENT frames refer
+to it by integer id. Filtering by session/namespace therefore only compares
+integers and never has to decode the message or data of records that don't match.
+
+Usage:
+    python -m metaagent.logging.binary_log query logs/mcp-agent.evlog --session-id <id>
+    python -m metaagent.logging.binary_log convert logs/mcp-agent.evlog -o mcp-agent.jsonl
+"""
+
+import argparse
+import json
+import struct
+import sys
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List
+
+from metaagent.logging.events import Event, EventFilter
+from metaagent.logging.log_index import parse_time, rotated_path
+from metaagent.logging.transport import FilteredEventTransport
+from metaagent.logging.json_serializer import JSONSerializer
+
+SEGMENT_MAGIC = b"MAEVLOG\x01"
+
+FRAME_STRING = 0x01
+FRAME_EVENT = 0x02
+
+_FRAME_HEADER = struct.Struct("<BI")
+_STRING_HEADER = struct.Struct("<I")
+# timestamp, type, flags, namespace, name, session_id, workflow_id, trace_id, span_id, message length
+_EVENT_HEADER = struct.Struct("<dBBIIII16s8sI")
+
+FLAG_HAS_TRACE = 0x01
+FLAG_HAS_SPAN = 0x02
+
+EVENT_TYPES = ("debug", "info", "warning", "error", "progress")
+_EVENT_TYPE_CODES = {etype: code for code, etype in enumerate(EVENT_TYPES)}
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+def segment_path(base_path: str | Path, index: int) -> Path:
+    """Path of segment `index` for a base log path, e.g. mcp-agent.00003.evlog"""
+    return rotated_path(base_path, index)
+
+
+def list_segments(path: str | Path) -> List[Path]:
+    """
+    Resolve a path to the ordered list of segments it refers to.
+    `path` can be a single segment, a base log path, or a directory of segments.
+    """
+    path = Path(path)
+    if path.is_dir():
+        return sorted(path.glob("*.evlog"))
+    if path.exists():
+        return [path]
+    return sorted(path.parent.glob(f"{path.stem}.[0-9]*{path.suffix}"))
+
+
+class BinaryFileTransport(FilteredEventTransport):
+    """Transport that writes events to compact, segmented binary log files."""
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        event_filter: EventFilter | None = None,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+    ):
+        """Initialize BinaryFileTransport.
+
+        Args:
+            filepath: Base path of the log. Segments are written next to it as <stem>.<index><suffix>
+            event_filter: Optional filter for events
+            max_segment_bytes: Size after which a new segment is started
+        """
+        super().__init__(event_filter=event_filter)
+        self.filepath = Path(filepath)
+        self.max_segment_bytes = max_segment_bytes
+        self._serializer = JSONSerializer()
+
+        self._file: BinaryIO | None = None
+        self._compressor = None
+        self._segment_index = -1
+        self._segment_bytes = 0
+        self._strings: Dict[str, int] = {}
+
+        # Create directory if it doesn't exist
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def current_segment(self) -> Path | None:
+        """Path of the segment currently being written."""
+        if self._segment_index < 0:
+            return None
+        return segment_path(self.filepath, self._segment_index)
+
+    def _close_segment(self) -> None:
+        if self._file:
+            self._file.write(self._compressor.flush())
+            self._file.close()
+            self._file = None
+            self._compressor = None
+
+    def _open_next_segment(self) -> None:
+        self._close_segment()
+
+        existing = list_segments(self.filepath)
+        if self._segment_index < 0 and existing:
+            # Never append to a segment from a previous run; its string table is not ours
+            self._segment_index = int(existing[-1].stem.rsplit(".", 1)[-1])
+        self._segment_index += 1
+
+        self._file = open(self.current_segment, "wb")
+        self._file.write(SEGMENT_MAGIC)
+        self._compressor = zlib.compressobj()
+        self._segment_bytes = len(SEGMENT_MAGIC)
+        self._strings = {}
+
+    def _intern(self, value: str | None, frames: List[bytes]) -> int:
+        """Return the id for a string, queueing a STRING frame the first time it is seen."""
+        if value is None:
+            return 0
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings) + 1
+            self._strings[value] = string_id
+            payload = _STRING_HEADER.pack(string_id) + value.encode("utf-8")
+            frames.append(_FRAME_HEADER.pack(FRAME_STRING, len(payload)) + payload)
+        return string_id
+
+    def encode_event(self, event: Event) -> bytes:
+        """Encode an event (plus any newly interned strings) into frames for the current segment."""
+        frames: List[bytes] = []
+        context = event.context
+        flags = 0
+
+        trace_id = b"\x00" * 16
+        if event.trace_id:
+            trace_id = bytes.fromhex(event.trace_id)
+            flags |= FLAG_HAS_TRACE
+        span_id = b"\x00" * 8
+        if event.span_id:
+            span_id = bytes.fromhex(event.span_id)
+            flags |= FLAG_HAS_SPAN
+
+        data = b""
+        if event.data:
+            data = json.dumps(
+                self._serializer(event.data), separators=(",", ":")
+            ).encode("utf-8")
+
+        message = event.message.encode("utf-8")
+        header = _EVENT_HEADER.pack(
+            event.timestamp.timestamp(),
+            _EVENT_TYPE_CODES.get(event.type, 0),
+            flags,
+            self._intern(event.namespace, frames),
+            self._intern(event.name, frames),
+            self._intern(context.session_id if context else None, frames),
+            self._intern(context.workflow_id if context else None, frames),
+            trace_id,
+            span_id,
+            len(message),
+        )
+        payload = header + message + data
+        frames.append(_FRAME_HEADER.pack(FRAME_EVENT, len(payload)) + payload)
+        return b"".join(frames)
+
+    async def send_matched_event(self, event: Event) -> None:
+        """Append the event to the current segment, rotating when it is full."""
+        try:
+            if self._file is None or self._segment_bytes >= self.max_segment_bytes:
+                self._open_next_segment()
+
+            record = self._compressor.compress(self.encode_event(event))
+            record += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+            self._file.write(record)
+            self._file.flush()
+            self._segment_bytes += len(record)
+        except (IOError, ValueError) as e:
+            # Log error without recursion
+            print(f"Error writing to binary log {self.filepath}: {e}")
+
+    async def close(self) -> None:
+        """Close the current segment."""
+        self._close_segment()
+
+    @property
+    def is_closed(self) -> bool:
+        """Check if transport is closed."""
+        return self._file is None
+
+
+class BinaryEventReader:
+    """
+    Streams records out of binary log segments, filtering on the compact record
+    header before decoding message and data.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: A segment, a base log path (all of its segments are read), or a directory
+        """
+        self.segments = list_segments(path)
+
+    def iter_records(
+        self,
+        session_id: str | None = None,
+        trace_id: str | None = None,
+        namespace: str | None = None,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield matching records as dicts, oldest first.
+
+        Args:
+            session_id: Only records from this session
+            trace_id: Only records from this trace (32-char hex)
+            namespace: Only records whose namespace starts with this prefix
+            start: Only records at or after this time
+            end: Only records before this time
+        """
+        if isinstance(start, datetime):
+            start = start.timestamp()
+        if isinstance(end, datetime):
+            end = end.timestamp()
+        trace_bytes = bytes.fromhex(trace_id) if trace_id else None
+
+        for segment in self.segments:
+            yield from self._iter_segment(
+                segment, session_id, trace_bytes, namespace, start, end
+            )
+
+    def _iter_segment(
+        self,
+        segment: Path,
+        session_id: str | None,
+        trace_bytes: bytes | None,
+        namespace: str | None,
+        start: float | None,
+        end: float | None,
+    ) -> Iterator[Dict[str, Any]]:
+        strings: Dict[int, str] = {0: None}
+        # Interned ids that satisfy the session/namespace filters, filled in as strings appear
+        session_ids: set[int] = set()
+        namespace_ids: set[int] = set()
+
+        for kind, payload in self._iter_frames(segment):
+            if kind == FRAME_STRING:
+                (string_id,) = _STRING_HEADER.unpack_from(payload)
+                value = payload[_STRING_HEADER.size:].decode("utf-8")
+                strings[string_id] = value
+                if value == session_id:
+                    session_ids.add(string_id)
+                if namespace is not None and value.startswith(namespace):
+                    namespace_ids.add(string_id)
+                continue
+
+            if kind != FRAME_EVENT:
+                continue
+
+            (
+                timestamp,
+                type_code,
+                flags,
+                namespace_id,
+                name_id,
+                session_string_id,
+                workflow_string_id,
+                raw_trace_id,
+                raw_span_id,
+                message_length,
+            ) = _EVENT_HEADER.unpack_from(payload)
+
+            if session_id is not None and session_string_id not in session_ids:
+                continue
+            if namespace is not None and namespace_id not in namespace_ids:
+                continue
+            if trace_bytes is not None and raw_trace_id != trace_bytes:
+                continue
+            if start is not None and timestamp < start:
+                continue
+            if end is not None and timestamp >= end:
+                continue
+
+            yield self._decode_event(
+                payload,
+                strings,
+                timestamp,
+                type_code,
+                flags,
+                namespace_id,
+                name_id,
+                session_string_id,
+                workflow_string_id,
+                raw_trace_id,
+                raw_span_id,
+                message_length,
+            )
+
+    @staticmethod
+    def _iter_frames(segment: Path) -> Iterator[tuple[int, bytes]]:
+        """Decompress a segment incrementally and yield its (kind, payload) frames."""
+        decompressor = zlib.decompressobj()
+        buffer = bytearray()
+        offset = 0
+
+        with open(segment, "rb") as f:
+            if f.read(len(SEGMENT_MAGIC)) != SEGMENT_MAGIC:
+                raise ValueError(f"Not a binary event log segment: {segment}")
+
+            while True:
+                chunk = f.read(_READ_CHUNK_SIZE)
+                if not chunk:
+                    # Anything left in the buffer is a truncated record from a crashed writer
+                    return
+                try:
+                    buffer += decompressor.decompress(chunk)
+                except zlib.error:
+                    # Corrupt tail; keep the records we could decode
+                    return
+
+                while len(buffer) - offset >= _FRAME_HEADER.size:
+                    kind, length = _FRAME_HEADER.unpack_from(buffer, offset)
+                    end = offset + _FRAME_HEADER.size + length
+                    if end > len(buffer):
+                        break
+                    yield kind, bytes(buffer[offset + _FRAME_HEADER.size:end])
+                    offset = end
+
+                del buffer[:offset]
+                offset = 0
+
+    @staticmethod
+    def _decode_event(
+        payload: bytes,
+        strings: Dict[int, str],
+        timestamp: float,
+        type_code: int,
+        flags: int,
+        namespace_id: int,
+        name_id: int,
+        session_string_id: int,
+        workflow_string_id: int,
+        raw_trace_id: bytes,
+        raw_span_id: bytes,
+        message_length: int,
+    ) -> Dict[str, Any]:
+        offset = _EVENT_HEADER.size
+        message = payload[offset:offset + message_length].decode("utf-8")
+        data = payload[offset + message_length:]
+
+        namespace = strings.get(namespace_id)
+        name = strings.get(name_id)
+        if name:
+            namespace = f"{namespace}.{name}"
+
+        # Same shape as FileTransport's JSONL entries, plus correlation ids when present
+        record: Dict[str, Any] = {
+            "level": EVENT_TYPES[type_code].upper(),
+            "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+            "namespace": namespace,
+            "message": message,
+        }
+        if data:
+            record["data"] = json.loads(data)
+        if session_string_id:
+            record["session_id"] = strings.get(session_string_id)
+        if workflow_string_id:
+            record["workflow_id"] = strings.get(workflow_string_id)
+        if flags & FLAG_HAS_TRACE:
+            record["trace_id"] = raw_trace_id.hex()
+        if flags & FLAG_HAS_SPAN:
+            record["span_id"] = raw_span_id.hex()
+        return record
+
+    def to_jsonl(self, output: str | Path, **filters: Any) -> int:
+        """
+        Convert (optionally filtered) records to a JSONL file.
+        Returns the number of records written.
+        """
+        count = 0
+        with open(output, "w", encoding="utf-8") as f:
+            for record in self.iter_records(**filters):
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+                count += 1
+        return count
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m metaagent.logging.binary_log",
+        description="Query binary event logs or convert them to JSONL.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in ("query", "convert"):
+        sub = subparsers.add_parser(command)
+        sub.add_argument("path", help="Segment, base log path or directory of segments")
+        sub.add_argument("--session-id")
+        sub.add_argument("--trace-id")
+        sub.add_argument("--namespace", help="Namespace prefix")
+        sub.add_argument("--start", type=parse_time, help="ISO time or epoch seconds")
+        sub.add_argument("--end", type=parse_time, help="ISO time or epoch seconds")
+        if command == "convert":
+            sub.add_argument("-o", "--output", required=True, help="JSONL output file")
+
+    args = parser.parse_args(argv)
+    reader = BinaryEventReader(args.path)
+    filters = dict(
+        session_id=args.session_id,
+        trace_id=args.trace_id,
+        namespace=args.namespace,
+        start=args.start,
+        end=args.end,
+    )
+
+    if args.command == "convert":
+        count = reader.to_jsonl(args.output, **filters)
+        print(f"Wrote {count} records to {args.output}", file=sys.stderr)
+    else:
+        for record in reader.iter_records(**filters):
+            sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,18 +2,24 @@
 Events and event filters for the logger module for the MCP Agent
 """
 
+import asyncio
 import logging
 import random
+import time
 
 from datetime import datetime
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
+    FrozenSet,
+    List,
     Literal,
     Set,
+    Tuple,
 )
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 EventType = Literal["debug", "info", "warning", "error", "progress"]
@@ -57,6 +63,124 @@ class Event(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+_LEVELS: Dict[str, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+"""Severity of each event type; types not listed here rank as DEBUG"""
+
+
+class _NamespaceTrie:
+    """Character trie over namespace prefixes."""
+
+    __slots__ = ("_root",)
+
+    def __init__(self, prefixes: FrozenSet[str]):
+        self._root: Dict[str | None, Any] = {}
+        for prefix in prefixes:
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            # None marks the end of a prefix
+            node[None] = True
+
+    def matches_prefix(self, namespace: str) -> bool:
+        """Check if any prefix in the trie is a prefix of `namespace`."""
+        node = self._root
+        if None in node:
+            return True
+        for char in namespace:
+            node = node.get(char)
+            if node is None:
+                return False
+            if None in node:
+                return True
+        return False
+
+
+class CompiledEventFilter:
+    """
+    Precomputed form of an EventFilter: frozen type/name sets, an integer level
+    threshold and a namespace-prefix trie whose results are cached per namespace.
+
+    Equal filters share one compiled instance (see `compile_event_filter`), and
+    the result for the most recent event is remembered, so an event that passes
+    through several transports and listeners using the same filter is only
+    evaluated once.
+    """
+
+    __slots__ = ("types", "names", "namespaces", "min_level", "_namespace_cache", "_last")
+
+    _MAX_CACHED_NAMESPACES = 4096
+
+    def __init__(
+        self,
+        types: FrozenSet[str] | None,
+        names: FrozenSet[str] | None,
+        namespaces: FrozenSet[str] | None,
+        min_level: int,
+    ):
+        self.types = types
+        self.names = names
+        self.namespaces = _NamespaceTrie(namespaces) if namespaces else None
+        self.min_level = min_level
+        self._namespace_cache: Dict[str, bool] = {}
+        # (event, result) of the last evaluation, replaced atomically
+        self._last: Tuple[Any, bool] = (None, False)
+
+    def matches(self, event: "Event") -> bool:
+        last_event, last_result = self._last
+        if last_event is event:
+            return last_result
+        result = self._evaluate(event)
+        self._last = (event, result)
+        return result
+
+    def _evaluate(self, event: "Event") -> bool:
+        # 1) Filter by broad event type
+        if self.types is not None and event.type not in self.types:
+            return False
+
+        # 2) Filter by custom event name
+        if self.names is not None and (not event.name or event.name not in self.names):
+            return False
+
+        # 3) Minimum severity
+        if self.min_level and _LEVELS.get(event.type, logging.DEBUG) < self.min_level:
+            return False
+
+        # 4) Filter by namespace prefix
+        if self.namespaces is not None:
+            namespace = event.namespace
+            matched = self._namespace_cache.get(namespace)
+            if matched is None:
+                matched = self.namespaces.matches_prefix(namespace)
+                if len(self._namespace_cache) < self._MAX_CACHED_NAMESPACES:
+                    self._namespace_cache[namespace] = matched
+            if not matched:
+                return False
+
+        return True
+
+
+@lru_cache(maxsize=256)
+def compile_event_filter(
+    types: FrozenSet[str],
+    names: FrozenSet[str],
+    namespaces: FrozenSet[str],
+    min_level: str | None,
+) -> CompiledEventFilter:
+    """Compile (and share between equal filters) the matching logic of an EventFilter."""
+    return CompiledEventFilter(
+        types=types or None,
+        names=names or None,
+        namespaces=namespaces or None,
+        min_level=_LEVELS.get(min_level, logging.DEBUG) if min_level else 0,
+    )
+
+
 class EventFilter(BaseModel):
     """
     Filter events by:
@@ -64,6 +188,9 @@ class EventFilter(BaseModel):
       - allowed event 'names'
       - allowed namespace prefixes
       - a minimum severity level (DEBUG < INFO < WARNING < ERROR)
+
+    Matching uses a compiled form of the filter that is rebuilt when a field is
+    assigned; mutate the sets by assigning new ones rather than in place.
     """
 
     types: Set[EventType] | None = Field(default_factory=set)
@@ -71,41 +198,34 @@ class EventFilter(BaseModel):
     namespaces: Set[str] | None = Field(default_factory=set)
     min_level: EventType | None = "debug"
 
+    # A plain slot rather than a PrivateAttr: it is read for every event, and
+    # pydantic private attribute access is comparatively slow
+    __slots__ = ("_compiled",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            object.__setattr__(self, "_compiled", None)
+
+    def compile(self) -> CompiledEventFilter:
+        """Return the compiled form of this filter."""
+        compiled = getattr(self, "_compiled", None)
+        if compiled is None:
+            compiled = compile_event_filter(
+                frozenset(self.types or ()),
+                frozenset(self.names or ()),
+                frozenset(self.namespaces or ()),
+                self.min_level,
+            )
+            object.__setattr__(self, "_compiled", compiled)
+        return compiled
+
     def matches(self, event: Event) -> bool:
         """
         Check if an event matches this EventFilter criteria.
         """
-        # 1) Filter by broad event type
-        if self.types:
-            if event.type not in self.types:
-                return False
-
-        # 2) Filter by custom event name
-        if self.names:
-            if not event.name or event.name not in self.names:
-                return False
-
-        # 3) Filter by namespace prefix
-        if self.namespaces and not any(
-            event.namespace.startswith(ns) for ns in self.namespaces
-        ):
-            return False
-
-        # 4) Minimum severity
-        if self.min_level:
-            level_map: Dict[EventType, int] = {
-                "debug": logging.DEBUG,
-                "info": logging.INFO,
-                "warning": logging.WARNING,
-                "error": logging.ERROR,
-            }
-
-            min_val = level_map.get(self.min_level, logging.DEBUG)
-            event_val = level_map.get(event.type, logging.DEBUG)
-            if event_val < min_val:
-                return False
-
-        return True
+        compiled = getattr(self, "_compiled", None) or self.compile()
+        return compiled.matches(event)
 
 
 class SamplingFilter(EventFilter):
@@ -121,3 +241,154 @@ class SamplingFilter(EventFilter):
         if not super().matches(event):
             return False
         return random.random() < self.sample_rate
+
+
+class RateLimitingFilter(EventFilter):
+    """
+    Token-bucket rate limiting on top of base filter.
+    Each (namespace, event type) pair gets its own bucket that refills at `rate`
+    events per second and holds up to `burst` events, so one noisy component
+    cannot flood the bus. Errors always pass. Suppressed events are counted and
+    reported in a summary event at the end of each `summary_interval` in which
+    events were suppressed, instead of being dropped silently. Summary events
+    bypass this filter, including its `min_level`.
+    """
+
+    rate: float = 20.0
+    """Sustained events per second allowed for each namespace and event type"""
+
+    burst: int = 100
+    """Number of events that can pass at once before the rate applies"""
+
+    namespace_rates: Dict[str, float] = Field(default_factory=dict)
+    """Per-namespace-prefix overrides of `rate` (longest matching prefix wins)"""
+
+    summary_interval: float = 10.0
+    """Minimum seconds between summary events reporting suppressed counts"""
+
+    summary_namespace: str = "metaagent.logging.rate_limit"
+    """Namespace of the summary events (never rate limited)"""
+
+    # (namespace, type) -> [tokens, last refill time]
+    _buckets: Dict[Tuple[str, str], List[float]] = PrivateAttr(default_factory=dict)
+    _suppressed: Dict[Tuple[str, str], int] = PrivateAttr(default_factory=dict)
+    _last_summary: float = PrivateAttr(default_factory=time.monotonic)
+    # The same filter is usually shared by transports and listeners, so remember
+    # the (event, decision) of the last event to make it consume at most one token
+    _last: Tuple[Event | None, bool] = PrivateAttr(default=(None, False))
+    # namespace -> rate, so that refills don't scan `namespace_rates` every time
+    _rates: Dict[str, float] = PrivateAttr(default_factory=dict)
+    _summary_tasks: Set[asyncio.Task] = PrivateAttr(default_factory=set)
+    _summary_timer: asyncio.TimerHandle | None = PrivateAttr(default=None)
+
+    def matches(self, event: Event) -> bool:
+        if event.namespace == self.summary_namespace:
+            return True
+        if not super().matches(event):
+            return False
+        if event.type == "error":
+            return True
+
+        last_event, last_decision = self._last
+        if last_event is event:
+            return last_decision
+
+        now = time.monotonic()
+        decision = self._take_token(event, now)
+        self._last = (event, decision)
+
+        if now - self._last_summary >= self.summary_interval:
+            self._emit_summary(now)
+        elif not decision:
+            self._schedule_summary(now)
+        return decision
+
+    def rate_for(self, namespace: str) -> float:
+        """Sustained rate that applies to a namespace."""
+        rate = self._rates.get(namespace)
+        if rate is None:
+            rate = self._resolve_rate(namespace)
+            if len(self._rates) < CompiledEventFilter._MAX_CACHED_NAMESPACES:
+                self._rates[namespace] = rate
+        return rate
+
+    def _resolve_rate(self, namespace: str) -> float:
+        best_prefix = None
+        for prefix in self.namespace_rates:
+            if namespace.startswith(prefix) and (
+                best_prefix is None or len(prefix) > len(best_prefix)
+            ):
+                best_prefix = prefix
+        return self.namespace_rates[best_prefix] if best_prefix is not None else self.rate
+
+    def _take_token(self, event: Event, now: float) -> bool:
+        key = (event.namespace, event.type)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.burst), now]
+        else:
+            rate = self.rate_for(event.namespace)
+            bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return True
+
+        self._suppressed[key] = self._suppressed.get(key, 0) + 1
+        return False
+
+    def _schedule_summary(self, now: float) -> None:
+        """Make sure suppressed events are reported at the end of the current interval."""
+        if self._summary_timer is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Reported by the next event matched on the event loop
+            return
+        delay = max(0.0, self.summary_interval - (now - self._last_summary))
+        self._summary_timer = loop.call_later(delay, self._on_summary_timer)
+
+    def _on_summary_timer(self) -> None:
+        self._summary_timer = None
+        self._emit_summary(time.monotonic())
+
+    def _emit_summary(self, now: float) -> None:
+        """Emit a summary event with the suppressed counts since the last summary."""
+        if not self._suppressed:
+            self._last_summary = now
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Keep counting until we are called from the event loop again
+            return
+        if self._summary_timer is not None:
+            self._summary_timer.cancel()
+            self._summary_timer = None
+
+        from metaagent.logging.transport import AsyncEventBus
+
+        suppressed, self._suppressed = self._suppressed, {}
+        elapsed = now - self._last_summary
+        self._last_summary = now
+        summary = Event(
+            type="warning",
+            name="events_suppressed",
+            namespace=self.summary_namespace,
+            message=(
+                f"Rate limited {sum(suppressed.values())} events from "
+                f"{len(suppressed)} sources in the last {elapsed:.1f}s"
+            ),
+            data={
+                "suppressed": {
+                    f"{namespace}:{etype}": count
+                    for (namespace, etype), count in suppressed.items()
+                },
+                "interval_seconds": elapsed,
+            },
+        )
+        task = loop.create_task(AsyncEventBus.get().emit(summary))
+        self._summary_tasks.add(task)
+        task.add_done_callback(self._summary_tasks.discard)
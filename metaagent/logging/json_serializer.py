@@ -1,6 +1,8 @@
 import os
 import warnings
-from typing import Any, Dict, Iterable, Set
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, Callable, Dict, Set
 from datetime import datetime, date
 from decimal import Decimal
 from pathlib import Path
@@ -8,15 +10,21 @@ from uuid import UUID
 from enum import Enum
 import dataclasses
 import inspect
+import weakref
 import httpx
 
-from metaagent.logging import logger
+# Types that are already JSON-native and can be returned as-is
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 class JSONSerializer:
     """
     A robust JSON serializer that handles various Python objects by attempting
     different serialization strategies recursively.
+
+    The strategy for each concrete type is resolved once and cached, so the
+    common case of JSON-native dicts, lists and primitives never goes through
+    the generic fallback chain.
     """
 
     MAX_DEPTH = 99  # Maximum recursion depth
@@ -34,11 +42,14 @@ class JSONSerializer:
         "refresh_token",
     }
 
+    # Map of concrete type -> serialization strategy, shared by all instances.
+    # Weak keys, so that classes created at runtime can still be garbage collected
+    _strategy_cache: "weakref.WeakKeyDictionary[type, Callable]" = weakref.WeakKeyDictionary()
+
     def __init__(self):
-        # Set of already processed objects to prevent infinite recursion
-        self._processed_objects: Set[int] = set()
         # Check if secrets should be logged in full
         self._log_secrets = os.getenv("LOG_SECRETS", "").upper() == "TRUE"
+        self._parent_obj = None
 
     def _redact_sensitive_value(self, value: str) -> str:
         """Redact sensitive values to show only first 10 chars."""
@@ -52,112 +63,216 @@ class JSONSerializer:
 
     def serialize(self, obj: Any) -> Any:
         """Main entry point for serialization."""
-        # Reset processed objects for new serialization
-        self._processed_objects.clear()
-        return self._serialize_object(obj, depth=0)
+        if type(obj) in _PRIMITIVE_TYPES:
+            return obj
+        self._parent_obj = obj
+        # Ids of the containers on the current recursion path, used to break cycles
+        return self._serialize_object(obj, 0, set())
 
-    def _is_sensitive_key(self, key: str) -> bool:
+    def _is_sensitive_key(self, key: Any) -> bool:
         """Check if a key likely contains sensitive information."""
-        key = str(key).lower()
-        return any(sensitive in key for sensitive in self.SENSITIVE_FIELDS)
+        return _is_sensitive_key(str(key))
+
+    def _serialize_object(self, obj: Any, depth: int = 0, seen: Set[int] | None = None) -> Any:
+        """Recursively serialize an object using the cached strategy for its type."""
+        cls = type(obj)
+        if cls in _PRIMITIVE_TYPES:
+            return obj
 
-    def _serialize_object(self, obj: Any, depth: int = 0) -> Any:
-        """Recursively serialize an object using various strategies."""
-        # Handle None
-        if obj is None:
-            return None
+        if seen is None:
+            seen = set()
 
-        if depth == 0:
-            self._parent_obj = obj
         # Check depth
         if depth > self.MAX_DEPTH:
             warnings.warn(
-                f"Maximum recursion depth ({self.MAX_DEPTH}) exceeded while serializing object of type {type(obj).__name__} parent: {type(self._parent_obj).__name__}"
+                f"Maximum recursion depth ({self.MAX_DEPTH}) exceeded while serializing object of type {cls.__name__} parent: {type(self._parent_obj).__name__}"
             )
             return str(obj)
 
-        # Prevent infinite recursion
+        strategy = self._strategy_cache.get(cls)
+        if strategy is None:
+            strategy = self._resolve_strategy(cls)
+            self._strategy_cache[cls] = strategy
+
+        try:
+            return strategy(self, obj, depth, seen)
+        except Exception as e:
+            # If all serialization attempts fail, return string representation
+            return f"<unserializable: {cls.__name__}, error: {str(e)}>"
+
+    @classmethod
+    def _resolve_strategy(cls, obj_type: type) -> Callable:
+        """Pick the serialization strategy for a concrete type (in priority order)."""
+        # Imported lazily: the logger module imports the transports, which import us
+        from metaagent.logging import logger
+
+        if issubclass(obj_type, httpx.Response):
+            return cls._serialize_httpx_response
+        if issubclass(obj_type, logger.Logger):
+            return cls._serialize_logger
+
+        # Basic JSON-serializable types (including str/int subclasses such as str enums)
+        if issubclass(obj_type, (str, int, float, bool)):
+            return cls._serialize_identity
+
+        # Handle common built-in types
+        if issubclass(obj_type, (datetime, date)):
+            return cls._serialize_isoformat
+        if issubclass(obj_type, (Decimal, UUID, Path)):
+            return cls._serialize_str
+        if issubclass(obj_type, Enum):
+            return cls._serialize_enum
+
+        # Handle callables
+        if any("__call__" in vars(base) for base in obj_type.__mro__):
+            return cls._serialize_callable
+
+        # Handle Pydantic models
+        if hasattr(obj_type, "model_dump"):  # Pydantic v2
+            return cls._serialize_pydantic
+        if hasattr(obj_type, "dict"):  # Pydantic v1
+            return cls._serialize_pydantic_v1
+
+        # Handle dataclasses
+        if dataclasses.is_dataclass(obj_type):
+            return cls._serialize_dataclass
+
+        # Handle objects with custom serialization method
+        if hasattr(obj_type, "to_json"):
+            return cls._serialize_to_json
+        if hasattr(obj_type, "to_dict"):
+            return cls._serialize_to_dict
+
+        # Handle dictionaries with sensitive data redaction
+        if issubclass(obj_type, dict):
+            return cls._serialize_dict
+
+        # Handle iterables (lists, tuples, sets)
+        if issubclass(obj_type, Iterable) and not issubclass(obj_type, (str, bytes)):
+            return cls._serialize_iterable
+
+        return cls._serialize_generic
+
+    def _serialize_identity(self, obj: Any, depth: int, seen: Set[int]) -> Any:
+        return obj
+
+    def _serialize_httpx_response(self, obj: httpx.Response, depth: int, seen: Set[int]) -> str:
+        return f"<httpx.Response [{obj.status_code}] {obj.url}>"
+
+    def _serialize_logger(self, obj: Any, depth: int, seen: Set[int]) -> str:
+        return "<logging: logger>"
+
+    def _serialize_isoformat(self, obj: date, depth: int, seen: Set[int]) -> str:
+        return obj.isoformat()
+
+    def _serialize_str(self, obj: Any, depth: int, seen: Set[int]) -> str:
+        return str(obj)
+
+    def _serialize_enum(self, obj: Enum, depth: int, seen: Set[int]) -> Any:
+        return obj.value
+
+    def _serialize_callable(self, obj: Any, depth: int, seen: Set[int]) -> str:
+        return f"<callable: {obj.__name__}>"
+
+    def _serialize_pydantic(self, obj: Any, depth: int, seen: Set[int]) -> Any:
+        return self._serialize_nested(obj, obj.model_dump(), depth, seen)
+
+    def _serialize_pydantic_v1(self, obj: Any, depth: int, seen: Set[int]) -> Any:
+        return self._serialize_nested(obj, obj.dict(), depth, seen)
+
+    def _serialize_dataclass(self, obj: Any, depth: int, seen: Set[int]) -> Any:
+        return self._serialize_nested(obj, dataclasses.asdict(obj), depth, seen)
+
+    def _serialize_to_json(self, obj: Any, depth: int, seen: Set[int]) -> Any:
+        return self._serialize_nested(obj, obj.to_json(), depth, seen)
+
+    def _serialize_to_dict(self, obj: Any, depth: int, seen: Set[int]) -> Any:
+        return self._serialize_nested(obj, obj.to_dict(), depth, seen)
+
+    def _serialize_nested(self, obj: Any, converted: Any, depth: int, seen: Set[int]) -> Any:
+        """Serialize the converted form of `obj`, guarding against cycles through `obj`."""
+        obj_id = id(obj)
+        if obj_id in seen:
+            return str(obj)
+        seen.add(obj_id)
+        try:
+            return self._serialize_object(converted, depth, seen)
+        finally:
+            seen.discard(obj_id)
+
+    def _serialize_dict(self, obj: dict, depth: int, seen: Set[int]) -> Dict[str, Any]:
         obj_id = id(obj)
-        if obj_id in self._processed_objects:
+        if obj_id in seen:
             return str(obj)
-        self._processed_objects.add(obj_id)
+        seen.add(obj_id)
+        try:
+            result = {}
+            for key, value in obj.items():
+                key = str(key)
+                if _is_sensitive_key(key):
+                    value = self._serialize_sensitive_value(value, depth, seen)
+                elif type(value) not in _PRIMITIVE_TYPES:
+                    value = self._serialize_object(value, depth + 1, seen)
+                result[key] = value
+            return result
+        finally:
+            seen.discard(obj_id)
 
-        # Try different serialization strategies in order
+    def _serialize_iterable(self, obj: Iterable, depth: int, seen: Set[int]) -> list:
+        obj_id = id(obj)
+        if obj_id in seen:
+            return str(obj)
+        seen.add(obj_id)
         try:
-            if isinstance(obj, httpx.Response):
-                return f"<httpx.Response [{obj.status_code}] {obj.url}>"
-
-            if isinstance(obj, logger.Logger):
-                return "<logging: logger>"
-
-            # Basic JSON-serializable types
-            if isinstance(obj, (str, int, float, bool)):
-                return obj
-
-            # Handle common built-in types
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            if isinstance(obj, (Decimal, UUID)):
-                return str(obj)
-            if isinstance(obj, Path):
-                return str(obj)
-            if isinstance(obj, Enum):
-                return obj.value
-
-            # Handle callables
-            if callable(obj):
-                return f"<callable: {obj.__name__}>"
-
-            # Handle Pydantic models
-            if hasattr(obj, "model_dump"):  # Pydantic v2
-                return self._serialize_object(obj.model_dump())
-            if hasattr(obj, "dict"):  # Pydantic v1
-                return self._serialize_object(obj.dict())
-
-            # Handle dataclasses
-            if dataclasses.is_dataclass(obj):
-                return self._serialize_object(dataclasses.asdict(obj))
-
-            # Handle objects with custom serialization method
-            if hasattr(obj, "to_json"):
-                return self._serialize_object(obj.to_json())
-            if hasattr(obj, "to_dict"):
-                return self._serialize_object(obj.to_dict())
-
-            # Handle dictionaries with sensitive data redaction
-            if isinstance(obj, Dict):
-                return {
-                    str(key): self._redact_sensitive_value(value)
-                    if self._is_sensitive_key(key)
-                    else self._serialize_object(value, depth + 1)
-                    for key, value in obj.items()
-                }
+            return [
+                item
+                if type(item) in _PRIMITIVE_TYPES
+                else self._serialize_object(item, depth + 1, seen)
+                for item in obj
+            ]
+        finally:
+            seen.discard(obj_id)
 
-            # Handle iterables (lists, tuples, sets)
-            if isinstance(obj, Iterable) and not isinstance(obj, (str, bytes)):
-                return [self._serialize_object(item, depth + 1) for item in obj]
+    def _serialize_sensitive_value(self, value: Any, depth: int, seen: Set[int]) -> Any:
+        """Redact string secrets; anything else is serialized so the output stays JSON-safe."""
+        if isinstance(value, str):
+            return self._redact_sensitive_value(value)
+        return self._serialize_object(value, depth + 1, seen)
 
+    def _serialize_generic(self, obj: Any, depth: int, seen: Set[int]) -> Any:
+        """Slow path for arbitrary objects: __dict__, then public attributes, then str()."""
+        obj_id = id(obj)
+        if obj_id in seen:
+            return str(obj)
+        seen.add(obj_id)
+        try:
             # Handle objects with __dict__
             if hasattr(obj, "__dict__"):
-                return self._serialize_object(obj.__dict__, depth + 1)
+                return self._serialize_object(obj.__dict__, depth + 1, seen)
 
             # Handle objects with attributes
-            if inspect.getmembers(obj):
+            members = inspect.getmembers(obj)
+            if members:
                 return {
-                    name: self._redact_sensitive_value(value)
-                    if self._is_sensitive_key(name)
-                    else self._serialize_object(value, depth + 1)
-                    for name, value in inspect.getmembers(obj)
+                    name: self._serialize_sensitive_value(value, depth, seen)
+                    if _is_sensitive_key(name)
+                    else self._serialize_object(value, depth + 1, seen)
+                    for name, value in members
                     if not name.startswith("_") and not inspect.ismethod(value)
                 }
 
             # Fallback: convert to string
             return str(obj)
-
-        except Exception as e:
-            # If all serialization attempts fail, return string representation
-            return f"<unserializable: {type(obj).__name__}, error: {str(e)}>"
+        finally:
+            seen.discard(obj_id)
 
     def __call__(self, obj: Any) -> Any:
         """Make the serializer callable."""
         return self.serialize(obj)
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Check (and memoize) whether a key likely contains sensitive information."""
+    key = key.lower()
+    return any(sensitive in key for sensitive in JSONSerializer.SENSITIVE_FIELDS)
@@ -113,14 +113,17 @@ class ProgressListener(LifecycleAwareListener):
     FilteredListener, we get events before any filtering occurs.
     """
 
-    def __init__(self, display=None):
+    def __init__(self, display=None, max_fps: float | None = None):
         """Initialize the progress listener.
         Args:
             display: Optional display handler. If None, the shared progress_display will be used.
+            max_fps: Optional cap on how often the display renders; updates in between are coalesced.
         """
         from metaagent.progress_display import progress_display
 
         self.display = display or progress_display
+        if max_fps is not None:
+            self.display.max_fps = max_fps
 
     async def start(self):
         """Start the progress display."""
@@ -0,0 +1,451 @@
+"""
+Sidecar index for JSONL event logs written by FileTransport, including:
+- LogIndexWriter: appends one compact entry per record next to the log as <log>.idx
+- IndexedLogReader: seeks directly to the records of a session, trace or time range
+- A small CLI to query logs and (re)build indexes
+
+An index starts with a magic header followed by two kinds of fixed-layout entries:
+STRING entries intern session and trace ids, and RECORD entries hold the byte
+offset and length of one JSONL line together with its timestamp and interned
+session/trace ids. The file is append-only, so an index for a live log is always
+readable, and a truncated tail from a crashed writer is simply ignored. Lines the
+index does not cover yet (e.g. written before indexing was enabled) are indexed
+the next time the writer appends, and readers scan any part of a log that its
+index does not cover.
+
+Rotated segments (<stem>.<index><suffix>) carry their own index, so each segment
+can be queried, moved or deleted independently.
+
+Usage:
+    python -m metaagent.logging.log_index query logs/mcp-agent.jsonl --session-id <id>
+    python -m metaagent.logging.log_index build logs/mcp-agent.jsonl
+"""
+
+import argparse
+import json
+import struct
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple
+
+INDEX_MAGIC = b"MAEVIDX\x01"
+
+ENTRY_STRING = 0x01
+ENTRY_RECORD = 0x02
+
+# kind, string id, utf-8 length
+_STRING_HEADER = struct.Struct("<BIH")
+# kind, byte offset, byte length, timestamp, session string id, trace string id
+_RECORD = struct.Struct("<BQIdII")
+
+TIME_BUCKET_SECONDS = 60
+"""Granularity of the in-memory time buckets used for time range lookups"""
+
+
+def index_path(log_path: str | Path) -> Path:
+    """Path of the sidecar index for a log file, e.g. mcp-agent.jsonl.idx"""
+    log_path = Path(log_path)
+    return log_path.with_name(f"{log_path.name}.idx")
+
+
+def rotated_path(log_path: str | Path, index: int) -> Path:
+    """Path of rotated segment `index` for a log file, e.g. mcp-agent.00003.jsonl"""
+    log_path = Path(log_path)
+    return log_path.with_name(f"{log_path.stem}.{index:05d}{log_path.suffix}")
+
+
+def list_log_segments(log_path: str | Path) -> List[Path]:
+    """Rotated segments of a log file, oldest first, followed by the live file."""
+    log_path = Path(log_path)
+    segments = sorted(
+        log_path.parent.glob(f"{log_path.stem}.[0-9]*{log_path.suffix}")
+    )
+    if log_path.exists():
+        segments.append(log_path)
+    return segments
+
+
+class LogIndexWriter:
+    """Appends index entries for records written to a JSONL log."""
+
+    def __init__(self, log_path: str | Path):
+        self.log_path = Path(log_path)
+        self.path = index_path(self.log_path)
+        self._file: BinaryIO | None = None
+        self._strings: Dict[str, int] = {}
+        self._end_offset = 0
+
+    def _open(self) -> None:
+        if self.path.exists() and self.path.stat().st_size > len(INDEX_MAGIC):
+            # Continue an index from a previous run: reuse its string table
+            index = LogIndex.load(self.path)
+            self._strings = {value: string_id for string_id, value in index.strings.items()}
+            self._end_offset = index.end_offset
+            self._file = open(self.path, "ab")
+        else:
+            self._file = open(self.path, "wb")
+            self._file.write(INDEX_MAGIC)
+            self._strings = {}
+            self._end_offset = 0
+
+    def _intern(self, value: str | None, entries: List[bytes]) -> int:
+        if value is None:
+            return 0
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings) + 1
+            self._strings[value] = string_id
+            encoded = value.encode("utf-8")
+            entries.append(_STRING_HEADER.pack(ENTRY_STRING, string_id, len(encoded)) + encoded)
+        return string_id
+
+    def _backfill(self, upto: int) -> None:
+        """Index the log's lines between the end of the index and `upto`."""
+        entries: List[bytes] = []
+        offset = self._end_offset
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            while offset < upto:
+                line = f.readline(upto - offset)
+                if not line:
+                    break
+                fields = _index_fields(line)
+                if fields is not None:
+                    timestamp, session_id, trace_id = fields
+                    session_string_id = self._intern(session_id, entries)
+                    trace_string_id = self._intern(trace_id, entries)
+                    entries.append(
+                        _RECORD.pack(
+                            ENTRY_RECORD, offset, len(line), timestamp,
+                            session_string_id, trace_string_id,
+                        )
+                    )
+                offset += len(line)
+        self._file.write(b"".join(entries))
+        self._file.flush()
+        self._end_offset = offset
+
+    def add(
+        self,
+        offset: int,
+        length: int,
+        timestamp: float,
+        session_id: str | None = None,
+        trace_id: str | None = None,
+    ) -> None:
+        """Record that the line at `offset` (of `length` bytes) belongs to a session/trace."""
+        if self._file is None:
+            self._open()
+        if offset < self._end_offset:
+            # The log was truncated or replaced underneath us; start a fresh index
+            self.reset()
+        if offset > self._end_offset:
+            # Lines written while the log was not indexed
+            self._backfill(offset)
+
+        entries: List[bytes] = []
+        session_string_id = self._intern(session_id, entries)
+        trace_string_id = self._intern(trace_id, entries)
+        entries.append(
+            _RECORD.pack(
+                ENTRY_RECORD, offset, length, timestamp, session_string_id, trace_string_id
+            )
+        )
+        self._file.write(b"".join(entries))
+        self._file.flush()
+        self._end_offset = offset + length
+
+    def reset(self) -> None:
+        """Discard the index (e.g. after the log was rotated or truncated)."""
+        self.close()
+        self._file = open(self.path, "wb")
+        self._file.write(INDEX_MAGIC)
+        self._strings = {}
+        self._end_offset = 0
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class LogIndex:
+    """An index loaded into memory, with postings per session, trace and time bucket."""
+
+    def __init__(self):
+        self.strings: Dict[int, str] = {}
+        # (offset, length, timestamp, session string id, trace string id), in log order
+        self.records: List[Tuple[int, int, float, int, int]] = []
+        self.end_offset = 0
+
+        self._by_session: Dict[int, List[int]] | None = None
+        self._by_trace: Dict[int, List[int]] | None = None
+        self._buckets: List[int] | None = None
+        self._bucket_records: List[List[int]] | None = None
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LogIndex":
+        index = cls()
+        data = Path(path).read_bytes()
+        if not data.startswith(INDEX_MAGIC):
+            raise ValueError(f"Not a log index: {path}")
+
+        offset = len(INDEX_MAGIC)
+        while offset < len(data):
+            kind = data[offset]
+            if kind == ENTRY_STRING:
+                if offset + _STRING_HEADER.size > len(data):
+                    break
+                _, string_id, length = _STRING_HEADER.unpack_from(data, offset)
+                start = offset + _STRING_HEADER.size
+                if start + length > len(data):
+                    break
+                index.strings[string_id] = data[start:start + length].decode("utf-8")
+                offset = start + length
+            elif kind == ENTRY_RECORD:
+                if offset + _RECORD.size > len(data):
+                    break
+                record = _RECORD.unpack_from(data, offset)[1:]
+                index.records.append(record)
+                index.end_offset = record[0] + record[1]
+                offset += _RECORD.size
+            else:
+                # Corrupt tail; keep what we could decode
+                break
+        return index
+
+    def _string_ids(self, value: str) -> List[int]:
+        return [string_id for string_id, s in self.strings.items() if s == value]
+
+    def _build_postings(self) -> None:
+        by_session: Dict[int, List[int]] = defaultdict(list)
+        by_trace: Dict[int, List[int]] = defaultdict(list)
+        by_bucket: Dict[int, List[int]] = defaultdict(list)
+        for position, (_, _, timestamp, session_string_id, trace_string_id) in enumerate(
+            self.records
+        ):
+            if session_string_id:
+                by_session[session_string_id].append(position)
+            if trace_string_id:
+                by_trace[trace_string_id].append(position)
+            by_bucket[int(timestamp // TIME_BUCKET_SECONDS)].append(position)
+
+        self._by_session = by_session
+        self._by_trace = by_trace
+        self._buckets = sorted(by_bucket)
+        self._bucket_records = [by_bucket[bucket] for bucket in self._buckets]
+
+    def lookup(
+        self,
+        session_id: str | None = None,
+        trace_id: str | None = None,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> List[Tuple[int, int]]:
+        """Return (offset, length) of the matching records, in log order."""
+        if self._by_session is None:
+            self._build_postings()
+
+        candidates: set[int] | None = None
+
+        def narrow(positions) -> None:
+            nonlocal candidates
+            positions = set(positions)
+            candidates = positions if candidates is None else candidates & positions
+
+        if session_id is not None:
+            narrow(p for sid in self._string_ids(session_id) for p in self._by_session.get(sid, ()))
+        if trace_id is not None:
+            narrow(p for tid in self._string_ids(trace_id) for p in self._by_trace.get(tid, ()))
+        if start is not None or end is not None:
+            first = 0 if start is None else bisect_left(self._buckets, int(start // TIME_BUCKET_SECONDS))
+            last = len(self._buckets) if end is None else bisect_left(
+                self._buckets, int(end // TIME_BUCKET_SECONDS) + 1
+            )
+            narrow(p for records in self._bucket_records[first:last] for p in records)
+
+        positions = range(len(self.records)) if candidates is None else sorted(candidates)
+        matches = []
+        for position in positions:
+            offset, length, timestamp, _, _ = self.records[position]
+            if start is not None and timestamp < start:
+                continue
+            if end is not None and timestamp >= end:
+                continue
+            matches.append((offset, length))
+        return matches
+
+
+def _record_timestamp(record: Dict[str, Any]) -> float:
+    return datetime.fromisoformat(record["timestamp"]).timestamp()
+
+
+def _index_fields(line: bytes) -> Tuple[float, str | None, str | None] | None:
+    """(timestamp, session_id, trace_id) of a JSONL log line, or None if it is not a record."""
+    try:
+        record = json.loads(line)
+        return _record_timestamp(record), record.get("session_id"), record.get("trace_id")
+    except (json.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError):
+        return None
+
+
+class IndexedLogReader:
+    """
+    Reads records for a session, trace or time range from a JSONL log and its
+    rotated segments, seeking straight to them through each segment's index.
+    Segments without an index, and the parts of a segment that its index does
+    not cover, are scanned line by line.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: The live log path; its rotated segments are read as well
+        """
+        self.segments = list_log_segments(path)
+
+    def iter_records(
+        self,
+        session_id: str | None = None,
+        trace_id: str | None = None,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield matching records as dicts, oldest segment first.
+
+        Args:
+            session_id: Only records from this session
+            trace_id: Only records from this trace
+            start: Only records at or after this time
+            end: Only records before this time
+        """
+        if isinstance(start, datetime):
+            start = start.timestamp()
+        if isinstance(end, datetime):
+            end = end.timestamp()
+
+        for segment in self.segments:
+            if index_path(segment).exists():
+                yield from self._iter_indexed(segment, session_id, trace_id, start, end)
+            else:
+                yield from self._iter_scan(segment, session_id, trace_id, start, end)
+
+    @staticmethod
+    def _iter_indexed(
+        segment: Path,
+        session_id: str | None,
+        trace_id: str | None,
+        start: float | None,
+        end: float | None,
+    ) -> Iterator[Dict[str, Any]]:
+        index = LogIndex.load(index_path(segment))
+        if index.records and index.records[0][0] > 0:
+            # The index does not cover the start of the log
+            yield from IndexedLogReader._iter_scan(segment, session_id, trace_id, start, end)
+            return
+        with open(segment, "rb") as f:
+            for offset, length in index.lookup(session_id, trace_id, start, end):
+                f.seek(offset)
+                line = f.read(length)
+                if len(line) < length:
+                    # Index entries past the end of a truncated log
+                    return
+                yield json.loads(line)
+        # Lines appended after the last indexed record
+        yield from IndexedLogReader._iter_scan(
+            segment, session_id, trace_id, start, end, offset=index.end_offset
+        )
+
+    @staticmethod
+    def _iter_scan(
+        segment: Path,
+        session_id: str | None,
+        trace_id: str | None,
+        start: float | None,
+        end: float | None,
+        offset: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        with open(segment, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if session_id is not None and record.get("session_id") != session_id:
+                    continue
+                if trace_id is not None and record.get("trace_id") != trace_id:
+                    continue
+                if start is not None or end is not None:
+                    timestamp = _record_timestamp(record)
+                    if start is not None and timestamp < start:
+                        continue
+                    if end is not None and timestamp >= end:
+                        continue
+                yield record
+
+
+def build_index(log_path: str | Path) -> int:
+    """
+    (Re)build the index of an existing JSONL log segment from the session_id,
+    trace_id and timestamp of each line. Returns the number of indexed records.
+    """
+    log_path = Path(log_path)
+    writer = LogIndexWriter(log_path)
+    try:
+        writer.reset()
+        writer._backfill(log_path.stat().st_size)
+    finally:
+        writer.close()
+    return len(LogIndex.load(index_path(log_path)).records)
+
+
+def parse_time(value: str) -> float:
+    """Parse a CLI time argument: epoch seconds or an ISO timestamp."""
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m metaagent.logging.log_index",
+        description="Query indexed JSONL event logs or (re)build their indexes.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query = subparsers.add_parser("query")
+    query.add_argument("path", help="Live log path; rotated segments are included")
+    query.add_argument("--session-id")
+    query.add_argument("--trace-id")
+    query.add_argument("--start", type=parse_time, help="ISO time or epoch seconds")
+    query.add_argument("--end", type=parse_time, help="ISO time or epoch seconds")
+
+    build = subparsers.add_parser("build")
+    build.add_argument("path", help="Live log path; rotated segments are indexed too")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        for segment in list_log_segments(args.path):
+            count = build_index(segment)
+            print(f"Indexed {count} records in {segment}", file=sys.stderr)
+    else:
+        reader = IndexedLogReader(args.path)
+        for record in reader.iter_records(
+            session_id=args.session_id,
+            trace_id=args.trace_id,
+            start=args.start,
+            end=args.end,
+        ):
+            sys.stdout.write(json.dumps(record, separators=(",", ":")) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,25 +36,23 @@ class Logger:
         self.session_id = session_id
         self.event_bus = AsyncEventBus.get()
 
-    def _ensure_event_loop(self):
-        """Ensure we have an event loop we can use."""
+    def _emit_event(self, event: Event):
+        """
+        Emit an event on the bus.
+        On the bus loop (or before the bus is bound to one) the emit is scheduled
+        directly; from any other thread it is handed over to the bus loop.
+        No event loop is ever created here.
+        """
         try:
-            return asyncio.get_running_loop()
+            loop = asyncio.get_running_loop()
         except RuntimeError:
-            # If no loop is running, create a new one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            return loop
+            loop = None
 
-    def _emit_event(self, event: Event):
-        """Emit an event by running it in the event loop."""
-        loop = self._ensure_event_loop()
-        if loop.is_running():
-            # If we're in a thread with a running loop, schedule the coroutine
-            asyncio.create_task(self.event_bus.emit(event))
+        bus_loop = self.event_bus.loop
+        if loop is not None and (bus_loop is None or loop is bus_loop):
+            loop.create_task(self.event_bus.emit(event))
         else:
-            # If no loop is running, run it until the emit completes
-            loop.run_until_complete(self.event_bus.emit(event))
+            self.event_bus.emit_threadsafe(event)
 
     def event(
         self,
@@ -226,7 +224,9 @@ class LoggingConfig:
 
         # Only add progress listener if enabled in settings
         if "progress" not in bus.listeners and kwargs.get("progress_display", True):
-            bus.add_listener("progress", ProgressListener())
+            bus.add_listener(
+                "progress", ProgressListener(max_fps=kwargs.get("progress_max_fps"))
+            )
 
         if "batching" not in bus.listeners:
             bus.add_listener(
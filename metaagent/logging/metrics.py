@@ -0,0 +1,407 @@
+"""
+In-process metrics registry for MCP Agent, including:
+- Counters, gauges and fixed-bucket histograms with labels
+- Prometheus text exposition, as a file dump or a small local HTTP endpoint
+
+Recording is a dict lookup plus an addition under a per-series lock, so it is
+cheap enough to leave on in production.
+
+Usage:
+    from metaagent.logging.metrics import metrics
+
+    calls = metrics.counter("tool_calls_total", "Tool calls", ["server"])
+    calls.labels("fetch").inc()
+
+    latency = metrics.histogram("tool_call_duration_seconds", "Tool call latency", ["server"])
+    with latency.labels("fetch").time():
+        ...
+
+    print(metrics.render())
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Default latency buckets in seconds"""
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value):
+        return f"{int(value)}"
+    return repr(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter (amount must be non-negative)."""
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class _GaugeChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @contextmanager
+    def track_inprogress(self) -> Iterator[None]:
+        """Increment the gauge while the block runs."""
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class _HistogramChild:
+    __slots__ = ("_upper_bounds", "_counts", "_sum", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self._upper_bounds = upper_bounds
+        # One slot per bucket plus +Inf; stored non-cumulative, accumulated at render time
+        self._counts = [0] * (len(upper_bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._upper_bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall-clock duration of the block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self._counts), self._sum
+
+
+class _Metric:
+    """Base class for a metric family: a name, a help string and labelled series."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str, **kwargs: str):
+        """Return the series for the given label values (positional or by name)."""
+        if kwargs:
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(value) for value in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {values}"
+            )
+
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = self._new_child()
+        return child
+
+    def _default_child(self):
+        if self.labelnames:
+            raise ValueError(f"Metric {self.name} has labels; use .labels(...) first")
+        return self.labels()
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for values, child in list(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    def _render_child(self, values: Tuple[str, ...], child) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default_child().inc(amount)
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (e.g. queue depth)."""
+
+    metric_type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default_child().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default_child().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default_child().dec(amount)
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(
+            sorted(b for b in buckets if b != float("inf"))
+        )
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default_child().observe(value)
+
+    def time(self):
+        return self._default_child().time()
+
+    def _render_child(self, values: Tuple[str, ...], child: _HistogramChild) -> List[str]:
+        counts, total = child.snapshot()
+        lines = []
+        cumulative = 0
+        for upper_bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = f'le="{_format_value(upper_bound)}"'
+            lines.append(
+                f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}"
+            )
+        labels = _format_labels(self.labelnames, values)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registry of metric families.
+    `counter`/`gauge`/`histogram` return the existing family if one with the
+    same name was already registered, so modules can declare metrics at import time.
+    """
+
+    def __init__(self, prefix: str = "metaagent_"):
+        self.prefix = prefix
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._export_path: Path | None = None
+        self._export_stop: threading.Event | None = None
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames, **kwargs):
+        full_name = f"{self.prefix}{name}"
+        metric = self._metrics.get(full_name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(full_name)
+                if metric is None:
+                    metric = cls(full_name, documentation, labelnames, **kwargs)
+                    self._metrics[full_name] = metric
+        if not isinstance(metric, cls):
+            raise ValueError(
+                f"Metric {full_name} already registered as {metric.metric_type}"
+            )
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> _Metric | None:
+        """Look up a metric family by name (with or without the registry prefix)."""
+        return self._metrics.get(name) or self._metrics.get(f"{self.prefix}{name}")
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_to(self, path: str | Path) -> None:
+        """Atomically write the exposition to a file (e.g. for a node_exporter textfile collector)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve the exposition over HTTP at /metrics from a daemon thread."""
+        if self._server is not None:
+            return self._server
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        thread = threading.Thread(
+            target=self._server.serve_forever, name="metaagent-metrics", daemon=True
+        )
+        thread.start()
+        return self._server
+
+    def export_periodically(self, path: str | Path, interval: float = 15.0) -> None:
+        """Rewrite the exposition file every `interval` seconds from a daemon thread."""
+        if self._export_stop is not None:
+            return
+        self._export_path = Path(path)
+        self._export_stop = stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    self.write_to(self._export_path)
+                except OSError as e:
+                    print(f"Error writing metrics to {self._export_path}: {e}")
+
+        threading.Thread(target=run, name="metaagent-metrics-export", daemon=True).start()
+
+    def shutdown(self) -> None:
+        """Stop the HTTP endpoint and periodic export, writing a final export file."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._export_stop is not None:
+            self._export_stop.set()
+            self._export_stop = None
+            try:
+                self.write_to(self._export_path)
+            except OSError as e:
+                print(f"Error writing metrics to {self._export_path}: {e}")
+
+
+metrics = MetricsRegistry()
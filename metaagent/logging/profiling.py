@@ -0,0 +1,289 @@
+"""
+Opt-in profiling for MCP Agent, including:
+- Per-stage wall-clock timers for workflow runs, executor tasks, LLM calls and tool calls
+- A sampling profiler that records collapsed stacks of all threads
+- One profile artifact per workflow run (plus one for work outside any run)
+
+Artifacts are written to `ProfilingSettings.output_dir`:
+- `<run>-<timestamp>.folded`: collapsed stacks, one `frame;frame;frame count` per
+  line, usable with flamegraph.pl, speedscope or inferno
+- `<run>-<timestamp>.stages.txt`: per-stage timing table
+
+Concurrent runs share the sampler, so each run's stacks also include whatever
+else the process was doing while it was active. The session artifact only has the
+stacks sampled while no run was active.
+
+Usage:
+    from metaagent.logging.profiling import profiler
+
+    @profiler.profiled("my_stage")
+    async def my_step():
+        ...
+
+    with profiler.stage("parse"):
+        ...
+"""
+
+import asyncio
+import functools
+import inspect
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from metaagent.config import ProfilingSettings
+
+# Stacks deeper than this are truncated at the root end
+_MAX_STACK_DEPTH = 128
+
+
+class _StageStats:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class ProfileRun:
+    """Stage timings and sampled stacks collected for one run."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self.wall_time = 0.0
+        self.stages: Dict[str, _StageStats] = {}
+        self.stacks: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record_stage(self, stage: str, elapsed: float) -> None:
+        with self._lock:
+            stats = self.stages.get(stage)
+            if stats is None:
+                stats = self.stages[stage] = _StageStats()
+            stats.count += 1
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+
+    def record_stacks(self, stacks: List[str]) -> None:
+        with self._lock:
+            self.stacks.update(stacks)
+
+    def finish(self) -> None:
+        self.wall_time = time.perf_counter() - self._start
+
+    def format_stages(self) -> str:
+        """Render the per-stage timing table, slowest stage first."""
+        header = f"{'stage':<60} {'calls':>7} {'total s':>10} {'mean ms':>10} {'max ms':>10} {'% wall':>7}"
+        lines = [
+            f"# {self.name} started {self.started_at.isoformat()} wall {self.wall_time:.3f}s",
+            header,
+            "-" * len(header),
+        ]
+        with self._lock:
+            stages = sorted(self.stages.items(), key=lambda item: item[1].total, reverse=True)
+        for stage, stats in stages:
+            share = 100 * stats.total / self.wall_time if self.wall_time else 0.0
+            lines.append(
+                f"{stage[:60]:<60} {stats.count:>7} {stats.total:>10.3f} "
+                f"{1000 * stats.total / stats.count:>10.2f} {1000 * stats.max:>10.2f} {share:>6.1f}%"
+            )
+        return "\n".join(lines) + "\n"
+
+    def format_stacks(self) -> str:
+        """Render the sampled stacks in the collapsed (folded) stack format."""
+        with self._lock:
+            stacks = sorted(self.stacks.items())
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+    def write(self, output_dir: Path) -> Path:
+        """Write the artifacts for this run and return the path of the stage table."""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r"[^\w.-]+", "_", self.name).strip("_") or "run"
+        stem = f"{safe_name}-{self.started_at.strftime('%Y%m%d_%H%M%S_%f')}"
+        (output_dir / f"{stem}.folded").write_text(self.format_stacks(), encoding="utf-8")
+        stages_path = output_dir / f"{stem}.stages.txt"
+        stages_path.write_text(self.format_stages(), encoding="utf-8")
+        return stages_path
+
+
+def _collapse(frame, thread_name: str) -> str:
+    names = []
+    while frame is not None and len(names) < _MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    names.append(f"thread ({thread_name})")
+    return ";".join(reversed(names))
+
+
+class Profiler:
+    """
+    Process-wide profiler. Disabled (and nearly free) until `configure` is called
+    with profiling enabled.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.output_dir = Path("profiles")
+        self.sample_interval = 0.01
+
+        self._current_run: ContextVar[ProfileRun | None] = ContextVar(
+            "metaagent_profile_run", default=None
+        )
+        self._session_run: ProfileRun | None = None
+        self._active_runs: List[ProfileRun] = []
+        self._lock = threading.Lock()
+        self._sampler_stop: threading.Event | None = None
+
+    def configure(self, settings: "ProfilingSettings | None") -> None:
+        """Enable or disable profiling from application settings."""
+        self.shutdown()
+        self.enabled = settings is not None and settings.enabled
+        if not self.enabled:
+            return
+        self.output_dir = Path(settings.output_dir)
+        self.sample_interval = settings.sample_interval
+        # Collects stages and stacks that happen outside any workflow run
+        self._session_run = ProfileRun("session")
+        self._start_sampler()
+
+    def shutdown(self) -> None:
+        """Stop sampling and write the artifact for work done outside any run."""
+        if self._sampler_stop is not None:
+            self._sampler_stop.set()
+            self._sampler_stop = None
+        session_run, self._session_run = self._session_run, None
+        if session_run is not None and (session_run.stages or session_run.stacks):
+            session_run.finish()
+            self._write(session_run)
+
+    def _write(self, run: ProfileRun) -> None:
+        try:
+            run.write(self.output_dir)
+        except OSError as e:
+            print(f"Error writing profile for {run.name} to {self.output_dir}: {e}")
+
+    def _start_sampler(self) -> None:
+        self._sampler_stop = stop = threading.Event()
+        interval = self.sample_interval
+
+        def sample():
+            own_id = threading.get_ident()
+            while not stop.wait(interval):
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                stacks = [
+                    _collapse(frame, names.get(thread_id, str(thread_id)))
+                    for thread_id, frame in sys._current_frames().items()
+                    if thread_id != own_id
+                ]
+                with self._lock:
+                    runs = list(self._active_runs)
+                    # The session run only gets samples taken while no workflow run is active,
+                    # so that the same stacks are not counted in both artifacts
+                    if not runs and self._session_run is not None:
+                        runs.append(self._session_run)
+                for run in runs:
+                    run.record_stacks(stacks)
+
+        threading.Thread(target=sample, name="metaagent-profiler", daemon=True).start()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block as stage `name` of the current run."""
+        if not self.enabled:
+            yield
+            return
+        run = self._current_run.get() or self._session_run
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if run is not None:
+                run.record_stage(name, time.perf_counter() - start)
+
+    @contextmanager
+    def run(self, name: str) -> Iterator[ProfileRun | None]:
+        """
+        Profile a block as its own run and write its artifacts when it exits.
+        A run started inside another run is timed as a stage of the outer run.
+        """
+        if not self.enabled or self._current_run.get() is not None:
+            with self.stage(name):
+                yield None
+            return
+
+        profile_run = ProfileRun(name)
+        token = self._current_run.set(profile_run)
+        with self._lock:
+            self._active_runs.append(profile_run)
+        try:
+            with self.stage(name):
+                yield profile_run
+        finally:
+            self._current_run.reset(token)
+            with self._lock:
+                self._active_runs.remove(profile_run)
+            profile_run.finish()
+            self._write(profile_run)
+
+    def profiled(self, name: str | None = None, run: bool = False) -> Callable:
+        """
+        Decorator that times a function (sync, async or async generator) as a stage,
+        or as a separate run if `run` is set.
+        """
+
+        def decorator(func):
+            stage_name = name or func.__qualname__
+
+            def scope():
+                return self.run(stage_name) if run else self.stage(stage_name)
+
+            if inspect.isasyncgenfunction(func):
+
+                @functools.wraps(func)
+                async def async_gen_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        async for item in func(*args, **kwargs):
+                            yield item
+                        return
+                    with scope():
+                        async for item in func(*args, **kwargs):
+                            yield item
+
+                return async_gen_wrapper
+
+            if asyncio.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    with scope():
+                        return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with scope():
+                    return func(*args, **kwargs)
+
+            return sync_wrapper
+
+        return decorator
+
+
+profiler = Profiler()
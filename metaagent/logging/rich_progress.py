@@ -1,22 +1,54 @@
 """Rich-based progress display for MCP Agent."""
 
+import threading
 import time
-from typing import Optional
+from typing import Callable, Dict, Optional
 from rich.console import Console
+from rich.console import RenderableType
 from metaagent.console import console as default_console
 from metaagent.event_progress import ProgressEvent, ProgressAction
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from contextlib import contextmanager
 
 
+class _CoalescingProgress(Progress):
+    """Progress that applies pending updates right before each frame is rendered."""
+
+    def __init__(self, before_render: Callable[[], None], *args, **kwargs):
+        self._before_render = before_render
+        super().__init__(*args, **kwargs)
+
+    def get_renderable(self) -> RenderableType:
+        # Progress._lock is reentrant, so the pending updates can add and update tasks
+        with self._lock:
+            self._before_render()
+            return super().get_renderable()
+
+
+def _check_max_fps(max_fps: float) -> float:
+    if not max_fps > 0:
+        raise ValueError(f"max_fps must be positive, got {max_fps}")
+    return max_fps
+
+
 class RichProgressDisplay:
-    """Rich-based display for progress events."""
+    """
+    Rich-based display for progress events.
+
+    `update` only records the latest event per task; pending events are applied
+    (in the order their tasks were last updated) when the next frame is rendered,
+    at most `max_fps` times per second. Intermediate states of a task between two
+    frames are dropped.
+    """
 
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(self, console: Optional[Console] = None, max_fps: float = 10.0):
         """Initialize the progress display."""
         self.console = console or default_console
         self._taskmap = {}
-        self._progress = Progress(
+        self._pending: Dict[str, ProgressEvent] = {}
+        self._pending_lock = threading.Lock()
+        self._progress = _CoalescingProgress(
+            self.flush,
             SpinnerColumn(spinner_name="simpleDotsScrolling"),
             TextColumn(
                 "[progress.description]{task.description}|",
@@ -25,9 +57,20 @@ class RichProgressDisplay:
             TextColumn(text_format="{task.fields[details]}", style="dim white"),
             console=self.console,
             transient=False,
+            refresh_per_second=_check_max_fps(max_fps),
         )
         self._paused = False
 
+    @property
+    def max_fps(self) -> float:
+        """Maximum number of frames rendered per second."""
+        return self._progress.live.refresh_per_second
+
+    @max_fps.setter
+    def max_fps(self, value: float) -> None:
+        # Picked up by the refresh thread the next time the display is started
+        self._progress.live.refresh_per_second = _check_max_fps(value)
+
     def start(self):
         """start"""
 
@@ -82,7 +125,24 @@ class RichProgressDisplay:
         }.get(action, "white")
 
     def update(self, event: ProgressEvent) -> None:
-        """Update the progress display with a new event."""
+        """Queue an event for the next frame, replacing any pending event for the same task."""
+        task_name = event.agent_name or "default"
+        with self._pending_lock:
+            # Re-insert so pending events are applied in the order of their latest update
+            self._pending.pop(task_name, None)
+            self._pending[task_name] = event
+
+    def flush(self) -> None:
+        """Apply all pending events to the display."""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+        for event in pending.values():
+            self._apply(event)
+
+    def _apply(self, event: ProgressEvent) -> None:
+        """Apply a progress event to its task."""
         task_name = event.agent_name or "default"
 
         # Create new task if needed
@@ -13,18 +13,76 @@ from opentelemetry.propagate import extract as otel_extract
 from opentelemetry.trace import set_span_in_context
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
+from opentelemetry.sdk.trace.sampling import Sampler, SamplingResult, TraceIdRatioBased
 from opentelemetry.trace import SpanKind, Status, StatusCode
 
 from metaagent.context_dependent import ContextDependent
 
 if TYPE_CHECKING:
+    from metaagent.config import OpenTelemetrySettings
     from metaagent.context import Context
 
 
+class OperationSampler(Sampler):
+    """
+    Head-based sampler that samples root spans by trace id ratio, with optional
+    per-operation overrides keyed by span name or dotted span-name prefix
+    (e.g. "metaagent.mcp" matches "metaagent.mcp.mcp_aggregator.call_tool").
+    Wrap it in `ParentBased` so child spans follow the root decision.
+    """
+
+    def __init__(
+        self, default_rate: float = 1.0, operation_rates: Dict[str, float] | None = None
+    ):
+        self._default = TraceIdRatioBased(default_rate)
+        self._overrides = {
+            name: TraceIdRatioBased(rate)
+            for name, rate in (operation_rates or {}).items()
+        }
+        # Span name -> resolved sampler, so prefix matching runs once per operation
+        self._resolved: Dict[str, Sampler] = {}
+
+    def _sampler_for(self, name: str) -> Sampler:
+        sampler = self._resolved.get(name)
+        if sampler is None:
+            sampler = self._default
+            prefix = name
+            while prefix:
+                if prefix in self._overrides:
+                    sampler = self._overrides[prefix]
+                    break
+                prefix = prefix.rpartition(".")[0]
+            self._resolved[name] = sampler
+        return sampler
+
+    def should_sample(
+        self,
+        parent_context,
+        trace_id,
+        name,
+        kind=None,
+        attributes=None,
+        links=None,
+        trace_state=None,
+    ) -> SamplingResult:
+        return self._sampler_for(name).should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+
+    def get_description(self) -> str:
+        return f"OperationSampler{{{self._default.get_description()}}}"
+
+
 class TelemetryManager(ContextDependent):
     """
     Simple manager for creating OpenTelemetry spans automatically.
     Decorator usage: @telemetry.traced("SomeSpanName")
+
+    Sampling decisions are made by the tracer provider's sampler (see
+    `OperationSampler`); the decorator only pays for a span when one is needed:
+    - tracing disabled via `configure`: the wrapped function is called directly
+    - inside a trace that was sampled out: no child span is started
+    - arguments are only captured (and truncated) for recording spans
     """
 
     def __init__(self, context: Optional["Context"] = None, **kwargs):
@@ -32,6 +90,53 @@ class TelemetryManager(ContextDependent):
         # E.g.: from opentelemetry.sdk.trace import TracerProvider
         # trace.set_tracer_provider(TracerProvider(...))
         super().__init__(context=context, **kwargs)
+        self._enabled = True
+        self._tracer: trace.Tracer | None = None
+        self._record_args_enabled = True
+        self._max_arg_length = 256
+
+    def configure(
+        self,
+        settings: "OpenTelemetrySettings | None",
+        tracer: trace.Tracer | None = None,
+    ) -> None:
+        """
+        Apply OpenTelemetry settings to all functions decorated by this manager,
+        including ones decorated before the application context was initialized.
+        """
+        self._enabled = settings is not None and settings.enabled
+        self._tracer = tracer
+        if settings is not None:
+            self._record_args_enabled = settings.record_args
+            self._max_arg_length = settings.max_arg_length
+
+    def _get_tracer(self) -> trace.Tracer:
+        if self._tracer is None:
+            # Avoid self.context here: it would initialize the global context as a side effect
+            context_tracer = self._context.tracer if self._context is not None else None
+            self._tracer = context_tracer or trace.get_tracer("metaagent")
+        return self._tracer
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: Dict[str, Any] = None,
+    ):
+        """
+        Return a context manager that starts `name` as the current span, or None if no
+        span should be created (tracing disabled, or the enclosing trace was sampled out).
+        """
+        if not self._enabled:
+            return None
+        parent = trace.get_current_span()
+        parent_span_context = parent.get_span_context()
+        if parent_span_context.is_valid and not parent_span_context.trace_flags.sampled:
+            # The enclosing trace was sampled out; a child span would be dropped too
+            return None
+        return self._get_tracer().start_as_current_span(
+            name, kind=kind, attributes=attributes
+        )
 
     def traced(
         self,
@@ -47,16 +152,17 @@ class TelemetryManager(ContextDependent):
         def decorator(func):
             span_name = name or f"{func.__module__}.{func.__qualname__}"
 
-            tracer = self.context.tracer or trace.get_tracer("metaagent")
+            def start_span():
+                return self.start_span(span_name, kind=kind, attributes=attributes)
 
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs):
-                with tracer.start_as_current_span(span_name, kind=kind) as span:
-                    if attributes:
-                        for k, v in attributes.items():
-                            span.set_attribute(k, v)
-                    # Record simple args
-                    self._record_args(span, args, kwargs)
+                span_cm = start_span()
+                if span_cm is None:
+                    return await func(*args, **kwargs)
+                with span_cm as span:
+                    if span.is_recording():
+                        self._record_args(span, args, kwargs)
                     try:
                         res = await func(*args, **kwargs)
                         return res
@@ -67,12 +173,12 @@ class TelemetryManager(ContextDependent):
 
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
-                with tracer.start_as_current_span(span_name, kind=kind) as span:
-                    if attributes:
-                        for k, v in attributes.items():
-                            span.set_attribute(k, v)
-                    # Record simple args
-                    self._record_args(span, args, kwargs)
+                span_cm = start_span()
+                if span_cm is None:
+                    return func(*args, **kwargs)
+                with span_cm as span:
+                    if span.is_recording():
+                        self._record_args(span, args, kwargs)
                     try:
                         res = func(*args, **kwargs)
                         return res
@@ -89,13 +195,16 @@ class TelemetryManager(ContextDependent):
         return decorator
 
     def _record_args(self, span, args, kwargs):
-        """Optionally record primitive args as span attributes."""
+        """Optionally record primitive args as span attributes (truncated to max_arg_length)."""
+        if not self._record_args_enabled:
+            return
+        max_length = self._max_arg_length
         for i, arg in enumerate(args):
             if isinstance(arg, (str, int, float, bool)):
-                span.set_attribute(f"arg_{i}", str(arg))
+                span.set_attribute(f"arg_{i}", str(arg)[:max_length])
         for k, v in kwargs.items():
             if isinstance(v, (str, int, float, bool)):
-                span.set_attribute(k, str(v))
+                span.set_attribute(k, str(v)[:max_length])
 
 
 class MCPRequestTrace:
@@ -6,9 +6,11 @@ Transports for the Logger module for MCP Agent, including:
 
 import asyncio
 import json
+import os
 import uuid
 import datetime
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import Dict, List, Protocol
 from pathlib import Path
 
@@ -22,9 +24,22 @@ from metaagent.console import console
 from metaagent.logging.events import Event, EventFilter
 from metaagent.logging.json_serializer import JSONSerializer
 from metaagent.logging.listeners import EventListener, LifecycleAwareListener
+from metaagent.logging.log_index import (
+    LogIndexWriter,
+    index_path,
+    list_log_segments,
+    rotated_path,
+)
+from metaagent.logging.metrics import metrics
 from rich import print
 import traceback
 
+_dropped_events = metrics.counter(
+    "event_bus_dropped_events_total",
+    "Events dropped by the event bus before reaching listeners",
+    ["reason"],
+)
+
 
 class EventTransport(Protocol):
     """
@@ -116,6 +131,8 @@ class FileTransport(FilteredEventTransport):
         event_filter: EventFilter | None = None,
         mode: str = "a",
         encoding: str = "utf-8",
+        index: bool = False,
+        max_bytes: int | None = None,
     ):
         """Initialize FileTransport.
 
@@ -124,16 +141,37 @@ class FileTransport(FilteredEventTransport):
             event_filter: Optional filter for events
             mode: File open mode ('a' for append, 'w' for write)
             encoding: File encoding to use
+            index: Maintain a sidecar index (<log>.idx) for session/trace/time lookups
+            max_bytes: Rotate the log to <stem>.<index><suffix> once it would exceed this size
         """
         super().__init__(event_filter=event_filter)
         self.filepath = Path(filepath)
         self.mode = mode
         self.encoding = encoding
+        self.max_bytes = max_bytes
         self._serializer = JSONSerializer()
+        self._index_writer = LogIndexWriter(self.filepath) if index else None
+        self._next_rotation_index: int | None = None
 
         # Create directory if it doesn't exist
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
+    def _rotate(self) -> None:
+        """Move the current log (and its index) aside so a fresh segment is started."""
+        if self._next_rotation_index is None:
+            rotated = list_log_segments(self.filepath)[:-1]
+            self._next_rotation_index = (
+                int(rotated[-1].stem.rsplit(".", 1)[-1]) + 1 if rotated else 1
+            )
+        target = rotated_path(self.filepath, self._next_rotation_index)
+        self._next_rotation_index += 1
+
+        os.replace(self.filepath, target)
+        if self._index_writer:
+            self._index_writer.close()
+            if self._index_writer.path.exists():
+                os.replace(self._index_writer.path, index_path(target))
+
     async def send_matched_event(self, event: Event) -> None:
         """Write matched event to log file asynchronously.
 
@@ -156,18 +194,48 @@ class FileTransport(FilteredEventTransport):
         if event.data:
             log_entry["data"] = self._serializer(event.data)
 
+        # Add correlation ids if present
+        session_id = event.context.session_id if event.context else None
+        if session_id:
+            log_entry["session_id"] = session_id
+        if event.context and event.context.workflow_id:
+            log_entry["workflow_id"] = event.context.workflow_id
+        if event.trace_id:
+            log_entry["trace_id"] = event.trace_id
+        if event.span_id:
+            log_entry["span_id"] = event.span_id
+
+        # Write the log entry as compact JSON (JSONL format)
+        line = (json.dumps(log_entry, separators=(",", ":")) + "\n").encode(self.encoding)
+
         try:
-            with open(self.filepath, mode=self.mode, encoding=self.encoding) as f:
-                # Write the log entry as compact JSON (JSONL format)
-                f.write(json.dumps(log_entry, separators=(",", ":")) + "\n")
+            if self.max_bytes and self.filepath.exists():
+                size = self.filepath.stat().st_size
+                if 0 < size and size + len(line) > self.max_bytes:
+                    self._rotate()
+
+            with open(self.filepath, mode=f"{self.mode}b") as f:
+                offset = f.tell()
+                f.write(line)
                 f.flush()  # Ensure writing to disk
+
+            if self._index_writer:
+                self._index_writer.add(
+                    offset,
+                    len(line),
+                    event.timestamp.timestamp(),
+                    session_id,
+                    event.trace_id,
+                )
         except IOError as e:
             # Log error without recursion
             print(f"Error writing to log file {self.filepath}: {e}")
 
     async def close(self) -> None:
         """Clean up resources if needed."""
-        pass  # File handles are automatically closed after each write
+        # Log file handles are closed after each write; only the index stays open
+        if self._index_writer:
+            self._index_writer.close()
 
     @property
     def is_closed(self) -> bool:
@@ -268,6 +336,9 @@ class AsyncEventBus:
 
     _instance = None
 
+    MAX_PENDING_EVENTS = 10000
+    """Maximum events buffered from other threads before the oldest are dropped"""
+
     def __init__(self, transport: EventTransport | None = None):
         self.transport: EventTransport = transport or NoOpTransport()
         self.listeners: Dict[str, EventListener] = {}
@@ -276,12 +347,24 @@ class AsyncEventBus:
         self._running = False
         self._stop_event = asyncio.Event()
 
-        # Store the loop we're created on
+        # The loop that owns the bus. Set when the bus starts (or when it is created
+        # inside a running loop); never created implicitly.
         try:
-            self._loop = asyncio.get_running_loop()
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
         except RuntimeError:
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
+            self._loop = None
+
+        # Events handed over from threads that don't run the bus loop.
+        # deque.append/popleft are atomic, so producers never take a lock, and
+        # maxlen drops the oldest event atomically when the buffer is full.
+        self._pending: deque[Event] = deque(maxlen=self.MAX_PENDING_EVENTS)
+        self._drain_scheduled = False
+        self.dropped_events = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """The event loop that owns the bus, if known."""
+        return self._loop
 
     @classmethod
     def get(cls, transport: EventTransport | None = None) -> "AsyncEventBus":
@@ -319,10 +402,15 @@ class AsyncEventBus:
                 await listener.start()
 
         # Clear stop event and start processing
+        self._loop = asyncio.get_running_loop()
         self._stop_event.clear()
         self._running = True
         self._task = asyncio.create_task(self._process_events())
 
+        # Deliver anything that was emitted from other threads before we started
+        if self._pending:
+            self._schedule_drain()
+
     async def stop(self):
         """Stop the event bus and all lifecycle-aware listeners."""
         if not self._running:
@@ -343,6 +431,7 @@ class AsyncEventBus:
                     try:
                         self._queue.get_nowait()
                         self._queue.task_done()
+                        _dropped_events.labels("shutdown_timeout").inc()
                     except asyncio.QueueEmpty:
                         break
             except Exception as e:
@@ -389,6 +478,48 @@ class AsyncEventBus:
         # Then queue for listeners
         await self._queue.put(event)
 
+    def emit_threadsafe(self, event: Event) -> None:
+        """
+        Emit an event from any thread, including threads without an event loop.
+        The event is handed to the bus loop; if the bus hasn't started yet (or its
+        loop has stopped) it is buffered and delivered when the bus starts. At most
+        MAX_PENDING_EVENTS are buffered; beyond that the oldest are dropped and counted.
+        """
+        if len(self._pending) == self.MAX_PENDING_EVENTS:
+            # Counted approximately under contention; the bound itself is exact
+            self.dropped_events += 1
+            _dropped_events.labels("pending_overflow").inc()
+        self._pending.append(event)
+
+        if not self._drain_scheduled:
+            self._schedule_drain()
+
+    def _schedule_drain(self) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            # Delivered when the bus starts
+            return
+        self._drain_scheduled = True
+        try:
+            loop.call_soon_threadsafe(self._start_drain)
+        except RuntimeError:
+            # Loop was closed between the check and the call
+            self._drain_scheduled = False
+
+    def _start_drain(self) -> None:
+        asyncio.create_task(self._emit_pending())
+
+    async def _emit_pending(self) -> None:
+        """Emit events handed over from other threads, in order (runs on the bus loop)."""
+        while True:
+            while self._pending:
+                await self.emit(self._pending.popleft())
+            self._drain_scheduled = False
+            # A producer may have appended after the last check but seen the flag still set
+            if not self._pending:
+                return
+            self._drain_scheduled = True
+
     def add_listener(self, name: str, listener: EventListener):
         """Add a listener to the event bus."""
         self.listeners[name] = listener
@@ -558,7 +689,28 @@ def create_transport(
                 )
 
             transports.append(
-                FileTransport(filepath=filepath, event_filter=event_filter)
+                FileTransport(
+                    filepath=filepath,
+                    event_filter=event_filter,
+                    index=settings.file_index,
+                    max_bytes=settings.file_max_bytes,
+                )
+            )
+        elif transport_type == "binary":
+            from metaagent.logging.binary_log import BinaryFileTransport
+
+            filepath = get_log_filename(settings, session_id)
+            if not filepath:
+                raise ValueError(
+                    "File path required for binary transport. Either specify 'path' or configure 'path_settings'"
+                )
+
+            transports.append(
+                BinaryFileTransport(
+                    filepath=Path(filepath).with_suffix(".evlog"),
+                    event_filter=event_filter,
+                    max_segment_bytes=settings.binary_segment_max_bytes,
+                )
             )
         elif transport_type == "http":
             if not settings.http_endpoint:
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from typing import List, Literal, Dict, Optional, TypeVar, TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict
@@ -17,6 +18,8 @@ from mcp.types import (
 
 from metaagent.event_progress import ProgressAction
 from metaagent.logging.logger import get_logger
+from metaagent.logging.metrics import metrics
+from metaagent.logging.profiling import profiler
 from metaagent.mcp.gen_client import gen_client
 
 from metaagent.context_dependent import ContextDependent
@@ -33,6 +36,12 @@ logger = get_logger(
 
 SEP = "_"
 
+_tool_call_duration = metrics.histogram(
+    "mcp_tool_call_duration_seconds",
+    "Latency of MCP tool calls made through MCPAggregator",
+    ["server", "tool", "status"],
+)
+
 # Define type variables for the generalized method
 T = TypeVar("T")
 R = TypeVar("R")
@@ -452,10 +461,12 @@ class MCPAggregator(ContextDependent):
         )
 
         async def try_call_tool(client: ClientSession):
+            start = time.perf_counter()
             try:
-                return await client.call_tool(name=local_tool_name, arguments=arguments)
+                with profiler.stage(f"mcp.call_tool {server_name}.{local_tool_name}"):
+                    result = await client.call_tool(name=local_tool_name, arguments=arguments)
             except Exception as e:
-                return CallToolResult(
+                result = CallToolResult(
                     isError=True,
                     content=[
                         TextContent(
@@ -464,6 +475,10 @@ class MCPAggregator(ContextDependent):
                         )
                     ],
                 )
+            _tool_call_duration.labels(
+                server_name, local_tool_name, "error" if result.isError else "ok"
+            ).observe(time.perf_counter() - start)
+            return result
 
         if self.connection_persistence:
             server_connection = await self._persistent_connection_manager.get_server(
@@ -1,5 +1,6 @@
 import arxiv
 import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class ArxivSearch:
@@ -13,6 +14,7 @@ class ArxivSearch:
         self.sort = arxiv.SortCriterion.SubmittedDate if sort == 'SubmittedDate' else arxiv.SortCriterion.Relevance
         
 
+    @rate_limiter.limited("arxiv")
     async def search(self, max_results=5):
         """
         Performs the search
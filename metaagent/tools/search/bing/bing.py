@@ -4,6 +4,7 @@ import aiohttp
 import asyncio  
 import json  
 import logging  
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class BingSearchAsync:  
@@ -35,6 +36,7 @@ class BingSearchAsync:
             )  
         return api_key  
 
+    @rate_limiter.limited("bing")
     async def search(self, max_results=7) -> list[dict[str, str]]:  
         """  
         Asynchronously searches the query using Bing API  
@@ -66,6 +68,7 @@ class BingSearchAsync:
         async with aiohttp.ClientSession() as session:  
             try:  
                 async with session.get(url, headers=headers, params=params) as resp:  
+                    rate_limiter.observe_response("bing", resp.status, resp.headers)
                     if resp.status != 200:  
                         self.logger.error(  
                             f"Error fetching Bing search results: HTTP {resp.status}"  
@@ -1,6 +1,8 @@
 from typing import Any, Dict, List, Optional
 import requests
 import os
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class CustomRetriever:
@@ -26,6 +28,7 @@ class CustomRetriever:
             if key.startswith('RETRIEVER_ARG_')
         }
 
+    @rate_limiter.limited("custom")
     def search(self, max_results: int = 5) -> Optional[List[Dict[str, Any]]]:
         """
         Performs the search using the custom retriever endpoint.
@@ -45,8 +48,13 @@ class CustomRetriever:
         """
         try:
             response = requests.get(self.endpoint, params={**self.params, 'query': self.query})
+            rate_limiter.observe_response("custom", response.status_code, response.headers)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
             print(f"Failed to retrieve search results: {e}")
             return None
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
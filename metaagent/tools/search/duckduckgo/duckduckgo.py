@@ -1,5 +1,7 @@
 from itertools import islice
 from ..utils import check_pkg
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class Duckduckgo:
@@ -12,6 +14,7 @@ class Duckduckgo:
         self.ddg = DDGS()
         self.query = query
 
+    @rate_limiter.limited("duckduckgo")
     def search(self, max_results=5):
         """
         Performs the search
@@ -24,4 +27,8 @@ class Duckduckgo:
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
-        return search_response
\ No newline at end of file
+        return search_response
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
\ No newline at end of file
@@ -1,5 +1,7 @@
 import os
 from ..utils import check_pkg
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class ExaSearch:
@@ -37,6 +39,7 @@ class ExaSearch:
             )
         return api_key
 
+    @rate_limiter.limited("exa")
     def search(
         self, max_results=10, use_autoprompt=False, search_type="neural", **filters
     ):
@@ -63,6 +66,10 @@ class ExaSearch:
         ]
         return search_response
 
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
+
     def find_similar(self, url, exclude_source_domain=False, **filters):
         """
         Finds similar documents to the provided URL using the Exa API.
@@ -4,6 +4,8 @@
 import os
 import requests
 import json
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class GoogleSearch:
@@ -49,6 +51,7 @@ class GoogleSearch:
                             "You can get a key at https://developers.google.com/custom-search/v1/overview")
         return api_key
 
+    @rate_limiter.limited("google")
     def search(self, max_results=7):
         """
         Searches the query
@@ -59,6 +62,7 @@ class GoogleSearch:
         print("Searching with query {0}...".format(self.query))
         url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={self.query}&start=1"
         resp = requests.get(url)
+        rate_limiter.observe_response("google", resp.status_code, resp.headers)
 
         if resp.status_code < 200 or resp.status_code >= 300:
             print("Google search: unexpected response status: ", resp.status_code)
@@ -91,3 +95,7 @@ class GoogleSearch:
             search_results.append(search_result)
 
         return search_results[:max_results]
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
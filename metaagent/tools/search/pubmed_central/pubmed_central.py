@@ -2,6 +2,8 @@ import os
 import xml.etree.ElementTree as ET
 
 import requests
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class PubMedCentralSearch:
@@ -35,6 +37,7 @@ class PubMedCentralSearch:
             )
         return api_key
 
+    @rate_limiter.limited("pubmed_central")
     def search(self, max_results=10):
         """
         Searches the query using the PubMed Central API.
@@ -54,6 +57,7 @@ class PubMedCentralSearch:
             "sort": "relevance"
         }
         response = requests.get(base_url, params=params)
+        rate_limiter.observe_response("pubmed_central", response.status_code, response.headers)
 
         if response.status_code != 200:
             raise Exception(
@@ -81,6 +85,11 @@ class PubMedCentralSearch:
 
         return search_response
 
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
+
+    @rate_limiter.limited("pubmed_central")
     def fetch(self, ids):
         """
         Fetches the full text content for given article IDs.
@@ -97,6 +106,7 @@ class PubMedCentralSearch:
             "api_key": self.api_key,
         }
         response = requests.get(base_url, params=params)
+        rate_limiter.observe_response("pubmed_central", response.status_code, response.headers)
 
         if response.status_code != 200:
             raise Exception(
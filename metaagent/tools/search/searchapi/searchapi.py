@@ -4,6 +4,8 @@
 import os
 import requests
 import urllib.parse
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class SearchApiSearch():
@@ -32,6 +34,7 @@ class SearchApiSearch():
                             "You can get a key at https://www.searchapi.io/")
         return api_key
 
+    @rate_limiter.limited("searchapi")
     def search(self, max_results=7):
         """
         Searches the query
@@ -59,6 +62,7 @@ class SearchApiSearch():
 
         try:
             response = requests.get(encoded_url, headers=headers, timeout=20)
+            rate_limiter.observe_response("searchapi", response.status_code, response.headers)
             if response.status_code == 200:
                 search_results = response.json()
                 if search_results:
@@ -82,3 +86,7 @@ class SearchApiSearch():
             search_response = []
 
         return search_response
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
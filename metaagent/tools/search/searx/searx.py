@@ -3,6 +3,8 @@ import json
 import requests
 from typing import List, Dict
 from urllib.parse import urljoin
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class SearxSearch():
@@ -35,6 +37,7 @@ class SearxSearch():
                 "You can find public instances at https://searx.space/"
             )
 
+    @rate_limiter.limited("searx")
     def search(self, max_results: int = 10) -> List[Dict[str, str]]:
         """
         Searches the query using SearxNG API
@@ -58,6 +61,7 @@ class SearxSearch():
                 params=params,
                 headers={'Accept': 'application/json'}
             )
+            rate_limiter.observe_response("searx", response.status_code, response.headers)
             response.raise_for_status()
             results = response.json()
 
@@ -75,3 +79,7 @@ class SearxSearch():
             raise Exception(f"Error querying SearxNG: {str(e)}")
         except json.JSONDecodeError:
             raise Exception("Error parsing SearxNG response")
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
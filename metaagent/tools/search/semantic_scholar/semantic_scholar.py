@@ -1,6 +1,8 @@
 from typing import Dict, List
 
 import requests
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class SemanticScholarSearch:
@@ -22,6 +24,7 @@ class SemanticScholarSearch:
         assert sort in self.VALID_SORT_CRITERIA, "Invalid sort criterion"
         self.sort = sort.lower()
 
+    @rate_limiter.limited("semantic_scholar")
     def search(self, max_results: int = 20) -> List[Dict[str, str]]:
         """
         Perform the search on Semantic Scholar and return results.
@@ -38,6 +41,7 @@ class SemanticScholarSearch:
 
         try:
             response = requests.get(self.BASE_URL, params=params)
+            rate_limiter.observe_response("semantic_scholar", response.status_code, response.headers)
             response.raise_for_status()
         except requests.RequestException as e:
             print(f"An error occurred while accessing Semantic Scholar API: {e}")
@@ -57,3 +61,7 @@ class SemanticScholarSearch:
                 )
 
         return search_result
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
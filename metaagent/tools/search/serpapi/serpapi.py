@@ -4,6 +4,8 @@
 import os
 import requests
 import urllib.parse
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class SerpApiSearch():
@@ -32,6 +34,7 @@ class SerpApiSearch():
                             "You can get a key at https://serpapi.com/")
         return api_key
 
+    @rate_limiter.limited("serpapi")
     def search(self, max_results=7):
         """
         Searches the query
@@ -51,6 +54,7 @@ class SerpApiSearch():
         search_response = []
         try:
             response = requests.get(encoded_url, timeout=10)
+            rate_limiter.observe_response("serpapi", response.status_code, response.headers)
             if response.status_code == 200:
                 search_results = response.json()
                 if search_results:
@@ -74,3 +78,7 @@ class SerpApiSearch():
             search_response = []
 
         return search_response
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
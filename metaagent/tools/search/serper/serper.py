@@ -4,6 +4,8 @@
 import os
 import requests
 import json
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class SerperSearch():
@@ -32,6 +34,7 @@ class SerperSearch():
                             "You can get a key at https://serper.dev/")
         return api_key
 
+    @rate_limiter.limited("serper")
     def search(self, max_results=7):
         """
         Searches the query
@@ -52,6 +55,7 @@ class SerperSearch():
         data = json.dumps({"q": self.query, "num": max_results})
 
         resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
+        rate_limiter.observe_response("serper", resp.status_code, resp.headers)
 
         # Preprocess the results
         if resp is None:
@@ -79,3 +83,7 @@ class SerperSearch():
             search_results.append(search_result)
 
         return search_results
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
@@ -5,6 +5,8 @@ import os
 from typing import Literal, Sequence, Optional
 import requests
 import json
+import asyncio
+from metaagent.executor.rate_limiter import rate_limiter
 
 
 class TavilySearch():
@@ -76,6 +78,7 @@ class TavilySearch():
 
         response = requests.post(self.base_url, data=json.dumps(
             data), headers=self.headers, timeout=100)
+        rate_limiter.observe_response("tavily", response.status_code, response.headers)
 
         if response.status_code == 200:
             return response.json()
@@ -83,6 +86,7 @@ class TavilySearch():
             # Raises a HTTPError if the HTTP request returned an unsuccessful status code
             response.raise_for_status()
 
+    @rate_limiter.limited("tavily")
     def search(self, max_results=7):
         """
         Searches the query
@@ -104,3 +108,7 @@ class TavilySearch():
                 f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
         return search_response
+
+    async def asearch(self, *args, **kwargs):
+        """Run search() in a thread, so its rate-limit wait and request don't block the event loop."""
+        return await asyncio.to_thread(self.search, *args, **kwargs)
@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.logging.binary_log import BinaryEventReader, BinaryFileTransport, list_segments  # noqa: E402
+from metaagent.logging.events import Event, EventContext  # noqa: E402
+
+TRACE_ID = "0af7651916cd43dd8448eb211c80319c"
+
+
+def make_event(message, session_id, namespace="agent.tools", **kwargs):
+    return Event(
+        type="info",
+        namespace=namespace,
+        message=message,
+        context=EventContext(session_id=session_id, workflow_id="wf"),
+        **kwargs,
+    )
+
+
+async def write(path, events, **kwargs):
+    transport = BinaryFileTransport(path, **kwargs)
+    for event in events:
+        await transport.send_matched_event(event)
+    await transport.close()
+    return transport
+
+
+@pytest.mark.asyncio
+async def test_records_round_trip(tmp_path):
+    event = make_event("hello", "a", name="call", data={"n": 1}, trace_id=TRACE_ID, span_id="00f067aa0ba902b7")
+    await write(tmp_path / "events.evlog", [event])
+
+    [record] = BinaryEventReader(tmp_path / "events.evlog").iter_records()
+    assert record["namespace"] == "agent.tools.call"
+    assert record["message"] == "hello"
+    assert record["data"] == {"n": 1}
+    assert (record["session_id"], record["workflow_id"]) == ("a", "wf")
+    assert (record["trace_id"], record["span_id"]) == (TRACE_ID, "00f067aa0ba902b7")
+
+
+@pytest.mark.asyncio
+async def test_filters(tmp_path):
+    now = datetime.now()
+    await write(
+        tmp_path / "events.evlog",
+        [
+            make_event("a1", "a", timestamp=now - timedelta(hours=1)),
+            make_event("b1", "b", namespace="agent.llm", trace_id=TRACE_ID),
+            make_event("a2", "a", namespace="agent.llm", timestamp=now + timedelta(hours=1)),
+        ],
+    )
+    reader = BinaryEventReader(tmp_path / "events.evlog")
+
+    def messages(**filters):
+        return [record["message"] for record in reader.iter_records(**filters)]
+
+    assert messages(session_id="a") == ["a1", "a2"]
+    assert messages(namespace="agent.llm") == ["b1", "a2"]
+    assert messages(trace_id=TRACE_ID) == ["b1"]
+    assert messages(start=now - timedelta(minutes=1), end=now + timedelta(minutes=1)) == ["b1"]
+    assert messages(session_id="missing") == []
+
+
+@pytest.mark.asyncio
+async def test_segments_rotate_and_are_read_in_order(tmp_path):
+    base = tmp_path / "events.evlog"
+    await write(base, [make_event(f"m{i}", "a", data={"pad": os.urandom(200).hex()}) for i in range(10)], max_segment_bytes=512)
+    # A later run starts a new segment instead of appending to the last one
+    await write(base, [make_event("next run", "a")], max_segment_bytes=512)
+
+    segments = list_segments(base)
+    assert len(segments) > 2
+    messages = [record["message"] for record in BinaryEventReader(base).iter_records()]
+    assert messages == [f"m{i}" for i in range(10)] + ["next run"]
+
+
+@pytest.mark.asyncio
+async def test_to_jsonl(tmp_path):
+    await write(tmp_path / "events.evlog", [make_event("one", "a"), make_event("two", "b")])
+    output = tmp_path / "out.jsonl"
+    assert BinaryEventReader(tmp_path / "events.evlog").to_jsonl(output, session_id="b") == 1
+    assert json.loads(output.read_text())["message"] == "two"
@@ -0,0 +1,101 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.dag import DAG, DAGCycleError, DAGDependencyError  # noqa: E402
+
+
+async def write_script(topic):
+    await asyncio.sleep(0.01)
+    return f"script about {topic}"
+
+
+def split_storyboards(script):
+    return [f"{script} #{i}" for i in range(3)]
+
+
+async def draw_image(board):
+    await asyncio.sleep(0.01)
+    return f"image of {board}"
+
+
+def make_video(images):
+    return len(images)
+
+
+def fail(*_):
+    raise RuntimeError("boom")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_with_a_map_runs_and_reports():
+    dag = DAG(name="video")
+    script = dag.task("script", write_script, "cats")
+    boards = dag.task("boards", split_storyboards, script)
+    images = dag.map("image", draw_image, boards)
+    dag.task("video", make_video, images)
+
+    run = await dag.run()
+    assert run.results["video"] == 3
+    assert run.results["image"][0] == "image of script about cats #0"
+    assert not run.failed
+
+    path = [timing.name for timing in run.critical_path()]
+    assert path[:2] == ["script", "boards"]
+    assert path[2].startswith("image[") and path[3] == "video"
+    assert "critical path" in run.report()
+
+
+@pytest.mark.asyncio
+async def test_cycles_are_rejected_before_running():
+    dag = DAG()
+    dag.task("a", make_video, dag.ref("b"))
+    dag.task("b", make_video, dag.ref("a"))
+    with pytest.raises(DAGCycleError):
+        await dag.run()
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_skips_dependents_only():
+    dag = DAG()
+    broken = dag.task("broken", fail)
+    dag.task("after_broken", make_video, broken)
+    dag.task("independent", write_script, "dogs")
+
+    run = await dag.run()
+    assert isinstance(run.results["broken"], RuntimeError)
+    assert isinstance(run.results["after_broken"], DAGDependencyError)
+    assert run.results["independent"] == "script about dogs"
+    # Skipped tasks have no timing and do not break the report
+    assert "after_broken" not in run.timings
+    assert [timing.name for timing in run.critical_path()] == ["independent"]
+
+
+@pytest.mark.asyncio
+async def test_map_over_a_non_iterable_result_fails_instead_of_hanging():
+    dag = DAG()
+    nothing = dag.task("nothing", lambda: None)
+    images = dag.map("image", draw_image, nothing)
+    dag.map("upscale", draw_image, images)
+    dag.task("video", make_video, images)
+
+    run = await asyncio.wait_for(dag.run(), 5)
+    assert isinstance(run.results["image"], TypeError)
+    assert isinstance(run.results["upscale"], DAGDependencyError)
+    assert isinstance(run.results["video"], DAGDependencyError)
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_items_and_nodes_as_they_finish():
+    dag = DAG()
+    boards = dag.task("boards", split_storyboards, "s")
+    images = dag.map("image", draw_image, boards)
+    dag.map("upscale", draw_image, images)
+
+    names = [name async for name, _ in dag.stream()]
+    assert names.index("image[0]") < names.index("upscale[0]")
+    assert names.index("boards") == 0 and names[-1] in ("image", "upscale")
+    assert len(names) == 1 + 2 * 4
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import socket
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.durable import RUN_COMPLETED, DurableExecutor  # noqa: E402
+from metaagent.executor.workflow import Workflow, WorkflowResult  # noqa: E402
+
+calls = []
+
+
+async def step(label):
+    calls.append(label)
+    await asyncio.sleep(0.01)
+    return label
+
+
+class TwoSteps(Workflow):
+    async def run(self, fail_after_first: bool = False):
+        [first] = await self.executor.execute(lambda: step("first"))
+        if fail_after_first:
+            raise RuntimeError("crash")
+        [second] = await self.executor.execute(lambda: step("second"))
+        return WorkflowResult(value=[first, second])
+
+
+@pytest.fixture
+def executor(tmp_path):
+    calls.clear()
+    executor = DurableExecutor(journal_path=tmp_path / "journal.db")
+    yield executor
+    executor.shutdown()
+
+
+def completions(executor):
+    return executor.journal._conn.execute(
+        "SELECT run_id, COUNT(*) FROM events WHERE kind = ? GROUP BY run_id", (RUN_COMPLETED,)
+    ).fetchall()
+
+
+@pytest.mark.asyncio
+async def test_unfinished_run_resumes_from_journal(executor):
+    with pytest.raises(RuntimeError):
+        await TwoSteps(executor, metadata={"workflow_id": "fixed"}).run(fail_after_first=True)
+    assert calls == ["first"]
+
+    result = await TwoSteps(executor, metadata={"workflow_id": "fixed"}).run()
+    assert result.value == ["first", "second"]
+    # The first task was replayed from the journal
+    assert calls == ["first", "second"]
+
+    # A completed run is not resumed
+    await TwoSteps(executor, metadata={"workflow_id": "fixed"}).run()
+    assert calls == ["first", "second", "first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_do_not_share_a_run(executor):
+    results = await asyncio.gather(TwoSteps(executor).run(), TwoSteps(executor).run())
+    assert [result.value for result in results] == [["first", "second"]] * 2
+    # Both runs executed their own tasks instead of replaying each other's
+    assert sorted(calls) == ["first", "first", "second", "second"]
+    runs = completions(executor)
+    assert len(runs) == 2
+    assert all(count == 1 for _, count in runs)
+
+
+@pytest.mark.asyncio
+async def test_run_of_a_dead_process_is_resumed(executor):
+    journal = executor.journal
+    dead_owner = f"{socket.gethostname()}:999999999:x"
+    run_id, resumed = journal.claim_run("wf", "TwoSteps", dead_owner, lease_seconds=60)
+    assert not resumed
+    assert journal.claim_run("wf", "TwoSteps", "me", lease_seconds=60) == (run_id, True)
+
+
+@pytest.mark.asyncio
+async def test_live_or_expired_leases(executor):
+    journal = executor.journal
+    run_id, _ = journal.claim_run("wf", "TwoSteps", "other-host:1:x", lease_seconds=60)
+    # Held by a live owner: a new run is started
+    other_run, resumed = journal.claim_run("wf", "TwoSteps", "me", lease_seconds=60)
+    assert other_run != run_id and not resumed
+
+    journal.release_run(other_run, "me")
+    journal._conn.execute("UPDATE runs SET lease_until = ? WHERE run_id = ?", (time.time() - 1, run_id))
+    claimed = {journal.claim_run("wf", "TwoSteps", f"me{i}", lease_seconds=60)[0] for i in range(2)}
+    assert claimed == {run_id, other_run}
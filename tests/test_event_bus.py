@@ -0,0 +1,76 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.logging.events import Event  # noqa: E402
+from metaagent.logging.listeners import EventListener  # noqa: E402
+from metaagent.logging.transport import AsyncEventBus  # noqa: E402
+
+
+class Collector(EventListener):
+    def __init__(self):
+        self.messages = []
+
+    async def handle_event(self, event):
+        self.messages.append(event.message)
+
+
+def make_event(message):
+    return Event(type="info", namespace="test.thread", message=message)
+
+
+def emit_from_thread(bus, messages):
+    thread = threading.Thread(target=lambda: [bus.emit_threadsafe(make_event(m)) for m in messages])
+    thread.start()
+    thread.join()
+
+
+@pytest.fixture
+def bus():
+    # Created outside any event loop, like a bus first used by a worker thread
+    bus = AsyncEventBus()
+    collector = Collector()
+    bus.add_listener("collector", collector)
+    bus.collector = collector
+    return bus
+
+
+async def wait_for_messages(collector, count):
+    for _ in range(100):
+        if len(collector.messages) >= count:
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_events_from_other_threads_are_delivered_in_order(bus):
+    # Emitted before the bus has a loop: buffered until it starts
+    emit_from_thread(bus, ["before 1", "before 2"])
+    await bus.start()
+    try:
+        emit_from_thread(bus, ["after 1", "after 2"])
+        await wait_for_messages(bus.collector, 4)
+        assert bus.collector.messages == ["before 1", "before 2", "after 1", "after 2"]
+    finally:
+        await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_buffer_before_start_keeps_the_newest_events(monkeypatch):
+    monkeypatch.setattr(AsyncEventBus, "MAX_PENDING_EVENTS", 3)
+    bus = await asyncio.to_thread(AsyncEventBus)
+    collector = Collector()
+    bus.add_listener("collector", collector)
+
+    emit_from_thread(bus, [str(i) for i in range(5)])
+    assert bus.dropped_events == 2
+    await bus.start()
+    try:
+        await wait_for_messages(collector, 3)
+        assert collector.messages == ["2", "3", "4"]
+    finally:
+        await bus.stop()
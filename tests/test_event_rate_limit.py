@@ -0,0 +1,72 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.logging.events import Event, RateLimitingFilter  # noqa: E402
+from metaagent.logging.transport import AsyncEventBus  # noqa: E402
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    events = []
+
+    async def emit(self, event):
+        events.append(event)
+
+    monkeypatch.setattr(AsyncEventBus, "emit", emit)
+    return events
+
+
+def make_event(type="info", namespace="test.source"):
+    return Event(type=type, namespace=namespace, message="hello")
+
+
+@pytest.mark.asyncio
+async def test_burst_then_silence_is_reported(emitted):
+    event_filter = RateLimitingFilter(rate=0.001, burst=2, summary_interval=0.05)
+    decisions = [event_filter.matches(make_event()) for _ in range(5)]
+    assert decisions == [True, True, False, False, False]
+
+    # No further events arrive; the summary is still emitted at the end of the interval
+    await asyncio.sleep(0.1)
+    assert len(emitted) == 1
+    summary = emitted[0]
+    assert summary.namespace == event_filter.summary_namespace
+    assert summary.data["suppressed"] == {"test.source:info": 3}
+
+
+@pytest.mark.asyncio
+async def test_summary_bypasses_min_level(emitted):
+    event_filter = RateLimitingFilter(min_level="error")
+    summary = make_event(type="warning", namespace=event_filter.summary_namespace)
+    assert event_filter.matches(summary)
+    assert not event_filter.matches(make_event(type="warning"))
+
+
+@pytest.mark.asyncio
+async def test_errors_are_never_limited(emitted):
+    event_filter = RateLimitingFilter(rate=0.001, burst=1)
+    assert all(event_filter.matches(make_event(type="error")) for _ in range(10))
+    await asyncio.sleep(0)
+    assert emitted == []
+
+
+@pytest.mark.asyncio
+async def test_an_event_seen_by_several_consumers_takes_one_token(emitted):
+    event_filter = RateLimitingFilter(rate=0.001, burst=2)
+    first, second = make_event(), make_event()
+    # Each transport and listener sharing the filter asks about the same event
+    assert [event_filter.matches(first) for _ in range(3)] == [True, True, True]
+    assert [event_filter.matches(second) for _ in range(3)] == [True, True, True]
+    assert not event_filter.matches(make_event())
+
+
+def test_rate_for_uses_the_longest_prefix_and_is_cached():
+    event_filter = RateLimitingFilter(rate=5, namespace_rates={"mcp": 1, "mcp.noisy": 0.5})
+    assert event_filter.rate_for("mcp.noisy.server") == 0.5
+    assert event_filter.rate_for("mcp.quiet") == 1
+    assert event_filter.rate_for("other") == 5
+    assert event_filter._rates == {"mcp.noisy.server": 0.5, "mcp.quiet": 1, "other": 5}
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.executor import AsyncioExecutor  # noqa: E402
+
+
+class Tracker:
+    """Makes tasks that record peak concurrency, how many were created and cancellations."""
+
+    def __init__(self, delay=0.001):
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self.created = 0
+        self.cancelled = 0
+
+    def task(self, value):
+        self.created += 1
+
+        async def run():
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            try:
+                await asyncio.sleep(self.delay)
+                return value
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            finally:
+                self.running -= 1
+
+        return run
+
+
+@pytest.fixture
+def executor():
+    executor = AsyncioExecutor()
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_positional_tasks_all_complete(executor):
+    tracker = Tracker()
+    results = [result async for result in executor.execute_streaming(*(tracker.task(i) for i in range(5)))]
+    assert sorted(results) == list(range(5))
+    assert tracker.peak == 5
+
+
+@pytest.mark.asyncio
+async def test_generator_source_is_consumed_within_the_window(executor):
+    tracker = Tracker()
+    tasks = (tracker.task(i) for i in range(50))
+    results = [result async for result in executor.execute_streaming(tasks, max_concurrency=4)]
+    assert sorted(results) == list(range(50))
+    assert tracker.peak == 4
+
+
+@pytest.mark.asyncio
+async def test_async_generator_source(executor):
+    tracker = Tracker()
+
+    async def tasks():
+        for i in range(10):
+            yield tracker.task(i)
+
+    results = [result async for result in executor.execute_streaming(tasks(), max_concurrency=2)]
+    assert sorted(results) == list(range(10))
+    assert tracker.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_cancels_in_flight_tasks_and_stops_reading(executor):
+    fast, slow = Tracker(), Tracker(delay=10)
+    pulled = []
+
+    def tasks():
+        for i in range(100):
+            pulled.append(i)
+            yield fast.task("first") if i == 0 else slow.task(i)
+
+    stream = executor.execute_streaming(tasks(), max_concurrency=3)
+    assert await stream.__anext__() == "first"
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    # Only the window was read from the source, and what was still running was cancelled
+    assert len(pulled) == 3
+    assert slow.cancelled == 2 and slow.running == 0
@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.logging.events import Event, EventContext  # noqa: E402
+from metaagent.logging.log_index import (  # noqa: E402
+    IndexedLogReader,
+    LogIndex,
+    build_index,
+    index_path,
+)
+from metaagent.logging.transport import FileTransport  # noqa: E402
+
+
+def write_lines(path, sessions):
+    with open(path, "a", encoding="utf-8") as f:
+        for i, session_id in enumerate(sessions):
+            record = {
+                "level": "INFO",
+                "timestamp": datetime.now().isoformat(),
+                "namespace": "test",
+                "message": f"old {i}",
+                "session_id": session_id,
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+def make_event(message, session_id):
+    return Event(
+        type="info",
+        namespace="test",
+        message=message,
+        context=EventContext(session_id=session_id),
+    )
+
+
+def messages(path, **filters):
+    return [record["message"] for record in IndexedLogReader(path).iter_records(**filters)]
+
+
+@pytest.mark.asyncio
+async def test_enabling_index_on_existing_log_backfills_it(tmp_path):
+    log = tmp_path / "events.jsonl"
+    write_lines(log, ["a", "b", "a"])
+
+    transport = FileTransport(log, index=True)
+    await transport.send_matched_event(make_event("new", "a"))
+    await transport.close()
+
+    assert len(LogIndex.load(index_path(log)).records) == 4
+    assert messages(log, session_id="a") == ["old 0", "old 2", "new"]
+    assert messages(log, session_id="b") == ["old 1"]
+
+
+def test_reader_scans_lines_the_index_does_not_cover(tmp_path):
+    log = tmp_path / "events.jsonl"
+    write_lines(log, ["a", "b"])
+    assert build_index(log) == 2
+
+    # Appended without the index being updated
+    write_lines(log, ["a"])
+    assert messages(log, session_id="a") == ["old 0", "old 0"]
+    assert len(messages(log)) == 3
+
+
+@pytest.mark.asyncio
+async def test_truncated_log_starts_a_fresh_index(tmp_path):
+    log = tmp_path / "events.jsonl"
+    transport = FileTransport(log, index=True)
+    await transport.send_matched_event(make_event("first", "a"))
+    await transport.send_matched_event(make_event("second", "a"))
+    await transport.close()
+
+    transport = FileTransport(log, mode="w", index=True)
+    await transport.send_matched_event(make_event("third", "b"))
+    await transport.close()
+
+    assert messages(log, session_id="b") == ["third"]
+    assert messages(log, session_id="a") == []
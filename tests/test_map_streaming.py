@@ -0,0 +1,92 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.executor import AsyncioExecutor  # noqa: E402
+
+
+class Tracker:
+    """Async task whose delay is given per item; records peak concurrency."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, item):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(item, 0.001))
+            return item * 10
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def executor():
+    executor = AsyncioExecutor()
+    yield executor
+    executor.shutdown()
+
+
+async def collect(stream):
+    return [result async for result in stream]
+
+
+@pytest.mark.asyncio
+async def test_ordered_results_follow_the_inputs(executor):
+    tracker = Tracker({0: 0.05})
+    assert await collect(executor.map_streaming(tracker, range(5))) == [0, 10, 20, 30, 40]
+    assert await executor.map(tracker, range(3)) == [0, 10, 20]
+
+
+@pytest.mark.asyncio
+async def test_unordered_results_come_in_completion_order(executor):
+    tracker = Tracker({0: 0.05})
+    results = await collect(executor.map_streaming(tracker, range(5), ordered=False))
+    assert sorted(results) == [0, 10, 20, 30, 40]
+    assert results[-1] == 0
+
+
+@pytest.mark.asyncio
+async def test_window_bounds_in_flight_tasks(executor):
+    tracker = Tracker()
+    await collect(executor.map_streaming(tracker, range(20), max_concurrency=3))
+    assert tracker.peak == 3
+
+    # Without a limit every input is in flight at once, as before the window existed
+    tracker = Tracker()
+    await collect(executor.map_streaming(tracker, range(200)))
+    assert tracker.peak == 200
+
+
+@pytest.mark.asyncio
+async def test_chunks_share_one_execute_call(executor):
+    tracker = Tracker()
+
+    async def inputs():
+        for item in range(7):
+            yield item
+
+    results = await collect(
+        executor.map_streaming(tracker, inputs(), chunk_size=3, max_concurrency=1)
+    )
+    assert results == [item * 10 for item in range(7)]
+    # One chunk of up to three items runs at a time
+    assert tracker.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_are_yielded_in_place(executor):
+    async def fail_on_two(item):
+        if item == 2:
+            raise ValueError("two")
+        return item
+
+    results = await collect(executor.map_streaming(fail_on_two, range(4)))
+    assert results[:2] == [0, 1] and results[3] == 3
+    assert isinstance(results[2], ValueError)
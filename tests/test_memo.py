@@ -0,0 +1,114 @@
+import os
+import sys
+import time
+from dataclasses import dataclass
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.executor import AsyncioExecutor, ExecutorConfig  # noqa: E402
+from metaagent.executor.memo import MemoStore, memo_key  # noqa: E402
+from metaagent.executor.workflow_task import workflow_task  # noqa: E402
+
+
+@workflow_task(memoize=True)
+def add(a, b):
+    return a + b
+
+
+@dataclass
+class Scaler:
+    factor: int
+
+    @workflow_task(memoize=True)
+    def scale(self, value):
+        return value * self.factor
+
+
+class Session:
+    def __init__(self, session_id):
+        self.session_id = session_id
+
+    @workflow_task(memoize=True)
+    def greet(self, name):
+        return f"{self.session_id}: {name}"
+
+
+class KeyedSession(Session):
+    def memo_key(self):
+        return self.session_id
+
+
+def test_memo_key_depends_on_arguments():
+    assert memo_key(add, {"a": 1, "b": 2}) == memo_key(add, {"a": 1, "b": 2})
+    assert memo_key(add, {"a": 1, "b": 2}) != memo_key(add, {"a": 2, "b": 1})
+
+
+def test_memo_key_ignores_tasks_that_do_not_opt_in():
+    assert memo_key(len, {}) is None
+
+
+def test_bound_methods_are_keyed_by_instance():
+    assert memo_key(Scaler(2).scale, {"value": 3}) != memo_key(Scaler(3).scale, {"value": 3})
+    assert memo_key(Scaler(2).scale, {"value": 3}) == memo_key(Scaler(2).scale, {"value": 3})
+
+    first, second = KeyedSession("a"), KeyedSession("b")
+    assert memo_key(first.greet, {"name": "x"}) != memo_key(second.greet, {"name": "x"})
+
+
+def test_methods_of_unidentifiable_instances_are_not_memoized():
+    assert memo_key(Session("a").greet, {"name": "x"}) is None
+
+
+def test_store_round_trip_and_ttl(tmp_path):
+    store = MemoStore(tmp_path / "memo.db", ttl_seconds=0.05)
+    try:
+        assert store.put("k", "task", {"value": 1})
+        assert store.get("k") == (True, {"value": 1})
+        time.sleep(0.1)
+        assert store.get("k") == (False, None)
+        assert store.stats()["entries"] == 0
+    finally:
+        store.close()
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = MemoStore(tmp_path / "memo.db", max_bytes=250)
+    try:
+        store.put("old", "task", b"x" * 100)
+        store.put("used", "task", b"x" * 100)
+        store.get("used")
+        store.put("new", "task", b"x" * 100)
+        assert store.get("old") == (False, None)
+        assert store.get("used")[0] and store.get("new")[0]
+        assert store.stats()["bytes"] <= 250
+    finally:
+        store.close()
+
+
+def test_store_skips_unpicklable_results(tmp_path):
+    store = MemoStore(tmp_path / "memo.db")
+    try:
+        assert not store.put("k", "task", lambda: 1)
+        assert store.get("k") == (False, None)
+    finally:
+        store.close()
+
+
+@pytest.mark.asyncio
+async def test_executor_reuses_memoized_results(tmp_path):
+    calls = []
+
+    @workflow_task(memoize=True, memo_version="1")
+    def tracked(value):
+        calls.append(value)
+        return value * 2
+
+    executor = AsyncioExecutor(config=ExecutorConfig(memo_path=str(tmp_path / "memo.db")))
+    try:
+        assert await executor.execute(tracked, value=2) == [4]
+        assert await executor.execute(tracked, value=2) == [4]
+        assert await executor.execute(tracked, value=3) == [6]
+    finally:
+        executor.shutdown()
+    assert calls == [2, 3]
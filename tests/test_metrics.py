@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.logging.metrics import MetricsRegistry  # noqa: E402
+
+
+def test_render_counters_and_gauges():
+    registry = MetricsRegistry(prefix="test_")
+    calls = registry.counter("calls_total", "Calls", ["server"])
+    calls.labels("fetch").inc()
+    calls.labels(server="fetch").inc(2)
+    registry.gauge("queued", "Queued tasks").set(3)
+
+    assert registry.render() == (
+        "# HELP test_calls_total Calls\n"
+        "# TYPE test_calls_total counter\n"
+        'test_calls_total{server="fetch"} 3\n'
+        "# HELP test_queued Queued tasks\n"
+        "# TYPE test_queued gauge\n"
+        "test_queued 3\n"
+    )
+
+
+def test_registering_twice_returns_the_same_family():
+    registry = MetricsRegistry()
+    assert registry.counter("calls_total", "Calls") is registry.counter("calls_total", "Calls")
+    assert registry.get("calls_total") is registry.get("metaagent_calls_total")
+    with pytest.raises(ValueError):
+        registry.gauge("calls_total", "Calls")
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry(prefix="")
+    registry.counter("errors_total", "Errors", ["message"]).labels('bad "quote"\\path\nnext').inc()
+    assert 'errors_total{message="bad \\"quote\\"\\\\path\\nnext"} 1' in registry.render()
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry(prefix="")
+    latency = registry.histogram("latency_seconds", "Latency", buckets=[0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 2.0):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+    # Upper bounds are inclusive, and the +Inf bucket counts every observation
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_sum 2.65" in lines
+    assert "latency_seconds_count 4" in lines
+
+
+def test_counters_reject_negative_increments():
+    registry = MetricsRegistry()
+    with pytest.raises(ValueError):
+        registry.counter("calls_total", "Calls").inc(-1)
@@ -0,0 +1,46 @@
+import math
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.process_pool import ProcessPool, TaskNotPicklableError  # noqa: E402
+from metaagent.executor.task_registry import ActivityRegistry  # noqa: E402
+from metaagent.executor.workflow_task import workflow_task  # noqa: E402
+
+
+@workflow_task(name="tests.process_pool.square", pool="process")
+def square(x):
+    return x * x
+
+
+@pytest.mark.asyncio
+async def test_process_pool_runs_tasks_in_other_processes():
+    pool = ProcessPool(max_workers=1)
+    try:
+        assert await pool.run(math.factorial, 10) == 3628800
+        assert await pool.run(os.getpid) != os.getpid()
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_process_pool_rejects_unpicklable_tasks_before_submitting():
+    pool = ProcessPool(max_workers=1)
+    with pytest.raises(TaskNotPicklableError, match="<lambda>"):
+        await pool.run(lambda: 1)
+    with pytest.raises(TaskNotPicklableError):
+        await pool.run(len, threading.Lock())
+    # Nothing was started for the rejected tasks
+    assert pool._pool is None
+
+
+def test_workflow_tasks_join_new_task_registries():
+    registry = ActivityRegistry()
+    registry.register_workflow_tasks()
+    assert registry.get_activity("tests.process_pool.square") is square
+    assert registry.get_metadata("tests.process_pool.square")["pool"] == "process"
+    # Registering again skips the tasks already there
+    registry.register_workflow_tasks()
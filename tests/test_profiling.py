@@ -0,0 +1,30 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.config import ProfilingSettings  # noqa: E402
+from metaagent.logging.profiling import Profiler  # noqa: E402
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_run_stacks_are_not_counted_again_in_the_session(tmp_path):
+    profiler = Profiler()
+    profiler.configure(ProfilingSettings(enabled=True, output_dir=str(tmp_path), sample_interval=0.005))
+    session_run = profiler._session_run
+    try:
+        with profiler.run("workflow") as run:
+            busy(0.2)
+        assert sum(run.stacks.values()) > 0
+        session_samples = sum(session_run.stacks.values())
+        busy(0.1)
+        # Samples taken during the run went only to the run
+        assert session_samples <= 1
+        assert sum(session_run.stacks.values()) > session_samples
+    finally:
+        profiler.shutdown()
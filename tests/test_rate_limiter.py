@@ -0,0 +1,100 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.rate_limiter import RateLimiter, parse_rate_limit_headers  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_waits_are_reserved_in_arrival_order():
+    limiter = RateLimiter()
+    limiter.set_limit("openai", requests_per_minute=600)  # one request per 0.1s after the first minute's burst
+    limiter._buckets[("openai", "requests")].level = 1
+
+    waits = await asyncio.gather(*(limiter.acquire("openai/gpt-4o") for _ in range(3)))
+    assert waits[0] == 0
+    assert waits[1] == pytest.approx(0.1, abs=0.02)
+    assert waits[2] == pytest.approx(0.2, abs=0.02)
+
+
+@pytest.mark.asyncio
+async def test_limited_async_function_does_not_block_the_loop():
+    limiter = RateLimiter()
+    limiter.pause("search", 0.2)
+    ticks = []
+
+    @limiter.limited("search")
+    async def search():
+        return "results"
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    assert await search() == "results"
+    task.cancel()
+    assert len(ticks) > 5
+
+
+@pytest.mark.asyncio
+async def test_limited_sync_function_waits_in_its_thread():
+    limiter = RateLimiter()
+    limiter.pause("search", 0.2)
+    ticks = []
+
+    # A sync search() keeps its API; asearch() runs it in a thread like this
+    @limiter.limited("search")
+    def search():
+        return "results"
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    task = asyncio.ensure_future(ticker())
+    started = time.monotonic()
+    assert await asyncio.to_thread(search) == "results"
+    task.cancel()
+    assert time.monotonic() - started == pytest.approx(0.2, abs=0.05)
+    assert len(ticks) > 5
+
+
+@pytest.mark.asyncio
+async def test_429_response_pauses_for_retry_after():
+    limiter = RateLimiter()
+    limiter.observe_response("search", 429, {"Retry-After": "0.2"})
+    assert await limiter.acquire("search") == pytest.approx(0.2, abs=0.05)
+    assert await limiter.acquire("search") == 0
+
+
+def test_limits_follow_response_headers_unless_configured():
+    limiter = RateLimiter()
+    limiter.observe_response(
+        "openai", 200, {"x-ratelimit-limit-requests": "60", "x-ratelimit-remaining-requests": "0",
+                        "x-ratelimit-reset-requests": "1s"}
+    )
+    bucket = limiter._buckets[("openai", "requests")]
+    assert bucket.capacity == 60 and bucket.level <= 0
+
+    limiter.set_limit("anthropic", requests_per_minute=10)
+    limiter.update_from_headers("anthropic", {"anthropic-ratelimit-requests-limit": "1000"})
+    assert limiter._buckets[("anthropic", "requests")].capacity == 10
+
+
+def test_parse_rate_limit_headers_formats():
+    parsed = parse_rate_limit_headers(
+        {
+            "llm_provider-x-ratelimit-limit-tokens": "1000",
+            "llm_provider-x-ratelimit-reset-tokens": "6m0s",
+            "retry-after-ms": "250",
+        }
+    )
+    assert parsed["tokens"] == (1000.0, None, 360.0)
+    assert parsed["retry_after"] == 0.25
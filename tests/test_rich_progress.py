@@ -0,0 +1,39 @@
+import io
+import os
+import sys
+
+import pytest
+from rich.console import Console
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.event_progress import ProgressAction, ProgressEvent  # noqa: E402
+from metaagent.logging.rich_progress import RichProgressDisplay  # noqa: E402
+
+
+def make_display(**kwargs):
+    return RichProgressDisplay(console=Console(file=io.StringIO()), **kwargs)
+
+
+def test_updates_between_frames_are_coalesced():
+    display = make_display()
+    for action in (ProgressAction.STARTING, ProgressAction.RUNNING, ProgressAction.CHATTING):
+        display.update(ProgressEvent(action=action, target="llm", agent_name="planner"))
+    display.update(ProgressEvent(action=ProgressAction.STARTING, target="fetch", agent_name="search"))
+    display.update(ProgressEvent(action=ProgressAction.READY, target="llm", agent_name="planner"))
+    assert display._progress.tasks == []
+
+    # Rendering a frame applies the latest event per task, in the order of their latest update
+    display._progress.get_renderable()
+    tasks = display._progress.tasks
+    assert [task.fields["task_name"] for task in tasks] == ["search", "planner"]
+    assert ProgressAction.READY.value in tasks[1].description
+    assert display._pending == {}
+
+
+@pytest.mark.parametrize("max_fps", [0, -1])
+def test_max_fps_must_be_positive(max_fps):
+    with pytest.raises(ValueError):
+        make_display(max_fps=max_fps)
+    display = make_display()
+    with pytest.raises(ValueError):
+        display.max_fps = max_fps
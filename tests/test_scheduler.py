@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.config import ExecutorSettings, Settings  # noqa: E402
+from metaagent.context import Context, _create_executor  # noqa: E402
+from metaagent.executor.executor import AsyncioExecutor  # noqa: E402
+from metaagent.executor.scheduler import FairScheduler, current_scheduling, scheduling  # noqa: E402
+from metaagent.logging.metrics import metrics  # noqa: E402
+
+
+async def grant_order(scheduler, requests):
+    """Queue (label, key, priority) requests behind a held slot, then release one at a time."""
+    order = []
+
+    async def worker(label, key, priority):
+        await scheduler.acquire(key, priority)
+        order.append(label)
+
+    await scheduler.acquire("holder")
+    tasks = [asyncio.ensure_future(worker(*request)) for request in requests]
+    await asyncio.sleep(0)
+    for _ in requests:
+        scheduler.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_lower_priority_value_runs_first():
+    scheduler = FairScheduler(capacity=1, aging_seconds=None)
+    order = await grant_order(
+        scheduler, [("low", "k", 5), ("high", "k", 0), ("mid", "k", 2)]
+    )
+    assert order == ["high", "mid", "low"]
+
+
+@pytest.mark.asyncio
+async def test_keys_share_slots_fairly():
+    scheduler = FairScheduler(capacity=1, aging_seconds=None)
+    requests = [(f"a{i}", "a", 0) for i in range(4)] + [(f"b{i}", "b", 0) for i in range(2)]
+    order = await grant_order(scheduler, requests)
+    # A key that queued many tasks first does not get them all before the other key
+    assert order.index("b0") < order.index("a2")
+    assert order.index("b1") < order.index("a3")
+
+
+@pytest.mark.asyncio
+async def test_weights_skew_the_share():
+    scheduler = FairScheduler(capacity=1, weights={"heavy": 3.0}, aging_seconds=None)
+    requests = [(f"h{i}", "heavy", 0) for i in range(6)] + [(f"l{i}", "light", 0) for i in range(2)]
+    order = await grant_order(scheduler, requests)
+    assert order[:4].count("l0") + order[:4].count("l1") == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place():
+    scheduler = FairScheduler(capacity=1)
+    await scheduler.acquire()
+    waiter = asyncio.ensure_future(scheduler.acquire())
+    await asyncio.sleep(0)
+    assert scheduler.waiting == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert scheduler.waiting == 0
+
+    scheduler.release()
+    # The slot is free again, not held by the cancelled waiter
+    await asyncio.wait_for(scheduler.acquire(), 1)
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_labelled_by_priority_not_key():
+    scheduler = FairScheduler(capacity=1, aging_seconds=None)
+    await grant_order(scheduler, [("a", "session-a", 0), ("b", "session-b", 3)])
+    rendered = metrics.render()
+    assert 'executor_schedule_wait_seconds_count{priority="3"}' in rendered
+    assert "session-a" not in rendered
+
+
+def test_scheduling_scopes_inherit_unset_values():
+    with scheduling(key="session", priority=2):
+        with scheduling(weight=0.5):
+            scope = current_scheduling()
+    assert (scope.key, scope.priority, scope.weight) == ("session", 2, 0.5)
+    assert current_scheduling().key is None
+
+
+def test_executor_is_configured_from_settings():
+    settings = Settings(
+        executor=ExecutorSettings(
+            max_concurrent_activities=3, scheduler_weights={"vip": 2.0}
+        )
+    )
+    context = Context(config=settings)
+    executor = _create_executor(settings, context)
+    assert isinstance(executor, AsyncioExecutor)
+    assert executor.context is context
+    assert executor.config.max_concurrent_activities == 3
+    assert executor._scheduler is not None
+    assert executor._scheduler.capacity == 3
+    executor.shutdown()
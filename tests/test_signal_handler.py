@@ -0,0 +1,101 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.workflow_signal import AsyncioSignalHandler, Signal  # noqa: E402
+
+
+def waiter(handler, name, workflow_id=None, timeout_seconds=None):
+    signal = Signal(name=name, workflow_id=workflow_id)
+    return asyncio.ensure_future(handler.wait_for_signal(signal, timeout_seconds=timeout_seconds))
+
+
+@pytest.mark.asyncio
+async def test_signal_wakes_waiters_of_its_name():
+    handler = AsyncioSignalHandler()
+    first, second, other = waiter(handler, "go"), waiter(handler, "go"), waiter(handler, "stop")
+    await asyncio.sleep(0)
+
+    await handler.signal(Signal(name="go", payload=1))
+    assert await asyncio.gather(first, second) == [1, 1]
+    assert not other.done()
+    assert list(handler._pending_signals) == ["stop"]
+    other.cancel()
+
+
+@pytest.mark.asyncio
+async def test_workflow_signal_wakes_only_its_workflow_and_unscoped_waiters():
+    handler = AsyncioSignalHandler()
+    mine, theirs, anyone = waiter(handler, "go", "a"), waiter(handler, "go", "b"), waiter(handler, "go")
+    await asyncio.sleep(0)
+
+    await handler.signal(Signal(name="go", payload="x", workflow_id="a"))
+    assert await asyncio.gather(mine, anyone) == ["x", "x"]
+    assert not theirs.done()
+
+    await handler.signal(Signal(name="go", payload="y"))
+    assert await theirs == "y"
+    assert handler._pending_signals == {}
+
+
+@pytest.mark.asyncio
+async def test_timed_out_and_cancelled_waiters_are_removed():
+    handler = AsyncioSignalHandler()
+    with pytest.raises(TimeoutError):
+        await handler.wait_for_signal(Signal(name="go"), timeout_seconds=0.01)
+    assert handler._pending_signals == {}
+
+    task = waiter(handler, "go", "a")
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert handler._pending_signals == {}
+
+
+@pytest.mark.asyncio
+async def test_handlers_run_and_their_errors_are_isolated():
+    handler = AsyncioSignalHandler()
+    received = []
+
+    @handler.on_signal("go")
+    def record(signal):
+        received.append(signal.payload)
+
+    @handler.on_signal("go")
+    async def fail(signal):
+        raise RuntimeError("boom")
+
+    await handler.signal(Signal(name="go", payload=3))
+    assert received == [3]
+
+
+class NoScanDict(dict):
+    """A dict that fails the test if anything iterates over it."""
+
+    def _scanned(self, *args):
+        raise AssertionError("waiter registry was scanned")
+
+    __iter__ = keys = values = items = _scanned
+
+
+@pytest.mark.asyncio
+async def test_removing_a_waiter_does_not_scan_the_others():
+    handler = AsyncioSignalHandler()
+    tasks = [waiter(handler, "go", "a") for _ in range(10000)]
+    await asyncio.sleep(0)
+    handler._pending_signals = NoScanDict(
+        go=NoScanDict(a=NoScanDict(handler._pending_signals["go"]["a"]))
+    )
+
+    # Removal is a constant number of dict lookups, whatever the number of waiters
+    tasks[5000].cancel()
+    await asyncio.gather(tasks[5000], return_exceptions=True)
+    assert len(handler._pending_signals["go"]["a"]) == 9999
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
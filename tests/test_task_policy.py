@@ -0,0 +1,132 @@
+import asyncio
+import os
+import sys
+from datetime import timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.executor import AsyncioExecutor, ExecutorConfig  # noqa: E402
+from metaagent.executor.task_policy import (  # noqa: E402
+    RetryPolicy,
+    TaskTimeoutError,
+    deadline,
+    remaining_time,
+)
+from metaagent.executor.workflow_task import workflow_task  # noqa: E402
+
+FAST_RETRIES = {"initial_interval": 0.01, "jitter": 0}
+
+
+def flaky(failures):
+    """A task that raises ConnectionError `failures` times, then succeeds."""
+    calls = []
+
+    @workflow_task(retry_policy={**FAST_RETRIES, "maximum_attempts": 5})
+    async def task():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise ConnectionError(f"failure {len(calls)}")
+        return len(calls)
+
+    return task, calls
+
+
+@pytest.fixture
+def executor():
+    executor = AsyncioExecutor()
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_retries_until_success(executor):
+    task, calls = flaky(2)
+    assert await executor.execute(task) == [3]
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_task_returns_its_own_exception(executor):
+    task, calls = flaky(10)
+    [result] = await executor.execute(task)
+    assert isinstance(result, ConnectionError)
+    assert str(result) == "failure 5"
+    assert result.task_attempts == 5 and len(calls) == 5
+    assert result.task_elapsed > 0
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_fail_at_once(executor):
+    calls = []
+
+    @workflow_task(retry_policy={**FAST_RETRIES, "maximum_attempts": 5, "non_retryable_error_types": ["ValueError"]})
+    async def task():
+        calls.append(1)
+        raise ValueError("bad input")
+
+    [result] = await executor.execute(task)
+    assert isinstance(result, ValueError) and len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_attempt_timeout_is_retried(executor):
+    calls = []
+
+    @workflow_task(start_to_close_timeout=timedelta(seconds=0.05), retry_policy={**FAST_RETRIES, "maximum_attempts": 2})
+    async def task():
+        calls.append(1)
+        await asyncio.sleep(10)
+
+    [result] = await executor.execute(task)
+    assert isinstance(result, TaskTimeoutError) and not result.deadline_exceeded
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unlimited_attempts_stop_at_the_deadline(executor):
+    calls = []
+
+    @workflow_task(
+        schedule_to_close_timeout=timedelta(seconds=0.2),
+        retry_policy={**FAST_RETRIES, "maximum_attempts": 0, "backoff_coefficient": 1},
+    )
+    async def task():
+        calls.append(1)
+        raise ConnectionError("down")
+
+    [result] = await asyncio.wait_for(executor.execute(task), 5)
+    assert isinstance(result, ConnectionError)
+    assert len(calls) > 3
+
+
+@pytest.mark.asyncio
+async def test_deadline_propagates_to_child_tasks(executor):
+    @workflow_task()
+    async def child():
+        return remaining_time()
+
+    with deadline(0.5):
+        [left] = await executor.execute(child)
+    assert 0 < left <= 0.5
+
+    with deadline(0):
+        [result] = await executor.execute(child)
+    assert isinstance(result, TaskTimeoutError) and result.deadline_exceeded
+
+
+@pytest.mark.asyncio
+async def test_executor_default_timeout():
+    executor = AsyncioExecutor(config=ExecutorConfig(timeout_seconds=timedelta(seconds=0.05)))
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    [result] = await executor.execute(slow)
+    assert isinstance(result, TaskTimeoutError)
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(initial_interval=1, backoff_coefficient=2, maximum_interval=5, jitter=0)
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    assert RetryPolicy.from_value({"max_attempts": 3}).maximum_attempts == 3
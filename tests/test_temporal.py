@@ -0,0 +1,126 @@
+import asyncio
+import dataclasses
+import os
+import sys
+import time
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("temporalio")
+
+from temporalio.common import RetryPolicy as TemporalRetryPolicy  # noqa: E402
+from temporalio.testing import ActivityEnvironment  # noqa: E402
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.config import Settings  # noqa: E402
+from metaagent.context import Context  # noqa: E402
+from metaagent.executor import temporal  # noqa: E402
+from metaagent.executor.task_registry import ActivityRegistry  # noqa: E402
+from metaagent.executor.temporal import (  # noqa: E402
+    TemporalExecutor,
+    TemporalExecutorConfig,
+    to_temporal_retry_policy,
+)
+from metaagent.executor.workflow_task import workflow_task  # noqa: E402
+
+
+@workflow_task(name="tests.first", batch=True)
+def first(x):
+    return x
+
+
+@workflow_task(name="tests.second", batch=True)
+def second(x):
+    return x
+
+
+@workflow_task(name="tests.other_timeout", batch=True, start_to_close_timeout=timedelta(seconds=5))
+def other_timeout(x):
+    return x
+
+
+@workflow_task(name="tests.alone")
+def alone(x):
+    return x
+
+
+@workflow_task(name="tests.slow", heartbeat_timeout=timedelta(seconds=0.3))
+async def slow():
+    await asyncio.sleep(1.0)
+    return "done"
+
+
+def make_executor(**config):
+    context = Context(config=Settings())
+    context.task_registry = ActivityRegistry()
+    executor = TemporalExecutor(
+        config=TemporalExecutorConfig(host="localhost:7233", task_queue="tests", **config),
+        client=object(),
+        context=context,
+    )
+    return executor, context
+
+
+def test_plan_batches_groups_compatible_batch_tasks():
+    executor, _ = make_executor(activity_batch_size=2)
+    tasks = [first, alone, second, first, other_timeout]
+    single, batches = executor._plan_batches(tasks)
+    # Chunks of activity_batch_size; a chunk of one, and a task alone with its options, run on their own
+    assert batches == [[0, 2]]
+    assert sorted(single) == [1, 3, 4]
+
+
+def test_to_temporal_retry_policy_keeps_temporal_defaults_for_unset_fields():
+    assert to_temporal_retry_policy(None) is None
+    policy = to_temporal_retry_policy(
+        {"maximum_attempts": 3, "initial_interval": 2, "non_retryable_error_types": [ValueError]}
+    )
+    assert policy.maximum_attempts == 3
+    assert policy.initial_interval == timedelta(seconds=2)
+    assert policy.non_retryable_error_types == ["ValueError"]
+    assert policy.backoff_coefficient == TemporalRetryPolicy().backoff_coefficient
+    assert policy.maximum_interval is None
+
+
+def test_remaining_retry_policy_counts_the_batched_attempt():
+    remaining = TemporalExecutor._remaining_retry_policy
+    assert remaining({"retry_policy": {"maximum_attempts": 1}}) is None
+    assert remaining({"retry_policy": {"maximum_attempts": 3}}).maximum_attempts == 2
+    # Unlimited stays unlimited
+    assert remaining({}).maximum_attempts == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_activities_heartbeat_past_their_timeout(monkeypatch):
+    workers = []
+
+    class FakeWorker:
+        def __init__(self, **kwargs):
+            self.activities = kwargs["activities"]
+            workers.append(self)
+
+        async def run(self):
+            pass
+
+    monkeypatch.setattr(temporal, "Worker", FakeWorker)
+    executor, context = make_executor()
+    context.task_registry.register("tests.slow", slow, slow.execution_metadata)
+    await executor.start_worker()
+
+    activity_defn = next(
+        a for a in workers[0].activities if a.__temporal_activity_definition.name == "tests.slow"
+    )
+    heartbeats = []
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(env.info, heartbeat_timeout=timedelta(seconds=0.3))
+    env.on_heartbeat = lambda *details: heartbeats.append(time.monotonic())
+
+    started = time.monotonic()
+    assert await env.run(activity_defn) == "done"
+    finished = time.monotonic()
+
+    # The task runs for over three heartbeat timeouts, never going a timeout without a heartbeat
+    times = [started, *heartbeats, finished]
+    assert len(heartbeats) >= 3
+    assert max(b - a for a, b in zip(times, times[1:])) < 0.3
@@ -0,0 +1,70 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.executor import AsyncioExecutor, ExecutorConfig  # noqa: E402
+from metaagent.executor.thread_pool import ThreadPool  # noqa: E402
+from metaagent.executor.workflow_task import workflow_task  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_bounds_concurrency():
+    pool = ThreadPool("test", max_workers=2)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return threading.current_thread().name
+
+    try:
+        names = await asyncio.gather(*(pool.run(work) for _ in range(6)))
+    finally:
+        pool.shutdown()
+    assert peak == 2
+    assert all(name.startswith("metaagent-test") for name in names)
+
+
+def test_thread_pool_needs_a_worker():
+    with pytest.raises(ValueError):
+        ThreadPool("empty", max_workers=0)
+
+
+@pytest.mark.asyncio
+async def test_executor_routes_tasks_to_named_pools():
+    executor = AsyncioExecutor(config=ExecutorConfig(thread_pools={"io": 1}))
+
+    @workflow_task(pool="io")
+    def in_io_pool():
+        return threading.current_thread().name
+
+    try:
+        [name] = await executor.execute(in_io_pool)
+    finally:
+        executor.shutdown()
+    assert name.startswith("metaagent-io")
+
+
+def test_executor_reserves_builtin_pool_names():
+    for name in ("process", "workers"):
+        with pytest.raises(ValueError, match="reserved"):
+            AsyncioExecutor(config=ExecutorConfig(thread_pools={name: 1}))
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_unknown_pools():
+    executor = AsyncioExecutor()
+    with pytest.raises(ValueError, match="Unknown executor pool"):
+        await executor.run_in_pool("missing", len, [])
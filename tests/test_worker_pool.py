@@ -0,0 +1,66 @@
+import asyncio
+import itertools
+import math
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from metaagent.executor.worker_pool import STREAM_WINDOW, WorkerCrashedError, WorkerPool  # noqa: E402
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(workers=1, crash_retries=0)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_tasks_in_another_process(pool):
+    results = await asyncio.gather(pool.run(math.factorial, 10), pool.run(os.getpid))
+    assert results[0] == 3628800
+    assert results[1] != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_is_replaced(pool):
+    with pytest.raises(WorkerCrashedError):
+        await asyncio.wait_for(pool.run(os._exit, 1), 30)
+    assert await asyncio.wait_for(pool.run(math.factorial, 5), 30) == 120
+
+
+def test_pool_can_be_reused_from_a_new_event_loop(pool):
+    first = asyncio.run(asyncio.wait_for(pool.run(os.getpid), 30))
+    # The first loop is closed now; the workers are restarted on the second one
+    second = asyncio.run(asyncio.wait_for(pool.run(os.getpid), 30))
+    assert first != second
+    assert os.getpid() not in (first, second)
+
+
+@pytest.mark.asyncio
+async def test_stream_stays_within_its_window_of_the_consumer(pool):
+    stream = pool.stream(itertools.count)
+    taken = [await asyncio.wait_for(stream.__anext__(), 30) for _ in range(3 * STREAM_WINDOW)]
+    assert taken == list(range(3 * STREAM_WINDOW))
+
+    # An endless generator would flood an unbounded queue while the consumer pauses
+    await asyncio.sleep(0.5)
+    (call,) = pool._workers[0].calls.values()
+    assert call.items.qsize() <= STREAM_WINDOW
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stopping_workers_does_not_block_the_event_loop(pool):
+    await asyncio.wait_for(pool.run(math.factorial, 5), 30)
+    # The worker cannot exit while a blocking call runs, so it is reaped after the timeout
+    stuck = asyncio.ensure_future(pool.run(time.sleep, 2))
+    await asyncio.sleep(0.2)
+    started = time.monotonic()
+    pool._stop_workers(timeout=1.0)
+    assert time.monotonic() - started < 0.2
+    with pytest.raises(WorkerCrashedError):
+        await stuck